@@ -0,0 +1,121 @@
+"""Central registry for the app's bundled assets.
+
+Paths are written with forward slashes and resolved in a platform-neutral
+way, lookups are memoized, and rendered icons and fonts are kept in a
+small bounded cache so button handlers never rebuild them from disk.
+"""
+from collections import OrderedDict
+from functools import lru_cache
+import os
+import sys
+
+from PyQt6.QtGui import QIcon, QFont, QFontDatabase
+
+ICONS = "dist/assets/icons"
+FONTS = "dist/assets/fonts"
+SOUNDS = "dist/assets/sounds"
+
+APP_FONT = f"{FONTS}/Inter_28pt-Regular.ttf"
+NOTIFICATION_SOUND = f"{SOUNDS}/notification_001.wav"
+
+# Every asset the app loads, checked once at startup
+REQUIRED_ASSETS = [
+    f"{ICONS}/app_icon_64px.svg",
+    f"{ICONS}/home_24dp.svg",
+    f"{ICONS}/settings_24dp.svg",
+    f"{ICONS}/info_24dp.svg",
+    f"{ICONS}/close_24dp_white.svg",
+    f"{ICONS}/minimize_button_24dp.svg",
+    f"{ICONS}/play_arrow_24dp_black.svg",
+    f"{ICONS}/bolt_24dp_black.svg",
+    f"{ICONS}/pause_24dp_black.svg",
+    f"{ICONS}/stop_24dp_black.svg",
+    f"{ICONS}/trayicon_16px_blue.svg",
+    f"{ICONS}/expand_24dp_white.svg",
+    f"{ICONS}/icon.png",
+    APP_FONT,
+    NOTIFICATION_SOUND,
+]
+
+# Maximum number of rendered icons/fonts kept alive
+CACHE_SIZE = 64
+
+_cache = OrderedDict()
+_missing_reported = False
+
+
+def _base_paths():
+    """Directories assets are looked up in, in order of preference"""
+    bases = []
+    # PyInstaller creates a temp folder and stores path in _MEIPASS
+    if hasattr(sys, '_MEIPASS'):
+        bases.append(sys._MEIPASS)
+    bases.append(os.path.abspath("."))
+    # Running from a source checkout: assets live next to Src/
+    bases.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return bases
+
+
+@lru_cache(maxsize=None)
+def resource_path(relative_path):
+    """Get absolute path to resource, works for dev and for PyInstaller.
+
+    Accepts either separator, so Windows-style paths resolve on Linux too.
+    """
+    parts = [part for part in relative_path.replace("\\", "/").split("/") if part]
+    for base in _base_paths():
+        full_path = os.path.join(base, *parts)
+        if os.path.exists(full_path):
+            return full_path
+    # Not found anywhere - keep the first candidate so callers get a sensible path
+    return os.path.join(_base_paths()[0], *parts)
+
+
+def report_missing():
+    """Print a warning for every missing asset, once per process"""
+    global _missing_reported
+    if _missing_reported:
+        return []
+    _missing_reported = True
+    missing = [path for path in REQUIRED_ASSETS if not os.path.exists(resource_path(path))]
+    for path in missing:
+        print(f"Warning: Resource file not found: {resource_path(path)}")
+    return missing
+
+
+def _cached(key, factory):
+    """Bounded LRU lookup shared by icons and fonts"""
+    try:
+        _cache.move_to_end(key)
+        return _cache[key]
+    except KeyError:
+        value = factory()
+        _cache[key] = value
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+        return value
+
+
+def icon(name):
+    """Cached QIcon for a file in the icons folder"""
+    return _cached(("icon", name), lambda: QIcon(resource_path(f"{ICONS}/{name}")))
+
+
+@lru_cache(maxsize=None)
+def app_font_family():
+    """Family name of the bundled Inter font (None if it could not be loaded)"""
+    font_id = QFontDatabase.addApplicationFont(resource_path(APP_FONT))
+    if font_id == -1:
+        return None
+    families = QFontDatabase.applicationFontFamilies(font_id)
+    return families[0] if families else None
+
+
+def font(point_size, bold=False):
+    """Cached QFont using the bundled font, falling back to Arial"""
+    def build():
+        family = app_font_family()
+        result = QFont(family or "Arial", point_size)
+        result.setBold(bold)
+        return result
+    return _cached(("font", point_size, bold), build)
@@ -0,0 +1,93 @@
+"""Shared, preloaded notification sounds.
+
+Each sound file is decoded once (at preload time or on first use) and the
+same QSoundEffect is handed to every widget that asks for it. Volume and
+mute are applied to every loaded sound at once.
+"""
+import os
+
+from PyQt6.QtCore import QObject, QUrl, QCoreApplication
+
+# Named cues
+FOCUS_END = "focus_end"
+BREAK_END = "break_end"
+SNOOZE_END = "snooze_end"
+REMINDER = "reminder"
+
+
+class AudioBank(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.cues = {}  # Cue name -> sound file path
+        self._effects = {}  # Sound file path -> QSoundEffect (None if it can't be loaded)
+        self.volume = 0.5
+        self.muted = False
+
+    def register(self, cue, path):
+        """Map a cue name to a sound file"""
+        self.cues[cue] = path
+
+    def handle(self, cue):
+        """Shared QSoundEffect for a cue, loading it on first use (None if unavailable)"""
+        path = self.cues.get(cue)
+        if path is None:
+            return None
+        if path not in self._effects:
+            self._effects[path] = self._load(path)
+        return self._effects[path]
+
+    def preload(self, *cues):
+        """Decode the given cues (or every registered cue) ahead of time"""
+        for cue in cues or list(self.cues):
+            self.handle(cue)
+
+    def play(self, cue):
+        """Play a cue unless sound is muted; returns True if it was played"""
+        if self.muted:
+            return False
+        effect = self.handle(cue)
+        if effect is None:
+            return False
+        effect.play()
+        return True
+
+    def set_volume(self, volume):
+        """Set the volume (0.0 - 1.0) of every cue"""
+        self.volume = max(0.0, min(1.0, volume))
+        for effect in self._effects.values():
+            if effect is not None:
+                effect.setVolume(self.volume)
+
+    def set_muted(self, muted):
+        """Mute or unmute every cue"""
+        self.muted = muted
+        for effect in self._effects.values():
+            if effect is not None:
+                effect.setMuted(muted)
+
+    def _load(self, path):
+        if not os.path.exists(path):
+            print(f"Warning: Notification sound file not found: {path}")
+            return None
+        try:
+            # QtMultimedia is slow to import - keep it off the startup path
+            from PyQt6.QtMultimedia import QSoundEffect
+            effect = QSoundEffect(self)
+            effect.setSource(QUrl.fromLocalFile(path))
+            effect.setLoopCount(1)
+            effect.setVolume(self.volume)
+            effect.setMuted(self.muted)
+            return effect
+        except Exception as e:
+            print(f"Error setting up notification sound: {e}")
+            return None
+
+
+_audio_bank = None
+
+def get_audio_bank():
+    """The application-wide audio bank"""
+    global _audio_bank
+    if _audio_bank is None:
+        _audio_bank = AudioBank(QCoreApplication.instance())
+    return _audio_bank
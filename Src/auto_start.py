@@ -1,271 +1,96 @@
-import os
+"""Start Break Loop at login, through a backend for the current platform.
+
+Backends are imported on first use, so importing this module is cheap and
+works everywhere:
+
+    win32          auto_start_windows.WindowsBackend (Run registry value / Startup shortcut)
+    linux, *bsd    auto_start_xdg.XdgBackend (~/.config/autostart/breakloop.desktop)
+    anything else  UnsupportedBackend (enable/disable report failure)
+
+The module-level functions keep their old names and delegate to get_backend().
+"""
+from abc import ABC, abstractmethod
 import sys
-import winreg
-import ctypes
-import subprocess
+from tracing import traced
 
-def resource_path(relative_path):
-    """ Get absolute path to resource, works for dev and for PyInstaller """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
 
-    return os.path.join(base_path, relative_path)
+class AutoStartBackend(ABC):
+    """One way of starting the app at login. Every method may block."""
+    name = "base"
 
-# Check if pywin32 is available
-PYWIN32_AVAILABLE = False
-try:
-    import pythoncom
-    from win32com.client import Dispatch
-    PYWIN32_AVAILABLE = True
-except ImportError:
-    # pythoncom module is not available
-    pass
+    def dependency_status(self):
+        return {"all_available": True, "missing": [], "install_command": None}
 
-def is_admin():
-    """Check if the current user has admin privileges"""
-    try:
-        return ctypes.windll.shell32.IsUserAnAdmin() != 0
-    except:
-        return False
+    @abstractmethod
+    def enable(self):
+        """Start the app at login; True on success"""
 
-def get_startup_folder_path():
-    """Get the path to the current user's startup folder"""
-    startup_folder = os.path.join(os.environ["APPDATA"], r"Microsoft\Windows\Start Menu\Programs\Startup")
-    return startup_folder
+    @abstractmethod
+    def disable(self):
+        """Stop starting the app at login; True on success"""
 
-def get_app_path():
-    """Get the path to the current executable"""
-    if getattr(sys, 'frozen', False):
-        # Running as executable (PyInstaller)
-        return sys.executable
-    else:
-        # Running as script
-        return sys.argv[0]
+    @abstractmethod
+    def is_enabled(self):
+        """Whether the app currently starts at login"""
 
-def create_shortcut(target_path, shortcut_path, working_dir=None, icon_path=None):
-    """Create a Windows shortcut (.lnk) file"""
-    if not PYWIN32_AVAILABLE:
-        # Use fallback method with PowerShell if pywin32 is not available
-        return create_shortcut_powershell(target_path, shortcut_path, working_dir, icon_path)
-    
-    try:
-        pythoncom.CoInitialize()
-        shell = Dispatch('WScript.Shell')
-        shortcut = shell.CreateShortCut(shortcut_path)
-        shortcut.Targetpath = target_path
-        
-        if working_dir:
-            shortcut.WorkingDirectory = working_dir
-        if icon_path:
-            shortcut.IconLocation = icon_path
-            
-        shortcut.save()
-        return True
-    except Exception as e:
-        print(f"Error creating shortcut: {e}")
-        # Fall back to PowerShell method
-        return create_shortcut_powershell(target_path, shortcut_path, working_dir, icon_path)
+    def invalidate(self):
+        """Drop any cached status"""
 
-def create_shortcut_powershell(target_path, shortcut_path, working_dir=None, icon_path=None):
-    """Create a shortcut using PowerShell (fallback method)"""
-    try:
-        # Base PowerShell command
-        ps_cmd = f'$WshShell = New-Object -comObject WScript.Shell; '
-        ps_cmd += f'$Shortcut = $WshShell.CreateShortcut("{shortcut_path}"); '
-        ps_cmd += f'$Shortcut.TargetPath = "{target_path}"; '
-        
-        if working_dir:
-            ps_cmd += f'$Shortcut.WorkingDirectory = "{working_dir}"; '
-        if icon_path:
-            ps_cmd += f'$Shortcut.IconLocation = "{icon_path}"; '
-            
-        ps_cmd += '$Shortcut.Save()'
-        
-        # Execute PowerShell command
-        subprocess.run(['powershell', '-Command', ps_cmd], 
-                      capture_output=True, 
-                      text=True, 
-                      check=True)
-        return True
-    except Exception as e:
-        print(f"Error creating shortcut with PowerShell: {e}")
-        return False
 
-def enable_autostart_registry():
-    """Enable auto-start using Windows registry (requires admin rights)"""
-    try:
-        app_path = get_app_path()
-        app_name = "BreakLoopTimer"
-        
-        if is_admin():
-            # Use HKEY_LOCAL_MACHINE for all users (requires admin)
-            reg_key = winreg.OpenKey(
-                winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run", 
-                0, 
-                winreg.KEY_WRITE
-            )
-        else:
-            # Use HKEY_CURRENT_USER for current user only
-            reg_key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run", 
-                0, 
-                winreg.KEY_WRITE
-            )
-            
-        winreg.SetValueEx(reg_key, app_name, 0, winreg.REG_SZ, f'"{app_path}"')
-        winreg.CloseKey(reg_key)
-        return True
-    except Exception as e:
-        print(f"Error setting registry key: {e}")
+class UnsupportedBackend(AutoStartBackend):
+    name = "unsupported"
+
+    def enable(self):
+        print(f"Warning: Auto-start is not supported on {sys.platform}")
         return False
 
-def disable_autostart_registry():
-    """Disable auto-start by removing registry entry"""
-    try:
-        app_name = "BreakLoopTimer"
-        
-        # Try HKEY_CURRENT_USER first
-        try:
-            reg_key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER, 
-                r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run", 
-                0, 
-                winreg.KEY_WRITE
-            )
-            winreg.DeleteValue(reg_key, app_name)
-            winreg.CloseKey(reg_key)
-            return True
-        except WindowsError:
-            # If not found in HKCU, try HKLM if we have admin rights
-            if is_admin():
-                reg_key = winreg.OpenKey(
-                    winreg.HKEY_LOCAL_MACHINE, 
-                    r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run", 
-                    0, 
-                    winreg.KEY_WRITE
-                )
-                winreg.DeleteValue(reg_key, app_name)
-                winreg.CloseKey(reg_key)
-                return True
-            return False
-    except Exception as e:
-        print(f"Error removing registry key: {e}")
+    def disable(self):
+        return True  # Nothing can be enabled, so nothing to remove
+
+    def is_enabled(self):
         return False
 
-def enable_autostart_folder():
-    """Enable auto-start by creating shortcut in startup folder"""
-    try:
-        app_path = get_app_path()
-        app_dir = os.path.dirname(os.path.abspath(app_path))
-        startup_folder = get_startup_folder_path()
-        shortcut_path = os.path.join(startup_folder, "BreakLoopTimer.lnk")
-        
-        # Try to find a suitable icon file
-        icon_path = None
-        
-        # First try to find .ico file (preferred for shortcuts)
-        ico_path = resource_path(os.path.join("Icons", "app_icon_64px.ico"))
-        if os.path.exists(ico_path):
-            icon_path = ico_path
+
+_backend = None
+
+def get_backend():
+    """The backend for this platform, created on first use"""
+    global _backend
+    if _backend is None:
+        if sys.platform == "win32":
+            from auto_start_windows import WindowsBackend
+            _backend = WindowsBackend()
+        elif sys.platform.startswith("linux") or "bsd" in sys.platform:
+            from auto_start_xdg import XdgBackend
+            _backend = XdgBackend()
         else:
-            # Try relative to app directory
-            ico_path_relative = os.path.join(app_dir, "Icons", "app_icon_64px.ico")
-            if os.path.exists(ico_path_relative):
-                icon_path = ico_path_relative
-            else:
-                # Fall back to using the executable itself
-                icon_path = app_path
-            
-        return create_shortcut(
-            target_path=app_path,
-            shortcut_path=shortcut_path,
-            working_dir=app_dir,
-            icon_path=icon_path
-        )
-    except Exception as e:
-        print(f"Error creating startup shortcut: {e}")
-        return False
+            _backend = UnsupportedBackend()
+    return _backend
 
-def disable_autostart_folder():
-    """Disable auto-start by removing shortcut from startup folder"""
-    try:
-        startup_folder = get_startup_folder_path()
-        shortcut_path = os.path.join(startup_folder, "BreakLoopTimer.lnk")
-        
-        if os.path.exists(shortcut_path):
-            os.remove(shortcut_path)
-        return True
-    except Exception as e:
-        print(f"Error removing startup shortcut: {e}")
-        return False
+def set_backend(backend):
+    """Replace the platform backend (None goes back to the default)"""
+    global _backend
+    _backend = backend
 
+@traced("auto_start.enable_autostart")
 def enable_autostart():
-    """Enable auto-start using available methods"""
-    # Try registry method first (more reliable)
-    if enable_autostart_registry():
-        return True
-    
-    # Fall back to startup folder method
-    return enable_autostart_folder()
+    """Enable auto-start"""
+    return get_backend().enable()
 
+@traced("auto_start.disable_autostart")
 def disable_autostart():
-    """Disable auto-start using all methods"""
-    # Disable both methods to ensure it's fully disabled
-    registry_success = disable_autostart_registry()
-    folder_success = disable_autostart_folder()
-    
-    # Return True if at least one method succeeded
-    return registry_success or folder_success
+    """Disable auto-start"""
+    return get_backend().disable()
 
+@traced("auto_start.is_autostart_enabled")
 def is_autostart_enabled():
-    """Check if auto-start is currently enabled"""
-    app_name = "BreakLoopTimer"
-    
-    # Check registry (HKEY_CURRENT_USER)
-    try:
-        reg_key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER, 
-            r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run", 
-            0, 
-            winreg.KEY_READ
-        )
-        winreg.QueryValueEx(reg_key, app_name)
-        winreg.CloseKey(reg_key)
-        return True
-    except WindowsError:
-        pass
-    
-    # Check registry (HKEY_LOCAL_MACHINE)
-    try:
-        reg_key = winreg.OpenKey(
-            winreg.HKEY_LOCAL_MACHINE, 
-            r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run", 
-            0, 
-            winreg.KEY_READ
-        )
-        winreg.QueryValueEx(reg_key, app_name)
-        winreg.CloseKey(reg_key)
-        return True
-    except WindowsError:
-        pass
-    
-    # Check startup folder
-    startup_folder = get_startup_folder_path()
-    shortcut_path = os.path.join(startup_folder, "BreakLoopTimer.lnk")
-    return os.path.exists(shortcut_path)
+    """Check if auto-start is currently enabled (answered from the backend's cache when it can)"""
+    return get_backend().is_enabled()
+
+def invalidate_status():
+    """Forget the cached auto-start status, e.g. after an outside change"""
+    get_backend().invalidate()
 
 def get_dependency_status():
     """Returns information about missing dependencies"""
-    missing = []
-    
-    if not PYWIN32_AVAILABLE:
-        missing.append("pywin32")
-    
-    return {
-        "all_available": len(missing) == 0,
-        "missing": missing,
-        "install_command": "pip install pywin32" if "pywin32" in missing else None
-    }
\ No newline at end of file
+    return get_backend().dependency_status()
\ No newline at end of file
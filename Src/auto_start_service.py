@@ -0,0 +1,178 @@
+"""Auto-start operations on a worker thread, with a cached status.
+
+Enabling, disabling and probing auto-start can mean registry access, COM
+shortcut creation or a PowerShell subprocess. AutoStartService runs them
+on its own single-thread pool, so they happen in the order requested and
+never on the GUI thread. Results come back through Qt signals, and the
+last known status is cached until invalidate() is called.
+
+The work itself is done by an auto_start backend, the platform's own by
+default. FakeBackend keeps the state in memory and is selected with
+BREAKLOOP_AUTOSTART_BACKEND=fake, which lets the whole flow run on a
+machine without a real auto-start mechanism.
+"""
+import os
+import threading
+import time
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from auto_start import AutoStartBackend, get_backend
+
+BACKEND_ENV_VAR = "BREAKLOOP_AUTOSTART_BACKEND"
+
+STATUS = "status"
+ENABLE = "enable"
+DISABLE = "disable"
+
+
+class FakeBackend(AutoStartBackend):
+    """In-memory auto-start for development and harnesses"""
+    name = "fake"
+
+    def __init__(self, enabled=False, delay=0.0, fail=False, missing=()):
+        self.enabled = enabled
+        self.delay = delay  # Seconds each call blocks, to stand in for a slow backend
+        self.fail = fail
+        self.missing = list(missing)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _call(self, name):
+        with self._lock:
+            self.calls.append(name)
+        if self.delay:
+            time.sleep(self.delay)
+
+    def dependency_status(self):
+        return {"all_available": not self.missing, "missing": list(self.missing),
+                "install_command": f"pip install {' '.join(self.missing)}" if self.missing else None}
+
+    def enable(self):
+        self._call(ENABLE)
+        if not self.fail:
+            self.enabled = True
+        return not self.fail
+
+    def disable(self):
+        self._call(DISABLE)
+        if not self.fail:
+            self.enabled = False
+        return not self.fail
+
+    def is_enabled(self):
+        self._call(STATUS)
+        return self.enabled
+
+
+def backend_from_env(environ=os.environ):
+    """Backend named by BREAKLOOP_AUTOSTART_BACKEND (the platform one by default)"""
+    if environ.get(BACKEND_ENV_VAR, "") == "fake":
+        return FakeBackend()
+    return get_backend()
+
+
+class AutoStartSignals(QObject):
+    finished = pyqtSignal(dict)
+    failed = pyqtSignal(str, str)  # Operation, error
+
+
+class AutoStartTask(QRunnable):
+    """One backend operation, followed by a status probe so the cache stays right"""
+
+    def __init__(self, backend, operation):
+        super().__init__()
+        self.backend = backend
+        self.operation = operation
+        self.signals = AutoStartSignals()
+
+    def run(self):
+        try:
+            result = {"operation": self.operation, "success": True, "enabled": None,
+                      "dependencies": self.backend.dependency_status()}
+            if result["dependencies"]["all_available"]:
+                if self.operation == ENABLE:
+                    result["success"] = bool(self.backend.enable())
+                elif self.operation == DISABLE:
+                    result["success"] = bool(self.backend.disable())
+                result["enabled"] = bool(self.backend.is_enabled())
+            else:
+                result["success"] = False
+            self.signals.finished.emit(result)
+        except Exception as e:
+            print(f"Error during auto-start {self.operation}: {e}")
+            self.signals.failed.emit(self.operation, str(e))
+
+
+class AutoStartService(QObject):
+    statusChanged = pyqtSignal(bool)  # Newly learned or changed auto-start state
+    applied = pyqtSignal(bool, bool)  # Requested state, success
+    dependenciesMissing = pyqtSignal(dict)  # dependency_status() of a refused enable/disable
+    failed = pyqtSignal(str, str)  # Operation, error
+
+    def __init__(self, backend=None, parent=None):
+        super().__init__(parent)
+        self.backend = backend or backend_from_env()
+        # One thread, so an enable followed by a disable runs in that order
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.status = None  # Cached is_enabled() result, None until known
+        self.dependencies = None  # Cached dependency_status()
+        self._tasks = []  # Keeps queued tasks (and their signals) alive
+        self._probing = False
+
+    def refresh(self):
+        """Probe the status in the background unless a probe is already queued"""
+        if not self._probing:
+            self._probing = True
+            self._submit(STATUS)
+
+    def invalidate(self):
+        """Forget the cached status and probe again"""
+        self.status = None
+        self.dependencies = None
+        self.backend.invalidate()
+        self.refresh()
+
+    def apply(self, enabled):
+        """Enable or disable auto-start in the background; applied() reports the outcome"""
+        self._submit(ENABLE if enabled else DISABLE)
+
+    def pending(self):
+        return len(self._tasks)
+
+    def wait(self, timeout_ms=-1):
+        """Block until queued operations are done (used when quitting); True if they finished"""
+        return self.pool.waitForDone(timeout_ms)
+
+    def _submit(self, operation):
+        task = AutoStartTask(self.backend, operation)
+        task.signals.finished.connect(lambda result, task=task: self._finished(task, result))
+        task.signals.failed.connect(lambda operation, error, task=task: self._failed(task, operation, error))
+        self._tasks.append(task)
+        self.pool.start(task)
+
+    def _done(self, task):
+        if task in self._tasks:
+            self._tasks.remove(task)
+        if task.operation == STATUS:
+            self._probing = False
+
+    def _finished(self, task, result):
+        self._done(task)
+        self.dependencies = result["dependencies"]
+        operation = result["operation"]
+        if operation != STATUS:
+            if not result["dependencies"]["all_available"]:
+                self.dependenciesMissing.emit(result["dependencies"])
+            else:
+                self.applied.emit(operation == ENABLE, result["success"])
+        enabled = result["enabled"]
+        if enabled is not None and enabled != self.status:
+            self.status = enabled
+            self.statusChanged.emit(enabled)
+
+    def _failed(self, task, operation, error):
+        self._done(task)
+        self.status = None  # Unknown after an error
+        self.failed.emit(operation, error)
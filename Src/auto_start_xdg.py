@@ -0,0 +1,122 @@
+"""Linux/BSD auto-start through an XDG autostart desktop entry.
+
+Desktop sessions that follow the XDG Autostart spec (GNOME, KDE, Xfce, ...)
+launch every ~/.config/autostart/*.desktop entry at login. Enabling writes
+breakloop.desktop atomically and disabling removes it. is_enabled() costs
+one stat(); the file is only re-read when its stat changes.
+"""
+import os
+import sys
+
+from auto_start import AutoStartBackend
+from settings_store import write_atomic
+
+DESKTOP_FILE = "breakloop.desktop"
+
+# Characters that force an Exec argument to be quoted, per the Desktop Entry spec
+_RESERVED = set(' \t\n"\'\\><~|&;$*?#()`')
+
+
+def autostart_dir(environ=os.environ):
+    config_home = environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+    return os.path.join(config_home, "autostart")
+
+
+def quote_exec_arg(arg):
+    """Quote one Exec= argument for a .desktop file"""
+    arg = arg.replace("%", "%%")
+    if not any(c in _RESERVED for c in arg):
+        return arg
+    for c in ('\\', '"', '`', '$'):
+        arg = arg.replace(c, '\\' + c)
+    # A backslash is itself escaped again by the string-value rules of the key file
+    return '"' + arg.replace('\\', '\\\\') + '"'
+
+
+def launch_command():
+    """The command that starts this copy of Break Loop"""
+    if getattr(sys, 'frozen', False):
+        # Running as executable (PyInstaller)
+        return [sys.executable]
+    return [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")]
+
+
+def desktop_entry():
+    """Contents of the autostart .desktop file"""
+    from assets import resource_path
+    command = launch_command()
+    return "\n".join([
+        "[Desktop Entry]",
+        "Type=Application",
+        "Name=Break Loop",
+        "Comment=Focus and break timer",
+        "Exec=" + " ".join(quote_exec_arg(arg) for arg in command),
+        "Path=" + os.path.dirname(os.path.abspath(command[-1])),
+        "Icon=" + resource_path("dist/assets/icons/app_icon_64px.svg"),
+        "Terminal=false",
+        "X-GNOME-Autostart-enabled=true",
+        "",
+    ])
+
+
+def parse_enabled(text):
+    """Whether a desktop entry is active (not Hidden and not switched off by GNOME)"""
+    in_entry = False
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith("["):
+            in_entry = line == "[Desktop Entry]"
+        elif in_entry and "=" in line:
+            key, value = (part.strip() for part in line.split("=", 1))
+            if key == "Hidden" and value.lower() == "true":
+                return False
+            if key == "X-GNOME-Autostart-enabled" and value.lower() == "false":
+                return False
+    return True
+
+
+class XdgBackend(AutoStartBackend):
+    name = "xdg"
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(autostart_dir(), DESKTOP_FILE)
+        self._stat_key = None  # (mtime, size, inode) the cached answer belongs to
+        self._enabled = None
+
+    def enable(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_atomic(self.path, desktop_entry(), prefix=".breakloop-")
+            return True
+        except Exception as e:
+            print(f"Error writing autostart entry {self.path}: {e}")
+            return False
+
+    def disable(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error removing autostart entry {self.path}: {e}")
+            return False
+        return True
+
+    def is_enabled(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return False
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if key != self._stat_key:
+            try:
+                with open(self.path, encoding="utf-8", errors="replace") as f:
+                    self._enabled = parse_enabled(f.read())
+            except OSError as e:
+                print(f"Error reading autostart entry {self.path}: {e}")
+                return False
+            self._stat_key = key
+        return self._enabled
+
+    def invalidate(self):
+        self._stat_key = None
@@ -1,50 +1,53 @@
 from PyQt6.QtWidgets import QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QLayout
-from PyQt6.QtCore import Qt, QUrl, QPropertyAnimation, QEasingCurve, pyqtSignal
+from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal
 from PyQt6.QtGui import QPainter, QColor
-from PyQt6.QtMultimedia import QSoundEffect
 from stylesheets import Styles  # Import the Styles class
+from tracing import traced
 import random
-import os
-import sys
 
-def resource_path(relative_path):
-    """ Get absolute path to resource, works for dev and for PyInstaller """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-
-    return os.path.join(base_path, relative_path)
+# List of motivational quotes
+MOTIVATIONAL_QUOTES = [
+    "Your brain recharges during breaks. Step away to stay sharp. 🧠 Boosts mental clarity",
+    "Even 1 minute of rest improves your focus and reduces stress. 🌿 Micro-break magic",
+    "Breaks help your brain organize and retain what you just learned. 📚 Supports memory",
+    "Move a little. Stretch. It increases blood flow and boosts creativity. 🏃 Better blood, better ideas",
+    "Short breaks = more productive work sessions. Science says so! 📈 Pomodoro power",
+    "Blink. Breathe. Look away. Your eyes need this moment too. 👀 Eye strain relief",
+    "Stepping away now means coming back stronger. 💪 Resilience booster",
+    "Your best ideas come when you're not forcing them. Relax. 🧘‍♂️ Creativity flows in calm",
+    "Breaks are not a waste of time. They're an investment in your productivity. ⏳ Time well spent",
+    "The most focused minds take the most frequent breaks. 🧘‍♀️ Focused and refreshed",
+    "You're not wasting time. You're investing in your energy. 🔋 Recharge mindset",
+]
 
 
 class BreakOverlay(QWidget):
+    """Fullscreen break overlay.
+
+    The overlay is built once and kept hidden; arm() refreshes its text and
+    snooze button, present() shows it with a fade-in and fade_out() hides it
+    again so it can be reused for the next break.
+    """
     snoozeRequested = pyqtSignal(int)  # Signal to request snooze with minutes
+    firstFrame = pyqtSignal()  # Emitted on the first paint after present()
     
+    @traced("BreakOverlay.__init__")
     def __init__(self, parent=None, soundtrack=None, snooze_settings=None):
         super().__init__(parent)
         
-        # Initialize snooze settings and counter FIRST
-        self.snooze_settings = snooze_settings or {
-            'snooze_enabled': True,
-            'snooze_time': 5,
-            'max_snooze_count': 3,
-            'current_snooze_count': 0
-        }
-        self.snooze_count = self.snooze_settings.get('current_snooze_count', 0)
-        
         # Make sure we don't close the parent when this widget closes
         self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, False)
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint | Qt.WindowType.Tool)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        self.showFullScreen()
-        self.setWindowOpacity(0.0)  # start transparent for fade-in
         self.fade_duration = 500
-        self.fade_in()
+        self.awaiting_first_frame = False
+
+        # One reusable animation for both fade directions
+        self.fade_animation = QPropertyAnimation(self, b'windowOpacity')
+        self.fade_animation.setDuration(self.fade_duration)
+        self.fade_animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        self.fade_animation.finished.connect(self._on_fade_finished)
         
-        # Initialize notification sound
-        self.notification = QSoundEffect()
-        self.notification.setSource(QUrl.fromLocalFile(resource_path(r"dist\\assets\\sounds\\notification_001.wav")))
 
         # Main layout
         layout = QVBoxLayout()
@@ -60,24 +63,8 @@ class BreakOverlay(QWidget):
         frame_layout.setContentsMargins(40, 40, 40, 40)
         frame_layout.setSizeConstraint(QLayout.SizeConstraint.SetFixedSize)
         
-        # List of motivational quotes
-        self.motivational_quotes = [
-            "Your brain recharges during breaks. Step away to stay sharp. 🧠 Boosts mental clarity",
-            "Even 1 minute of rest improves your focus and reduces stress. 🌿 Micro-break magic",
-            "Breaks help your brain organize and retain what you just learned. 📚 Supports memory",
-            "Move a little. Stretch. It increases blood flow and boosts creativity. 🏃 Better blood, better ideas",
-            "Short breaks = more productive work sessions. Science says so! 📈 Pomodoro power",
-            "Blink. Breathe. Look away. Your eyes need this moment too. 👀 Eye strain relief",
-            "Stepping away now means coming back stronger. 💪 Resilience booster",
-            "Your best ideas come when you're not forcing them. Relax. 🧘‍♂️ Creativity flows in calm",
-            "Breaks are not a waste of time. They're an investment in your productivity. ⏳ Time well spent",
-            "The most focused minds take the most frequent breaks. 🧘‍♀️ Focused and refreshed",
-            "You're not wasting time. You're investing in your energy. 🔋 Recharge mindset",
-        ]
-        
-        # Motivational text with random quote
-        random_quote = random.choice(self.motivational_quotes)
-        self.motivation_label = QLabel(random_quote)
+        # Motivational text, a random quote is picked in arm()
+        self.motivation_label = QLabel()
         self.motivation_label.setStyleSheet("""
             QLabel {
                 color: #ffffff;
@@ -101,14 +88,12 @@ class BreakOverlay(QWidget):
         button_layout.setSpacing(20)
         button_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        # Snooze button (only show if snooze is enabled and count hasn't exceeded limit)
-        if (self.snooze_settings['snooze_enabled'] and 
-            self.snooze_count < self.snooze_settings['max_snooze_count']):
-            self.snooze_button = QPushButton(f"Snooze for {self.snooze_settings['snooze_time']} min")
-            self.snooze_button.setFixedSize(200, 60)
-            self.snooze_button.setStyleSheet(Styles.SNOOZE_OVERLAY_BUTTON)
-            self.snooze_button.clicked.connect(self.handle_snooze)
-            button_layout.addWidget(self.snooze_button)
+        # Snooze button (shown by arm() only if snooze is enabled and count hasn't exceeded limit)
+        self.snooze_button = QPushButton()
+        self.snooze_button.setFixedSize(200, 60)
+        self.snooze_button.setStyleSheet(Styles.SNOOZE_OVERLAY_BUTTON)
+        self.snooze_button.clicked.connect(self.handle_snooze)
+        button_layout.addWidget(self.snooze_button)
         
         # End button
         self.end_button = QPushButton("End Break")
@@ -119,8 +104,46 @@ class BreakOverlay(QWidget):
         frame_layout.addLayout(button_layout)
         layout.addWidget(frame)
         self.setLayout(layout)
+
+        self.arm(snooze_settings)
+
+    def arm(self, snooze_settings=None):
+        """Refresh the quote and snooze button for the next break"""
+        self.snooze_settings = snooze_settings or {
+            'snooze_enabled': True,
+            'snooze_time': 5,
+            'max_snooze_count': 3,
+            'current_snooze_count': 0
+        }
+        self.snooze_count = self.snooze_settings.get('current_snooze_count', 0)
+
+        self.motivation_label.setText(random.choice(MOTIVATIONAL_QUOTES))
+        self.snooze_button.setText(f"Snooze for {self.snooze_settings['snooze_time']} min")
+        self.snooze_button.setVisible(self.snooze_settings['snooze_enabled'] and
+                                      self.snooze_count < self.snooze_settings['max_snooze_count'])
+
+    @traced("BreakOverlay.prepare")
+    def prepare(self, screen=None):
+        """Do the expensive work (polish, layout, native window) ahead of time"""
+        if screen is not None:
+            self.setScreen(screen)
+            self.setGeometry(screen.geometry())
+        self.ensurePolished()
+        self.layout().activate()
+        self.winId()  # Creates the native window while still hidden
+
+    @traced("BreakOverlay.present")
+    def present(self):
+        """Show the prepared overlay fullscreen and start the fade-in"""
+        self.awaiting_first_frame = True
+        self.setWindowOpacity(0.0)  # start transparent for fade-in
+        self.showFullScreen()
+        self.fade_in()
     
     def paintEvent(self, event):
+        if self.awaiting_first_frame:
+            self.awaiting_first_frame = False
+            self.firstFrame.emit()
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setBrush(QColor(255, 255, 255, 200))  # Semi-transparent white
@@ -130,24 +153,26 @@ class BreakOverlay(QWidget):
     def updateTimer(self, time_text):
         self.timer_label.setText(time_text)
     
+    @traced("BreakOverlay.fade_in")
     def fade_in(self):
-        anim = QPropertyAnimation(self, b'windowOpacity')
-        anim.setDuration(self.fade_duration)
-        anim.setStartValue(0.0)
-        anim.setEndValue(1.0)
-        anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
-        anim.start()
-        self.fade_in_animation = anim
+        self.fade_animation.stop()
+        self.fade_animation.setStartValue(0.0)
+        self.fade_animation.setEndValue(1.0)
+        self.fade_animation.start()
 
+    @traced("BreakOverlay.fade_out")
     def fade_out(self):
-        anim = QPropertyAnimation(self, b'windowOpacity')
-        anim.setDuration(self.fade_duration)
-        anim.setStartValue(1.0)
-        anim.setEndValue(0.0)
-        anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
-        anim.finished.connect(self.close)
-        anim.start()
-        self.fade_out_animation = anim
+        if not self.isVisible():
+            return
+        self.fade_animation.stop()
+        self.fade_animation.setStartValue(self.windowOpacity())
+        self.fade_animation.setEndValue(0.0)
+        self.fade_animation.start()
+
+    def _on_fade_finished(self):
+        # Hide rather than destroy so the overlay can be reused
+        if self.fade_animation.endValue() == 0.0:
+            self.hide()
 
     def handle_snooze(self):
         """Handle snooze button click"""
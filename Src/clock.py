@@ -0,0 +1,128 @@
+"""Clocks and schedulers for the timer paths.
+
+Everything in TimerApp that depends on time goes through one clock object:
+now() for deadlines, boot_now() for suspend detection, timer(callback) for
+the re-armable session timer and call_later(ms, callback) for one-off
+delays. SystemClock is backed by time.monotonic and QTimer. VirtualClock
+only moves when advance() is called, so days of sessions can be simulated
+in milliseconds.
+"""
+import heapq
+import itertools
+import time
+
+from PyQt6.QtCore import Qt, QTimer
+
+from session_engine import default_boot_clock
+
+
+class SystemClock:
+    """Real time: monotonic deadlines and Qt timers"""
+
+    def __init__(self, parent=None):
+        self.parent = parent
+        self.now = time.monotonic
+        self.boot_now = default_boot_clock()  # None where monotonic includes suspend
+
+    def timer(self, callback):
+        """Single-shot, re-armable timer with start(ms)/stop()/interval()/isActive()"""
+        timer = QTimer(self.parent)
+        timer.setSingleShot(True)
+        timer.setTimerType(Qt.TimerType.PreciseTimer)
+        timer.timeout.connect(callback)
+        return timer
+
+    def call_later(self, delay_ms, callback):
+        QTimer.singleShot(delay_ms, callback)
+
+
+class VirtualTimer:
+    """VirtualClock counterpart of a single-shot QTimer"""
+
+    def __init__(self, clock, callback):
+        self.clock = clock
+        self.callback = callback
+        self._interval = 0
+        self._entry = None
+
+    def start(self, delay_ms):
+        self.stop()
+        self._interval = delay_ms
+        self._entry = self.clock._schedule(delay_ms, self._fire)
+
+    def stop(self):
+        if self._entry is not None:
+            self._entry[-1] = None  # Cancelled entries are skipped when they come due
+            self._entry = None
+
+    def isActive(self):
+        return self._entry is not None
+
+    def interval(self):
+        return self._interval
+
+    def _fire(self):
+        self._entry = None
+        self.callback()
+
+
+class VirtualClock:
+    """Manually advanced time for simulations.
+
+    boot_now() runs ahead of now() by the total time spent in suspend().
+    """
+
+    def __init__(self, start=0.0):
+        self.current = start
+        self.suspended = 0.0
+        self.fired = 0  # Callbacks run so far
+        self._queue = []  # [due, sequence, callback] heap; callback None when cancelled
+        self._sequence = itertools.count()
+
+    def now(self):
+        return self.current
+
+    def boot_now(self):
+        return self.current + self.suspended
+
+    def timer(self, callback):
+        return VirtualTimer(self, callback)
+
+    def call_later(self, delay_ms, callback):
+        self._schedule(delay_ms, callback)
+
+    def _schedule(self, delay_ms, callback):
+        entry = [self.current + max(0, delay_ms) / 1000, next(self._sequence), callback]
+        heapq.heappush(self._queue, entry)
+        return entry
+
+    def next_due(self):
+        """Time of the next pending callback, or None"""
+        while self._queue and self._queue[0][-1] is None:
+            heapq.heappop(self._queue)
+        return self._queue[0][0] if self._queue else None
+
+    def step(self):
+        """Jump to the next pending callback and run it; False if nothing is pending"""
+        due = self.next_due()
+        if due is None:
+            return False
+        entry = heapq.heappop(self._queue)
+        self.current = max(self.current, due)
+        self.fired += 1
+        entry[-1]()
+        return True
+
+    def advance(self, seconds):
+        """Move time forward, running every callback that comes due on the way"""
+        target = self.current + seconds
+        while True:
+            due = self.next_due()
+            if due is None or due > target:
+                break
+            self.step()
+        self.current = target
+
+    def suspend(self, seconds):
+        """Simulate the machine sleeping: only the boot-time clock moves"""
+        self.suspended += seconds
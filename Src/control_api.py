@@ -0,0 +1,171 @@
+"""Scripting Break Loop over its local socket.
+
+ControlApi registers the session commands on the single-instance server, so
+editor plugins, shell prompts and scripts can drive the timer with one JSON
+object per line:
+
+    {"command": "status"}                 -> {"ok": true, "state": "focus", "remaining": 812.4, ...}
+    {"command": "start-focus"}            {"command": "take-break"}
+    {"command": "pause"}                  {"command": "resume"}
+    {"command": "stop"}                   {"command": "end-break"}
+    {"command": "snooze", "minutes": 5}   (minutes defaults to the snooze setting; or "seconds")
+    {"command": "show"}
+    {"command": "subscribe"}              -> then {"event": "transition", ...} lines
+
+start-focus, take-break and end-break also accept "focus_seconds" and
+"break_seconds" to set the session lengths (at least 40 seconds,
+like the input fields).
+
+The socket is served from the Qt event loop without blocking, so any number
+of clients can stay connected. status is answered from a snapshot kept
+current by engine transitions; only the remaining time is worked out per
+request.
+
+From a shell:
+
+    python Src/control_api.py status
+    python Src/control_api.py snooze 5
+    python Src/control_api.py subscribe      # prints transitions until interrupted
+"""
+import json
+import sys
+import time
+
+from session_engine import TransitionError, IDLE, BREAK
+from single_instance import connect, send_request, SUBSCRIBE
+
+
+class ControlApi:
+    """Serves a TimerApp, or a daemon that offers the same engine, settings,
+    min_session_seconds, sync_session_durations() and bring_to_front()"""
+
+    def __init__(self, server, window):
+        self.server = server
+        self.window = window
+        self.engine = window.engine
+        self.snapshot = {}
+        self.update_snapshot()
+        self.engine.subscribe("transition", self.on_transition)
+
+        for command, handler in (
+                ("status", self.status),
+                ("show", lambda request: window.bring_to_front()),
+                ("start-focus", self.start_focus),
+                ("take-break", self.take_break),
+                ("pause", lambda request: self.engine.pause()),
+                ("resume", lambda request: self.engine.resume()),
+                ("stop", self.stop),
+                ("end-break", self.end_break),
+                ("snooze", self.snooze)):
+            server.handle(command, handler)
+
+    def update_snapshot(self):
+        """Rebuild the cached status; only needed when the engine changes state"""
+        engine = self.engine
+        self.snapshot = {
+            "state": engine.state,
+            "paused": engine.paused,
+            "duration": engine.duration,
+            "snooze_count": engine.snooze_count,
+        }
+
+    def on_transition(self, engine, old_state, new_state, trigger):
+        self.update_snapshot()
+        self.server.broadcast({"event": "transition", "from": old_state, "to": new_state,
+                               "trigger": trigger, "status": self.status()})
+
+    def status(self, request=None):
+        status = dict(self.snapshot)
+        status["max_snooze_count"] = self.window.settings.get('max_snooze_count', 3)
+        remaining = self.engine.remaining()
+        status["remaining"] = round(remaining, 3)
+        # Wall-clock end, for clients that count down on their own
+        status["ends_at"] = None if self.engine.state == IDLE or self.engine.paused else round(time.time() + remaining, 3)
+        return status
+
+    # ---------- Commands ----------
+    # Invalid requests raise; the server turns the exception into an error reply
+
+    def sync_durations(self, request):
+        """Session lengths from the window, overridden by the request's own"""
+        minimum = self.window.min_session_seconds
+        durations = {}
+        for key in ("focus_seconds", "break_seconds"):
+            if key in request:
+                durations[key] = int(request[key])
+                if durations[key] < minimum:
+                    raise ValueError(f"{key} must be at least {minimum}")
+        self.window.sync_session_durations()
+        if "focus_seconds" in durations:
+            self.engine.focus_duration = durations["focus_seconds"]
+        if "break_seconds" in durations:
+            self.engine.break_duration = durations["break_seconds"]
+
+    def start_focus(self, request):
+        self.sync_durations(request)
+        if self.engine.focus_duration <= 0:
+            raise ValueError("focus time is not set")
+        self.engine.start_focus()
+
+    def take_break(self, request):
+        self.sync_durations(request)
+        if self.engine.break_duration <= 0:
+            raise ValueError("break time is not set")
+        self.engine.take_break()
+
+    def stop(self, request):
+        if self.engine.state == IDLE:
+            raise TransitionError("No session is running")
+        self.engine.stop()
+
+    def end_break(self, request):
+        self.sync_durations(request)
+        self.engine.end_break()
+
+    def snooze(self, request):
+        settings = self.window.settings
+        if self.engine.state != BREAK:
+            raise TransitionError(f"Cannot snooze while {self.engine.state}")
+        if not settings.get('snooze_enabled', True):
+            raise ValueError("snooze is turned off in the settings")
+        if self.engine.snooze_count >= settings.get('max_snooze_count', 3):
+            raise ValueError("no snoozes left for this break")
+        seconds = int(request.get("seconds", int(request.get("minutes", settings.get('snooze_time', 5))) * 60))
+        if seconds <= 0:
+            raise ValueError("snooze length must be positive")
+        self.engine.snooze(seconds)
+
+
+def main(argv):
+    if len(argv) < 2:
+        print(__doc__.split("From a shell:")[1].strip())
+        return 2
+    request = {"command": argv[1]}
+    if argv[1] == "snooze" and len(argv) > 2:
+        request["minutes"] = int(argv[2])
+
+    if argv[1] != SUBSCRIBE:
+        reply = send_request(request)
+        if reply is None:
+            print("Break Loop is not running")
+            return 1
+        print(json.dumps(reply))
+        return 0 if reply.get("ok") else 1
+
+    try:
+        # Same transport as send_request (a named pipe on Windows), without a read timeout
+        with connect(timeout=None) as stream:
+            stream.write(b'{"command": "subscribe"}\n')
+            stream.flush()
+            for line in stream:
+                print(line.decode("utf-8").rstrip(), flush=True)
+    except OSError:
+        print("Break Loop is not running")
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
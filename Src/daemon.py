@@ -0,0 +1,210 @@
+"""Headless Break Loop: `main.py --daemon`.
+
+The daemon runs the session lifecycle, the reminders, the history log,
+desktop notifications, the control socket and the status file under a
+QCoreApplication. Widgets are never created, and QtWidgets and QtGui are
+never even imported, so an idle timer costs little more than the
+interpreter.
+
+The window is a separate `main.py --attach` process that drives the
+daemon's session through a RemoteEngine. The daemon starts that process
+when it is wanted:
+- for "show", e.g. a plain `main.py` launch, or the control command;
+- when a break starts, to put up the break overlay. That process leaves again
+  once the break is over.
+Closing the window detaches it; the session carries on in the daemon.
+"""
+import os
+import signal
+import socket
+import sys
+
+from PyQt6.QtCore import QCoreApplication, QProcess, QSocketNotifier
+
+from clock import SystemClock
+from session_engine import SessionEngine, IDLE, BREAK, EXPIRE, MIN_SESSION_SECONDS
+from settings_store import SettingsStore
+from session_history import SessionHistory, HistoryRecorder
+from single_instance import InstanceServer
+from control_api import ControlApi
+from status_file import StatusPublisher
+from reminders import ReminderScheduler, apply_settings as apply_reminder_settings, format_reminders
+
+# Longest sleep between engine checks; bounds how late a suspend is noticed
+MAX_SLEEP_SECONDS = 300
+
+# Delay before the next focus session starts after a break (as in the window)
+AUTO_START_DELAY_MS = 3000
+
+NOTIFY_SERVICE = "org.freedesktop.Notifications"
+NOTIFY_PATH = "/org/freedesktop/Notifications"
+
+
+def gui_command(*flags):
+    """Program and arguments that start an attached window"""
+    if getattr(sys, 'frozen', False):
+        return sys.executable, ["--attach", *flags]
+    main_py = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+    return sys.executable, [main_py, "--attach", *flags]
+
+
+class Notifier:
+    """Desktop notifications over D-Bus where there is a session bus, else printed"""
+
+    def __init__(self):
+        self.interface = None
+        try:
+            from PyQt6.QtDBus import QDBusConnection, QDBusInterface
+            bus = QDBusConnection.sessionBus()
+            if bus.isConnected():
+                self.interface = QDBusInterface(NOTIFY_SERVICE, NOTIFY_PATH, NOTIFY_SERVICE, bus)
+        except ImportError:
+            pass
+
+    def notify(self, message):
+        print(f"Break Loop: {message}")
+        if self.interface is not None and self.interface.isValid():
+            from PyQt6.QtCore import QVariant, QMetaType
+            # Notify(app, replaces_id, icon, summary, body, actions, hints, timeout)
+            replaces_id = QVariant(0)
+            replaces_id.convert(QMetaType(QMetaType.Type.UInt.value))
+            self.interface.asyncCall("Notify", "Break Loop", replaces_id, "", "Break Loop",
+                                     message, [], {}, 5000)
+
+
+class BreakLoopDaemon:
+    def __init__(self, app, server):
+        self.app = app
+        self.server = server
+        self.clock = SystemClock()
+        self.store = SettingsStore(schedule=self.clock.call_later)
+        try:
+            self.settings = self.store.load()
+        except Exception as e:
+            print(f"Error loading settings: {e}")
+            self.settings = self.store.all()
+
+        self.engine = SessionEngine(clock=self.clock.now, boot_clock=self.clock.boot_now)
+        self.timer = self.clock.timer(self.check)
+        self.reminders = ReminderScheduler(clock=self.clock.now)
+        self.reminders.subscribe("due", self.on_reminders_due)
+        apply_reminder_settings(self.reminders, self.settings)
+        self.history = None
+        try:
+            self.history = SessionHistory()
+            self.history_recorder = HistoryRecorder(self.history, self.engine)
+        except Exception as e:
+            print(f"Warning: Session history is disabled: {e}")
+        self.notifier = Notifier()
+        self.gui = None  # QProcess of the attached window, if this daemon started one
+        self.min_session_seconds = MIN_SESSION_SECONDS
+
+        self.engine.subscribe("transition", self.on_transition)
+        self.control = ControlApi(server, self)
+        server.handle("reload-settings", self.reload_settings)
+        self.status = StatusPublisher(self.engine, schedule=self.clock.call_later)
+        app.aboutToQuit.connect(self.shutdown)
+        self.schedule()
+
+    # ---------- What ControlApi needs from its host ----------
+
+    def sync_session_durations(self):
+        """Lengths come with each request; the last ones used are kept"""
+
+    def bring_to_front(self):
+        if self.gui_attached():
+            self.server.broadcast({"event": "show"})
+        else:
+            self.start_gui()
+
+    def reload_settings(self, request):
+        self.settings = self.store.load()
+        apply_reminder_settings(self.reminders, self.settings)
+        self.schedule()
+
+    # ---------- Session ----------
+
+    def check(self):
+        """Let the engine check its deadline (and for a suspend), deliver due reminders,
+        then sleep until the next event"""
+        self.engine.poll()
+        self.reminders.poll()
+        self.schedule()
+
+    def schedule(self):
+        self.timer.stop()
+        wait_ms = self.reminders.ms_until_due()
+        if self.engine.is_running():
+            session_ms = int(min(self.engine.remaining(), MAX_SLEEP_SECONDS) * 1000) + 1
+            wait_ms = session_ms if wait_ms is None else min(wait_ms, session_ms)
+        if wait_ms is not None:
+            self.timer.start(wait_ms)
+
+    def on_transition(self, engine, old_state, new_state, trigger):
+        if new_state == BREAK and old_state != BREAK:
+            self.notifier.notify("Time for a break")
+            if not self.gui_attached():
+                # Only the overlay is shown; the process leaves after the break
+                self.start_gui("--background")
+        elif new_state == IDLE and old_state == BREAK and trigger == EXPIRE:
+            self.notifier.notify("Break is over, let's get back to focus session.")
+            self.clock.call_later(AUTO_START_DELAY_MS, self.auto_start_focus)
+        self.schedule()
+
+    def on_reminders_due(self, scheduler, reminders):
+        if self.engine.state != BREAK:
+            self.notifier.notify(format_reminders(reminders))
+
+    def auto_start_focus(self):
+        if self.engine.state == IDLE and self.engine.focus_duration > 0:
+            self.engine.start_focus()
+
+    # ---------- Attached window ----------
+
+    def gui_attached(self):
+        return self.gui is not None and self.gui.state() != QProcess.ProcessState.NotRunning
+
+    def start_gui(self, *flags):
+        program, arguments = gui_command(*flags)
+        self.gui = QProcess()
+        self.gui.setProcessChannelMode(QProcess.ProcessChannelMode.ForwardedChannels)
+        self.gui.start(program, arguments)
+
+    def shutdown(self):
+        self.store.flush()
+        self.status.close()
+        self.server.close()
+        if self.history is not None:
+            self.history.close()
+        if self.gui_attached():
+            # The window leaves by itself once the socket is gone
+            self.gui.waitForFinished(3000)
+
+
+def quit_on_signals(app):
+    """Quit cleanly on SIGTERM/SIGINT. Python only runs signal handlers between
+    bytecodes, so a wakeup fd nudges the Qt event loop instead of polling."""
+    if not hasattr(signal, "SIGTERM") or sys.platform == "win32":
+        return None
+    receiver, sender = socket.socketpair()
+    receiver.setblocking(False)
+    sender.setblocking(False)
+    signal.set_wakeup_fd(sender.fileno())
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda *args: app.quit())
+    notifier = QSocketNotifier(receiver.fileno(), QSocketNotifier.Type.Read)
+    notifier.activated.connect(lambda *args: receiver.recv(64))
+    return notifier, receiver, sender  # Kept alive by the caller
+
+
+def run_daemon(argv):
+    """Entry point for `main.py --daemon`; returns the exit code"""
+    app = QCoreApplication(argv)
+    server = InstanceServer()
+    if not server.listen():
+        print("Break Loop is already running")
+        return 1
+    daemon = BreakLoopDaemon(app, server)
+    signal_hooks = quit_on_signals(app)
+    print(f"Break Loop daemon running (pid {os.getpid()}, socket {server.name})")
+    return app.exec()
@@ -1,22 +1,9 @@
 from PyQt6.QtWidgets import QWidget, QLabel, QPushButton, QHBoxLayout, QVBoxLayout, QApplication, QFrame, QSystemTrayIcon
 from PyQt6.QtCore import Qt, QPoint, pyqtSignal, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QIcon, QFont, QPainter, QColor, QPainterPath, QPen
-import os
-import sys
-
-from numpy import pad
+from PyQt6.QtGui import QPainter, QColor, QPainterPath, QPen
 
 from stylesheets import Styles
-
-def resource_path(relative_path):
-    """ Get absolute path to resource, works for dev and for PyInstaller """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-
-    return os.path.join(base_path, relative_path)
+import assets
 
 class MiniWindow(QWidget):
     # Signals
@@ -47,13 +34,7 @@ class MiniWindow(QWidget):
         self.timer_label.setStyleSheet("padding: 20px;")  # Add horizontal padding
 
         # Use custom font if available, otherwise use system font
-        font_id = QApplication.instance().property("Inter_28pt-Regular.ttf")
-        if font_id and font_id != -1:
-            font_family = QFont(QApplication.instance().property(resource_path(r"assets/fonts/Inter_28pt-Regular.ttf")), 20)
-            font_family.setBold(True)
-            self.timer_label.setFont(font_family)
-        else:
-            self.timer_label.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        self.timer_label.setFont(assets.font(20, bold=True))
         
         self.timer_label.setStyleSheet("color: white;")
         
@@ -70,7 +51,7 @@ class MiniWindow(QWidget):
         
         # Expand Button
         self.expand_button = QPushButton()
-        self.expand_button.setIcon(QIcon(resource_path(r"dist\\assets\\icons\\expand_24dp_white.svg")))
+        self.expand_button.setIcon(assets.icon("expand_24dp_white.svg"))
         self.expand_button.setFixedSize(30, 30)
         self.expand_button.setToolTip("Expand to full window")
         self.expand_button.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -79,7 +60,7 @@ class MiniWindow(QWidget):
         
         # Close Button
         self.close_button = QPushButton()
-        self.close_button.setIcon(QIcon(resource_path(r"dist\\assets\\icons\\close_24dp_white.svg")))
+        self.close_button.setIcon(assets.icon("close_24dp_white.svg"))
         self.close_button.setFixedSize(30, 30)
         self.close_button.setToolTip("Close mini timer")
         self.close_button.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -115,7 +96,7 @@ class MiniWindow(QWidget):
 
         # Initialize system tray icon for notifications
         self.tray_icon = QSystemTrayIcon(self)
-        self.tray_icon.setIcon(QIcon(resource_path(r"dist\\assets\\icons\\icon.png")))
+        self.tray_icon.setIcon(assets.icon("icon.png"))
         self.tray_icon.setToolTip("Timer Mini")
     
     def paintEvent(self, event):
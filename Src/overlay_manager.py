@@ -0,0 +1,116 @@
+"""Pool of pre-armed break overlays, one per screen.
+
+Overlays are built once, kept hidden and re-armed shortly before the focus
+deadline, so showing a break only means updating text and starting the fade.
+The manager also measures how long it takes from the session deadline to the
+first visible overlay frame.
+"""
+from collections import deque
+import time
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtWidgets import QApplication
+
+from break_overlay import BreakOverlay
+from tracing import traced, tracer
+
+
+class OverlayManager(QObject):
+    endRequested = pyqtSignal()
+    snoozeRequested = pyqtSignal(int)  # Snooze minutes
+    latencyMeasured = pyqtSignal(float)  # Deadline -> first frame, in ms
+
+    def __init__(self, parent=None, clock=time.monotonic):
+        super().__init__(parent)
+        self.clock = clock
+        self.overlays = {}  # QScreen -> BreakOverlay
+        self.latencies = deque(maxlen=100)  # Recent deadline-to-first-frame latencies (ms)
+        self._shown_since = None
+        self.showing = False  # Between show() and hide(), even while a fade-out finishes
+
+        app = QApplication.instance()
+        app.screenRemoved.connect(self._on_screen_removed)
+
+    @traced("OverlayManager.prepare")
+    def prepare(self, snooze_settings=None):
+        """Make sure every screen has a built, laid out and armed overlay"""
+        for screen in QApplication.screens():
+            overlay = self.overlays.get(screen)
+            if overlay is None:
+                overlay = BreakOverlay(snooze_settings=snooze_settings)
+                overlay.end_button.clicked.connect(self.endRequested.emit)
+                overlay.snoozeRequested.connect(self._on_snooze)
+                overlay.firstFrame.connect(self._on_first_frame)
+                self.overlays[screen] = overlay
+            if not overlay.isVisible():
+                overlay.prepare(screen)
+        self.arm(snooze_settings)
+
+    def arm(self, snooze_settings):
+        """Refresh quote and snooze button on every overlay"""
+        for overlay in self.overlays.values():
+            overlay.arm(snooze_settings)
+
+    @traced("OverlayManager.show")
+    def show(self, snooze_settings, since=None):
+        """Show the overlays; since is the clock() value of the deadline that triggered it"""
+        if any(screen not in self.overlays for screen in QApplication.screens()):
+            self.prepare(snooze_settings)
+        else:
+            self.arm(snooze_settings)
+        self._shown_since = self.clock() if since is None else since
+        self.showing = True
+        for overlay in self.overlays.values():
+            overlay.present()
+
+    def hide(self, fade=True):
+        """Hide every overlay, optionally with the fade-out animation"""
+        self._shown_since = None
+        self.showing = False
+        for overlay in self.overlays.values():
+            if fade:
+                overlay.fade_out()
+            else:
+                overlay.fade_animation.stop()
+                overlay.hide()
+
+    def isVisible(self):
+        """True while a break is on screen; fading out no longer counts"""
+        return self.showing and any(overlay.isVisible() for overlay in self.overlays.values())
+
+    def update_timer(self, time_text):
+        for overlay in self.overlays.values():
+            overlay.updateTimer(time_text)
+
+    def latency_summary(self):
+        """Min/median/max of the recorded deadline-to-first-frame latencies (ms)"""
+        if not self.latencies:
+            return None
+        values = sorted(self.latencies)
+        return {
+            'count': len(values),
+            'min': values[0],
+            'median': values[len(values) // 2],
+            'max': values[-1],
+        }
+
+    def _on_snooze(self, snooze_minutes):
+        # Snoozing on one screen dismisses the overlay on every screen
+        self.hide(fade=True)
+        self.snoozeRequested.emit(snooze_minutes)
+
+    def _on_first_frame(self):
+        # Only the first overlay to paint counts
+        if self._shown_since is None:
+            return
+        latency_ms = (self.clock() - self._shown_since) * 1000
+        self._shown_since = None
+        self.latencies.append(latency_ms)
+        tracer.instant("overlay first frame", {"latency_ms": latency_ms})
+        self.latencyMeasured.emit(latency_ms)
+
+    def _on_screen_removed(self, screen):
+        overlay = self.overlays.pop(screen, None)
+        if overlay is not None:
+            overlay.hide()
+            overlay.deleteLater()
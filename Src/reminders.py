@@ -0,0 +1,148 @@
+"""Recurring reminders beside the focus/break loop.
+
+An eye-rest prompt (the 20-20-20 rule), an hourly stretch, a hydration
+nudge: each is a Reminder with its own interval. All of them share one
+ReminderScheduler, a min-heap of deadlines on the monotonic clock. The
+owner arms a single timer for next_due(), however many reminders there are,
+and calls poll() when it fires. Nothing runs per second, and a reminder
+costs O(log n) only when it comes due.
+
+Reminders due within COALESCE_SECONDS of each other are delivered together
+in one "due" event, so they make one notification rather than several. The
+later ones are pulled forward a little but keep their phase.
+
+Like SessionEngine this module is Qt-free; listeners subscribe to "due" and
+are called with (scheduler, reminders).
+"""
+import heapq
+import itertools
+import time
+
+# Reminders due this close together are delivered (and shown) as one
+COALESCE_SECONDS = 90
+
+# Built-in reminder types: name -> (setting with the interval in minutes, message)
+REMINDER_TYPES = {
+    "eye_rest": ('eye_rest_minutes', "Look at something 20 feet away for 20 seconds."),
+    "stretch": ('stretch_minutes', "Stand up and stretch for a minute."),
+    "hydration": ('hydration_minutes', "Time for a glass of water."),
+}
+
+
+class Reminder:
+    """A recurring prompt: every interval seconds, show message"""
+
+    def __init__(self, name, interval, message):
+        self.name = name
+        self.interval = interval
+        self.message = message
+
+
+class ReminderScheduler:
+    def __init__(self, clock=time.monotonic, coalesce=COALESCE_SECONDS):
+        self.clock = clock
+        self.coalesce = coalesce
+        self.reminders = {}  # name -> Reminder
+        self._heap = []  # [due, sequence, name] entries; name is None once cancelled
+        self._entries = {}  # name -> its live heap entry
+        self._sequence = itertools.count()
+        self._listeners = {"due": []}
+
+    # ---------- Events ----------
+
+    def subscribe(self, event, callback):
+        """Register a callback for "due" events"""
+        self._listeners[event].append(callback)
+
+    def unsubscribe(self, event, callback):
+        try:
+            self._listeners[event].remove(callback)
+        except ValueError:
+            pass
+
+    def _emit(self, event, *args):
+        for callback in list(self._listeners[event]):
+            callback(self, *args)
+
+    # ---------- Reminders ----------
+
+    def add(self, reminder, delay=None):
+        """Add or replace a reminder; it first comes due after delay seconds (default: its interval)"""
+        if reminder.interval <= 0:
+            raise ValueError(f"Reminder interval must be positive: {reminder.interval}")
+        self.remove(reminder.name)
+        self.reminders[reminder.name] = reminder
+        self._push(self.clock() + (reminder.interval if delay is None else delay), reminder.name)
+
+    def remove(self, name):
+        """Drop a reminder; its heap entry is skipped when it reaches the top"""
+        entry = self._entries.pop(name, None)
+        if entry is not None:
+            entry[-1] = None
+        self.reminders.pop(name, None)
+
+    def _push(self, due, name):
+        entry = [due, next(self._sequence), name]
+        self._entries[name] = entry
+        heapq.heappush(self._heap, entry)
+
+    # ---------- Queries ----------
+
+    def next_due(self):
+        """Clock time of the next reminder, or None"""
+        while self._heap and self._heap[0][-1] is None:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def ms_until_due(self):
+        """Milliseconds until the next reminder (0 if overdue), or None"""
+        due = self.next_due()
+        if due is None:
+            return None
+        return max(0, int((due - self.clock()) * 1000) + 1)
+
+    # ---------- Driving ----------
+
+    def poll(self):
+        """Deliver every reminder that is due, plus any due within the coalescing
+        window, as one "due" event; returns the delivered reminders"""
+        due = self.next_due()
+        now = self.clock()
+        if due is None or due > now:
+            return []
+        delivered = []
+        horizon = now + self.coalesce
+        while self._heap and self._heap[0][0] <= horizon:
+            entry = heapq.heappop(self._heap)
+            name = entry[-1]
+            if name is not None:
+                delivered.append((entry[0], self.reminders[name]))
+        # Re-queue after the sweep, so a short interval cannot come round again within it
+        for was_due, reminder in delivered:
+            next_due = was_due + reminder.interval
+            if next_due <= now:
+                next_due = now + reminder.interval  # Missed periods (the app was busy) are not made up
+            self._push(next_due, reminder.name)
+        reminders = [reminder for _, reminder in delivered]
+        if reminders:
+            self._emit("due", reminders)
+        return reminders
+
+
+def apply_settings(scheduler, settings):
+    """Add, change or remove the built-in reminders to match the settings.
+
+    A reminder whose interval is unchanged keeps its deadline.
+    """
+    for name, (key, message) in REMINDER_TYPES.items():
+        interval = settings.get(key, 0) * 60
+        current = scheduler.reminders.get(name)
+        if interval <= 0:
+            scheduler.remove(name)
+        elif current is None or current.interval != interval:
+            scheduler.add(Reminder(name, interval, message))
+
+
+def format_reminders(reminders):
+    """One notification text for reminders that came due together"""
+    return "\n".join(reminder.message for reminder in reminders)
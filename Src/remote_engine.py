@@ -0,0 +1,159 @@
+"""SessionEngine stand-in for a GUI attached to a `main.py --daemon` process.
+
+RemoteEngine keeps the same fields, queries and events as SessionEngine, so
+TimerApp, the overlays and the mini window work unchanged. The session
+itself lives in the daemon, though. Commands are sent over the control
+socket, and state changes arrive as transition events from a subscription.
+Locally the engine only counts down: poll() emits ticks but never expires a
+session, because the daemon decides when a session ends.
+"""
+from collections import deque
+import json
+import time
+
+from PyQt6.QtNetwork import QLocalSocket
+
+from session_engine import SessionEngine, IDLE, PAUSE
+from single_instance import server_name
+
+CONNECT_TIMEOUT_MS = 1000
+
+# Trigger of the synthetic transitions replayed right after attaching
+ATTACH = "attach"
+
+
+class RemoteEngine(SessionEngine):
+    def __init__(self, clock=time.monotonic, focus_duration=1500, break_duration=300, name=None):
+        super().__init__(clock, focus_duration, break_duration, boot_clock=False)
+        self._listeners["show"] = []  # The daemon asks the attached window to come forward
+        self._listeners["detached"] = []  # The daemon went away
+        self.socket = QLocalSocket()
+        self.name = name or server_name()
+        self._pending = deque()  # Commands waiting for their reply, for error messages
+
+    # ---------- Connection ----------
+
+    def attach(self):
+        """Connect, subscribe and load the current state; False if no daemon answers"""
+        self.socket.connectToServer(self.name)
+        if not self.socket.waitForConnected(CONNECT_TIMEOUT_MS):
+            return False
+        self._write({"command": "subscribe"})
+        self._write({"command": "status"})
+        # Block only for the first status, so the window is built on real state
+        status = None
+        buffered = []
+        while status is None:
+            if not self.socket.canReadLine() and not self.socket.waitForReadyRead(CONNECT_TIMEOUT_MS):
+                return False
+            while self.socket.canReadLine():
+                message = json.loads(bytes(self.socket.readLine()))
+                if "state" in message and "event" not in message:
+                    status = message
+                elif "event" in message:
+                    buffered.append(message)
+        self._apply(status)
+        self.socket.readyRead.connect(self._read)
+        self.socket.disconnected.connect(self._lost)
+        for message in buffered:
+            self._handle(message)
+        return True
+
+    def detach(self):
+        """Disconnect on purpose (the window is closing); no detached event"""
+        try:
+            self.socket.disconnected.disconnect(self._lost)
+        except TypeError:
+            pass
+        self.socket.disconnectFromServer()
+
+    def _lost(self):
+        self._emit("detached")
+
+    def replay(self):
+        """Emit transitions that bring freshly built views up to the attached state"""
+        if self.state != IDLE:
+            self._emit("transition", IDLE, self.state, ATTACH)
+            if self.paused:
+                self._emit("transition", self.state, self.state, PAUSE)
+            self._emit("tick", self.remaining_seconds())
+
+    def request(self, command, **fields):
+        """Send a command to the daemon; failures are reported when the reply comes back"""
+        fields["command"] = command
+        self._pending.append(command)
+        self._write(fields)
+
+    def _write(self, message):
+        self.socket.write((json.dumps(message) + "\n").encode("utf-8"))
+        self.socket.flush()
+
+    def _read(self):
+        while self.socket.canReadLine():
+            try:
+                message = json.loads(bytes(self.socket.readLine()))
+            except ValueError:
+                continue
+            self._handle(message)
+
+    def _handle(self, message):
+        event = message.get("event")
+        if event == "transition":
+            self._apply(message["status"])
+            self._emit("transition", message["from"], message["to"], message["trigger"])
+            if self.state != IDLE:
+                self._emit("tick", self._last_tick)
+        elif event == "show":
+            self._emit("show")
+        elif event is None and "ok" in message:
+            command = self._pending.popleft() if self._pending else "request"
+            if not message["ok"]:
+                print(f"Warning: Break Loop daemon refused {command}: {message.get('error')}")
+
+    def _apply(self, status):
+        """Mirror the daemon's status, rebasing its remaining time on the local clock"""
+        now = self.clock()
+        remaining = status.get("remaining", 0.0)
+        self.state = status["state"]
+        self.paused = status["paused"]
+        self.duration = status["duration"]
+        self.snooze_count = status["snooze_count"]
+        self.started_at = now - (self.duration - remaining)
+        self.expired_at = None
+        self.paused_remaining = remaining if self.paused else None
+        self.deadline = now + remaining if self.state != IDLE and not self.paused else None
+        self._last_tick = self.remaining_seconds()
+
+    # ---------- Commands go to the daemon ----------
+
+    def start_focus(self, duration=None):
+        self.request("start-focus", focus_seconds=self.focus_duration if duration is None else duration,
+                     break_seconds=self.break_duration)
+
+    def take_break(self, duration=None):
+        self.request("take-break", focus_seconds=self.focus_duration,
+                     break_seconds=self.break_duration if duration is None else duration)
+
+    def snooze(self, duration):
+        self.request("snooze", seconds=duration)
+
+    def end_break(self):
+        self.request("end-break", focus_seconds=self.focus_duration, break_seconds=self.break_duration)
+
+    def stop(self):
+        self.request("stop")
+
+    def pause(self):
+        self.request("pause")
+
+    def resume(self):
+        self.request("resume")
+
+    def poll(self):
+        """Count down locally; expiry is left to the daemon"""
+        if not self.is_running():
+            return
+        seconds = self.remaining_seconds()
+        if seconds != self._last_tick and seconds > 0:
+            self._last_tick = seconds
+            self._emit("tick", seconds)
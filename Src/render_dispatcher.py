@@ -0,0 +1,82 @@
+"""Fan-out of the per-second countdown to the app's views.
+
+Views register a setter plus an optional visibility check. On every tick the
+dispatcher only touches views that are visible and whose text actually
+changed, so a timer sitting in the tray does close to zero widget work.
+"""
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def format_hms(seconds):
+    """Format seconds into a cached HH:MM:SS string"""
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    seconds = seconds % 60
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+class _View:
+    __slots__ = ("setter", "is_visible", "compose", "shown")
+
+    def __init__(self, setter, is_visible, compose):
+        self.setter = setter
+        self.is_visible = is_visible
+        self.compose = compose
+        self.shown = None  # Last text pushed to the widget
+
+
+class RenderDispatcher:
+    """Pushes countdown text to registered views, skipping hidden or unchanged ones"""
+
+    def __init__(self):
+        self._views = {}
+        self.remaining = 0
+        self.state = None
+
+    def register(self, name, setter, is_visible=None, compose=None):
+        """Register a view.
+
+        setter(text) updates the widget, is_visible() says whether it is worth
+        updating right now (None means always), and compose(remaining, state)
+        builds the view's text (None means the plain HH:MM:SS string).
+        """
+        self._views[name] = _View(setter, is_visible, compose)
+
+    def unregister(self, name):
+        self._views.pop(name, None)
+
+    def any_visible(self):
+        """True if at least one view would be rendered right now"""
+        return any(view.is_visible is None or view.is_visible() for view in self._views.values())
+
+    def update(self, remaining, state):
+        """New countdown value - render every visible view"""
+        self.remaining = remaining
+        self.state = state
+        for view in self._views.values():
+            if view.is_visible is None or view.is_visible():
+                self._render(view, False)
+
+    def refresh(self, name=None, force=False):
+        """Render one view (or all visible views) from the latest value.
+
+        Use force=True for a view that is about to be shown or was just
+        recreated, so it gets the text even if it is not visible yet.
+        """
+        if name is not None:
+            views = [self._views[name]] if name in self._views else []
+        else:
+            views = self._views.values()
+        for view in views:
+            if force or view.is_visible is None or view.is_visible():
+                self._render(view, force)
+
+    def _render(self, view, force):
+        if view.compose is None:
+            text = format_hms(self.remaining)
+        else:
+            text = view.compose(self.remaining, self.state)
+        if force or text != view.shown:
+            view.shown = text
+            view.setter(text)
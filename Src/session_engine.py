@@ -0,0 +1,326 @@
+"""Qt-free focus/break/snooze lifecycle for Break Loop.
+
+The engine is an explicit state machine driven by absolute monotonic
+deadlines. It never counts ticks: the remaining time is always derived from
+the deadline, so a late or missed wakeup cannot make the countdown drift.
+Widgets do not poke at the engine's state; they subscribe to its events.
+
+Suspend is detected by comparing the monotonic clock, which stops while the
+machine sleeps, against a boot-time clock, which does not. Each session type
+is reconciled with its own policy. Wall-clock changes never affect timing.
+"""
+from functools import partial
+import math
+import sys
+import time
+
+# Session states
+IDLE = "idle"
+FOCUS = "focus"
+BREAK = "break"
+SNOOZE = "snooze"
+
+# Triggers that move the engine between states
+START_FOCUS = "start_focus"
+TAKE_BREAK = "take_break"
+SNOOZE_BREAK = "snooze"
+END_BREAK = "end_break"
+EXPIRE = "expire"
+STOP = "stop"
+# Pause/resume keep the state and only freeze/unfreeze the deadline
+PAUSE = "pause"
+RESUME = "resume"
+
+# Float noise tolerated when rounding the remaining time to whole seconds
+EPSILON = 1e-6
+
+# What to do with a session that was running while the machine slept
+COUNT_AS_BREAK = "count_as_break"  # Sleep long enough for a break is a break; otherwise time passes
+EXPIRE_SESSION = "expire"  # The countdown keeps running through the sleep
+PAUSE_SESSION = "pause"  # Pause where the session stopped
+
+DEFAULT_SUSPEND_POLICIES = {
+    FOCUS: COUNT_AS_BREAK,
+    BREAK: COUNT_AS_BREAK,
+    SNOOZE: COUNT_AS_BREAK,
+}
+
+# Clock disagreement (seconds) treated as a suspend rather than scheduling noise
+SUSPEND_THRESHOLD = 2.0
+
+# Shortest focus/break length the input fields and the control API accept
+MIN_SESSION_SECONDS = 40
+
+# (current state, trigger) -> next state
+TRANSITIONS = {
+    (IDLE, START_FOCUS): FOCUS,
+    (FOCUS, START_FOCUS): FOCUS,
+    (BREAK, START_FOCUS): FOCUS,
+    (SNOOZE, START_FOCUS): FOCUS,
+
+    (IDLE, TAKE_BREAK): BREAK,
+    (FOCUS, TAKE_BREAK): BREAK,
+    (BREAK, TAKE_BREAK): BREAK,
+    (SNOOZE, TAKE_BREAK): BREAK,
+
+    (BREAK, SNOOZE_BREAK): SNOOZE,
+    (BREAK, END_BREAK): FOCUS,
+
+    (FOCUS, EXPIRE): BREAK,
+    (SNOOZE, EXPIRE): BREAK,
+    (BREAK, EXPIRE): IDLE,
+
+    (IDLE, STOP): IDLE,
+    (FOCUS, STOP): IDLE,
+    (BREAK, STOP): IDLE,
+    (SNOOZE, STOP): IDLE,
+}
+
+
+def _whole_seconds(remaining):
+    """Round up to whole seconds, ignoring float noise"""
+    return max(0, int(math.ceil(remaining - EPSILON)))
+
+
+def default_boot_clock():
+    """Clock that keeps counting while suspended, or None if time.monotonic already does"""
+    if sys.platform.startswith("linux") and hasattr(time, "CLOCK_BOOTTIME"):
+        return partial(time.clock_gettime, time.CLOCK_BOOTTIME)
+    if sys.platform == "darwin" and hasattr(time, "CLOCK_MONOTONIC"):
+        # time.monotonic stops during sleep on macOS; CLOCK_MONOTONIC does not
+        return partial(time.clock_gettime, time.CLOCK_MONOTONIC)
+    # Windows: time.monotonic already includes time spent suspended
+    return None
+
+
+class TransitionError(Exception):
+    """Raised when a trigger is not allowed from the current state"""
+
+
+class SessionEngine:
+    """Deadline-based session state machine.
+
+    Events:
+        "tick"       -> callback(engine, remaining_seconds), emitted whenever
+                        the whole-second countdown changes (and on every
+                        transition, so views can show the new session length)
+        "transition" -> callback(engine, old_state, new_state, trigger)
+        "suspend"    -> callback(engine, gap_seconds, state, policy), emitted
+                        when a suspend is detected, before it is reconciled
+
+    boot_clock is a clock that keeps running through suspend. None picks the
+    platform's (see default_boot_clock) and False disables suspend detection;
+    pass fakes for both clocks to simulate a suspend.
+    """
+
+    def __init__(self, clock=time.monotonic, focus_duration=1500, break_duration=300,
+                 boot_clock=None):
+        self.clock = clock
+        if boot_clock is None:
+            boot_clock = default_boot_clock()
+        self.boot_clock = boot_clock or None
+        self.suspend_policies = dict(DEFAULT_SUSPEND_POLICIES)
+        self.focus_duration = focus_duration
+        self.break_duration = break_duration
+
+        self.state = IDLE
+        self.paused = False
+        self.duration = 0  # Length of the current session in seconds
+        self.deadline = None  # Absolute clock() value when the session ends
+        self.started_at = None  # clock() value when the current session started
+        self.expired_at = None  # Deadline that ended the previous session, if it expired
+        self.paused_remaining = None  # Remaining seconds frozen by pause()
+        self.snooze_count = 0  # Snoozes used in the current break
+
+        self._last_tick = None
+        self._clock_pair = None  # (clock(), boot_clock()) at the last check while running
+        self._listeners = {"tick": [], "transition": [], "suspend": []}
+
+    # ---------- Subscriptions ----------
+
+    def subscribe(self, event, callback):
+        """Register a callback for "tick", "transition" or "suspend" events"""
+        self._listeners[event].append(callback)
+
+    def unsubscribe(self, event, callback):
+        """Remove a previously registered callback"""
+        try:
+            self._listeners[event].remove(callback)
+        except ValueError:
+            pass
+
+    def _emit(self, event, *args):
+        for callback in list(self._listeners[event]):
+            callback(self, *args)
+
+    # ---------- Queries ----------
+
+    def is_running(self):
+        """True while a session is counting down"""
+        return self.state != IDLE and not self.paused
+
+    def can(self, trigger):
+        """Check whether a trigger is allowed from the current state"""
+        if trigger == PAUSE:
+            return self.state != IDLE and not self.paused
+        if trigger == RESUME:
+            return self.state != IDLE and self.paused
+        return (self.state, trigger) in TRANSITIONS
+
+    def remaining(self):
+        """Remaining time of the current session in (fractional) seconds"""
+        if self.state == IDLE:
+            return 0.0
+        if self.paused:
+            return self.paused_remaining
+        return max(0.0, self.deadline - self.clock())
+
+    def remaining_seconds(self):
+        """Remaining whole seconds, rounded up the way a countdown displays them"""
+        return _whole_seconds(self.remaining())
+
+    def ms_until_next_tick(self):
+        """Milliseconds until the displayed second changes (or the deadline passes)"""
+        remaining = self.remaining()
+        fraction = remaining - (_whole_seconds(remaining) - 1)
+        # Wake just after the boundary rather than just before it
+        return int(math.ceil(fraction * 1000)) + 1
+
+    # ---------- Commands ----------
+
+    def start_focus(self, duration=None):
+        """Start (or restart) a focus session"""
+        self._transition(START_FOCUS, self.focus_duration if duration is None else duration)
+
+    def take_break(self, duration=None):
+        """Start a break immediately"""
+        self._transition(TAKE_BREAK, self.break_duration if duration is None else duration)
+
+    def snooze(self, duration):
+        """Postpone the current break for the given number of seconds"""
+        self._transition(SNOOZE_BREAK, duration)
+
+    def end_break(self):
+        """End the current break early and go back to focus"""
+        self._transition(END_BREAK, self.focus_duration)
+
+    def stop(self):
+        """Stop whatever session is running"""
+        self._transition(STOP, 0)
+
+    def pause(self):
+        """Freeze the countdown of the running session"""
+        if not self.can(PAUSE):
+            raise TransitionError(f"Cannot pause while {self.state}")
+        self.paused_remaining = self.remaining()
+        self.deadline = None
+        self.paused = True
+        self._emit("transition", self.state, self.state, PAUSE)
+
+    def resume(self):
+        """Continue a paused session from where it stopped"""
+        if not self.can(RESUME):
+            raise TransitionError(f"Cannot resume while {self.state}")
+        self.deadline = self.clock() + self.paused_remaining
+        self.paused_remaining = None
+        self.paused = False
+        self._mark_clocks()
+        self._emit("transition", self.state, self.state, RESUME)
+
+    def poll(self):
+        """Check the deadline; emit a tick or expire the session.
+
+        Safe to call at any rate - ticks are only emitted when the displayed
+        second actually changes.
+        """
+        if not self.is_running():
+            return
+        if self.boot_clock is not None:
+            self._check_suspend()
+            if not self.is_running():
+                return  # Paused by the suspend policy
+        remaining = self.remaining()
+        if remaining <= 0:
+            self._transition(EXPIRE)
+            return
+        seconds = _whole_seconds(remaining)
+        if seconds != self._last_tick:
+            self._last_tick = seconds
+            self._emit("tick", seconds)
+
+    def reconcile_suspend(self, gap):
+        """Apply the current session type's policy to gap seconds spent suspended"""
+        state = self.state
+        policy = self.suspend_policies.get(state, COUNT_AS_BREAK)
+        self._emit("suspend", gap, state, policy)
+
+        if policy == PAUSE_SESSION:
+            # The monotonic clock stood still, so this freezes the pre-suspend countdown
+            self.pause()
+        elif policy == EXPIRE_SESSION:
+            self.deadline -= gap
+        elif state in (FOCUS, SNOOZE) and gap >= self.break_duration:
+            # Slept for at least a break - skip the break and start a fresh focus session
+            if self.focus_duration > 0:
+                self.start_focus()
+            else:
+                self.stop()
+        elif state in (BREAK, SNOOZE):
+            # Time asleep is time away from the screen
+            self.deadline -= gap
+        # A focus session interrupted by a short sleep carries on where it stopped
+
+    # ---------- Internals ----------
+
+    def _mark_clocks(self):
+        """Start measuring suspend gaps from now"""
+        if self.boot_clock is not None:
+            self._clock_pair = (self.clock(), self.boot_clock())
+
+    def _check_suspend(self):
+        """Compare how far the two clocks moved since the last check"""
+        now, boot_now = self.clock(), self.boot_clock()
+        previous = self._clock_pair
+        self._clock_pair = (now, boot_now)
+        if previous is None:
+            return
+        gap = (boot_now - previous[1]) - (now - previous[0])
+        if gap > SUSPEND_THRESHOLD:
+            self.reconcile_suspend(gap)
+
+    def _transition(self, trigger, duration=None):
+        old_state = self.state
+        new_state = TRANSITIONS.get((old_state, trigger))
+        if new_state is None:
+            raise TransitionError(f"Cannot {trigger} while {old_state}")
+
+        if trigger == EXPIRE:
+            duration = self.break_duration if new_state == BREAK else 0
+            if new_state == BREAK and duration <= 0:
+                # Nothing to count down - treat as the end of the loop
+                new_state = IDLE
+                duration = 0
+        elif new_state != IDLE and duration <= 0:
+            raise ValueError("Session duration must be greater than 0")
+
+        # A snooze keeps the break's snooze count; anything else starts fresh
+        if trigger == SNOOZE_BREAK:
+            self.snooze_count += 1
+        elif not (old_state == SNOOZE and new_state == BREAK):
+            self.snooze_count = 0
+
+        now = self.clock()
+        self.expired_at = self.deadline if trigger == EXPIRE else None
+        self.state = new_state
+        self.paused = False
+        self.paused_remaining = None
+        self.duration = duration
+        self.started_at = now
+        self.deadline = now + duration if new_state != IDLE else None
+        self._last_tick = _whole_seconds(duration)
+        self._mark_clocks()
+
+        self._emit("transition", old_state, new_state, trigger)
+        # Let views show the length of the new session straight away
+        if self.state == new_state:
+            self._emit("tick", self._last_tick)
@@ -0,0 +1,290 @@
+"""Append-only log of session lifecycle events.
+
+Every transition of the session engine is written to ~/.breakloop/history.log
+as a fixed-width, checksummed binary record. A sparse index file stores the
+timestamp of every INDEX_INTERVAL-th record so time-range queries can seek
+straight to the right part of the log. A torn tail left by a crash is
+truncated when the log is opened.
+"""
+from bisect import bisect_right
+from collections import namedtuple
+import os
+import struct
+import time
+import zlib
+
+from settings_store import get_app_dir
+from session_engine import (IDLE, FOCUS, BREAK, SNOOZE, EXPIRE, END_BREAK,
+                            SNOOZE_BREAK, PAUSE, RESUME)
+
+HISTORY_FILE = "history.log"
+INDEX_FILE = "history.idx"
+
+# File header: magic, format version, record size
+HEADER = struct.Struct("<8sII")
+MAGIC = b"BLHIST\x00\x00"
+FORMAT_VERSION = 1
+
+# timestamp (epoch s), event, state, snooze count, flags,
+# planned duration (s), elapsed active time (s); followed by a CRC32
+RECORD_BODY = struct.Struct("<dBBBBIf")
+RECORD_SIZE = RECORD_BODY.size + 4
+
+# Sparse index entry: timestamp, record number
+INDEX_ENTRY = struct.Struct("<dQ")
+INDEX_INTERVAL = 256
+
+# Event codes
+FOCUS_START = 1
+FOCUS_END = 2
+BREAK_START = 3
+BREAK_END = 4
+BREAK_EARLY_END = 5
+SNOOZED = 6
+PAUSED = 7
+RESUMED = 8
+SUSPENDED = 9
+
+EVENT_NAMES = {
+    FOCUS_START: "focus_start",
+    FOCUS_END: "focus_end",
+    BREAK_START: "break_start",
+    BREAK_END: "break_end",
+    BREAK_EARLY_END: "break_early_end",
+    SNOOZED: "snooze",
+    PAUSED: "pause",
+    RESUMED: "resume",
+    SUSPENDED: "suspend",
+}
+
+# Session state codes
+STATE_CODES = {IDLE: 0, FOCUS: 1, BREAK: 2, SNOOZE: 3}
+
+# Flags
+FLAG_INTERRUPTED = 1  # Session ended by the user rather than by its deadline
+
+HistoryRecord = namedtuple("HistoryRecord", "timestamp event state snooze_count flags duration elapsed")
+
+
+class SessionHistory:
+    def __init__(self, path=None, index_path=None, clock=time.time):
+        app_dir = get_app_dir() or "."
+        self.path = path or os.path.join(app_dir, HISTORY_FILE)
+        self.index_path = index_path or os.path.join(app_dir, INDEX_FILE)
+        self.clock = clock
+        self.count = 0
+        self.index = []  # [(timestamp, record number)] for every INDEX_INTERVAL-th record
+        self._file = None
+        self._index_file = None
+        self._last_timestamp = None
+        self._bad_records = None  # Numbers of records that fail their checksum, once checked
+        self._opened_count = 0  # Records already on disk at open; later ones are written here
+        self._open()
+
+    # ---------- Writing ----------
+
+    def append(self, event, state=IDLE, duration=0, elapsed=0.0, snooze_count=0, flags=0, timestamp=None):
+        """Append one record; cheap enough to call on the GUI thread"""
+        timestamp = self.clock() if timestamp is None else timestamp
+        # Keep the log sorted even if the wall clock steps backwards
+        if self._last_timestamp is not None and timestamp < self._last_timestamp:
+            timestamp = self._last_timestamp
+        body = RECORD_BODY.pack(timestamp, event, STATE_CODES.get(state, 0),
+                                min(snooze_count, 255), flags, max(0, int(duration)), elapsed)
+        self._file.write(body + struct.pack("<I", zlib.crc32(body)))
+        self._file.flush()
+
+        if self.count % INDEX_INTERVAL == 0:
+            self.index.append((timestamp, self.count))
+            self._index_file.write(INDEX_ENTRY.pack(timestamp, self.count))
+            self._index_file.flush()
+        self.count += 1
+        self._last_timestamp = timestamp
+
+    def close(self):
+        for f in (self._file, self._index_file):
+            if f is not None:
+                f.close()
+        self._file = self._index_file = None
+
+    # ---------- Reading ----------
+
+    def __len__(self):
+        return self.count
+
+    def first_record_since(self, since):
+        """Record number to start scanning from for records at or after since"""
+        if since is None or not self.index:
+            return 0
+        position = bisect_right([entry[0] for entry in self.index], since) - 1
+        return self.index[position][1] if position >= 0 else 0
+
+    def read_raw(self, since=None):
+        """Raw record bytes from the index position for since to the end of the log"""
+        start = self.first_record_since(since)
+        with open(self.path, "rb") as f:
+            f.seek(HEADER.size + start * RECORD_SIZE)
+            return f.read((self.count - start) * RECORD_SIZE)
+
+    def read(self, since=None, until=None):
+        """Records with since <= timestamp < until, skipping any that fail their checksum"""
+        data = self.read_raw(since)
+        records = []
+        for offset in range(0, len(data) - RECORD_SIZE + 1, RECORD_SIZE):
+            body = data[offset:offset + RECORD_BODY.size]
+            crc, = struct.unpack_from("<I", data, offset + RECORD_BODY.size)
+            if zlib.crc32(body) != crc:
+                continue
+            record = HistoryRecord(*RECORD_BODY.unpack(body))
+            if since is not None and record.timestamp < since:
+                continue
+            if until is not None and record.timestamp >= until:
+                break
+            records.append(record)
+        return records
+
+    def bad_records(self):
+        """Numbers of the records that fail their checksum.
+
+        Only records that were on disk when the log was opened can be bad, so
+        they are checked once, on first use, and the answer is kept.
+        """
+        if self._bad_records is None:
+            bad = []
+            with open(self.path, "rb") as f:
+                f.seek(HEADER.size)
+                data = memoryview(f.read(self._opened_count * RECORD_SIZE))
+            for number, offset in enumerate(range(0, len(data) - RECORD_SIZE + 1, RECORD_SIZE)):
+                crc, = struct.unpack_from("<I", data, offset + RECORD_BODY.size)
+                if zlib.crc32(data[offset:offset + RECORD_BODY.size]) != crc:
+                    bad.append(number)
+            self._bad_records = bad
+        return self._bad_records
+
+    def read_last_days(self, days):
+        return self.read(since=self.clock() - days * 86400)
+
+    # ---------- Opening and recovery ----------
+
+    def _open(self):
+        if not os.path.exists(self.path) or os.path.getsize(self.path) < HEADER.size:
+            with open(self.path, "wb") as f:
+                f.write(HEADER.pack(MAGIC, FORMAT_VERSION, RECORD_SIZE))
+            if os.path.exists(self.index_path):
+                os.remove(self.index_path)
+        else:
+            with open(self.path, "rb") as f:
+                magic, version, record_size = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != FORMAT_VERSION or record_size != RECORD_SIZE:
+                raise ValueError(f"Unsupported session history file: {self.path}")
+
+        self._recover()
+        self._opened_count = self.count
+        self._load_index()
+        self._file = open(self.path, "ab")
+        self._index_file = open(self.index_path, "ab")
+
+    def _recover(self):
+        """Truncate a partially written or corrupt tail left by a crash"""
+        size = os.path.getsize(self.path)
+        count = (size - HEADER.size) // RECORD_SIZE
+        with open(self.path, "r+b") as f:
+            # Walk back over records whose checksum does not match
+            while count > 0:
+                f.seek(HEADER.size + (count - 1) * RECORD_SIZE)
+                record = f.read(RECORD_SIZE)
+                body, crc = record[:RECORD_BODY.size], struct.unpack("<I", record[RECORD_BODY.size:])[0]
+                if zlib.crc32(body) == crc:
+                    self._last_timestamp = RECORD_BODY.unpack(body)[0]
+                    break
+                count -= 1
+            valid_size = HEADER.size + count * RECORD_SIZE
+            if valid_size != size:
+                print(f"Warning: Truncating {size - valid_size} bytes of damaged session history")
+                f.truncate(valid_size)
+        self.count = count
+
+    def _load_index(self):
+        """Load the sparse index, rebuilding it if it does not match the log"""
+        self.index = []
+        expected = (self.count + INDEX_INTERVAL - 1) // INDEX_INTERVAL
+        try:
+            with open(self.index_path, "rb") as f:
+                data = f.read()
+            entries = [INDEX_ENTRY.unpack_from(data, offset)
+                       for offset in range(0, len(data) - INDEX_ENTRY.size + 1, INDEX_ENTRY.size)]
+            if len(entries) >= expected and all(entry[1] == i * INDEX_INTERVAL
+                                                for i, entry in enumerate(entries[:expected])):
+                self.index = entries[:expected]
+                if len(entries) != expected or len(data) % INDEX_ENTRY.size:
+                    self._write_index()
+                return
+        except FileNotFoundError:
+            pass
+        # Rebuild by reading every INDEX_INTERVAL-th record's timestamp
+        with open(self.path, "rb") as f:
+            for number in range(0, self.count, INDEX_INTERVAL):
+                f.seek(HEADER.size + number * RECORD_SIZE)
+                timestamp = struct.unpack("<d", f.read(8))[0]
+                self.index.append((timestamp, number))
+        self._write_index()
+
+    def _write_index(self):
+        with open(self.index_path, "wb") as f:
+            for entry in self.index:
+                f.write(INDEX_ENTRY.pack(*entry))
+
+
+class HistoryRecorder:
+    """Writes session engine transitions to a SessionHistory"""
+
+    def __init__(self, history, engine):
+        self.history = history
+        self.engine = engine
+        self._active_since = engine.clock()  # Engine clock value the current stretch started
+        self._elapsed = 0.0  # Active (unpaused) time of the current session so far
+        engine.subscribe("transition", self.on_transition)
+        engine.subscribe("suspend", self.on_suspend)
+
+    def detach(self):
+        self.engine.unsubscribe("transition", self.on_transition)
+        self.engine.unsubscribe("suspend", self.on_suspend)
+
+    def _elapsed_now(self):
+        if self._active_since is None:
+            return self._elapsed
+        return self._elapsed + self.engine.clock() - self._active_since
+
+    def on_suspend(self, engine, gap, state, policy):
+        # elapsed holds the length of the suspend
+        self.history.append(SUSPENDED, state, engine.duration, gap, engine.snooze_count)
+
+    def on_transition(self, engine, old_state, new_state, trigger):
+        append = self.history.append
+        if trigger == PAUSE:
+            self._elapsed = self._elapsed_now()
+            self._active_since = None
+            append(PAUSED, old_state, engine.duration, self._elapsed, engine.snooze_count)
+            return
+        if trigger == RESUME:
+            self._active_since = engine.clock()
+            append(RESUMED, old_state, engine.duration, self._elapsed, engine.snooze_count)
+            return
+
+        elapsed = self._elapsed_now()
+        flags = 0 if trigger == EXPIRE else FLAG_INTERRUPTED
+        if trigger == SNOOZE_BREAK:
+            append(SNOOZED, new_state, engine.duration, elapsed, engine.snooze_count)
+        elif old_state == FOCUS:
+            append(FOCUS_END, old_state, 0, elapsed, 0, flags)
+        elif old_state in (BREAK, SNOOZE) and not (old_state == SNOOZE and new_state == BREAK):
+            event = BREAK_EARLY_END if trigger == END_BREAK else BREAK_END
+            append(event, old_state, 0, elapsed, engine.snooze_count, flags)
+
+        if new_state == FOCUS:
+            append(FOCUS_START, new_state, engine.duration, 0.0)
+        elif new_state == BREAK:
+            append(BREAK_START, new_state, engine.duration, 0.0, engine.snooze_count)
+
+        self._elapsed = 0.0
+        self._active_since = engine.clock()
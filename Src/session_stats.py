@@ -0,0 +1,137 @@
+"""Session statistics computed from the history log.
+
+The log is read straight into NumPy columns (one structured array over the
+raw record bytes) and every figure is a vectorized aggregation, so years of
+records take milliseconds. StatsTask runs the work on the Qt thread pool and
+reports back through a signal.
+"""
+import time
+
+import numpy as np
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from session_history import (RECORD_SIZE, FOCUS_END, BREAK_START, BREAK_END,
+                             BREAK_EARLY_END, SNOOZED, FLAG_INTERRUPTED)
+
+# Matches session_history.RECORD_BODY followed by the CRC32
+RECORD_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('event', 'u1'),
+    ('state', 'u1'),
+    ('snooze_count', 'u1'),
+    ('flags', 'u1'),
+    ('duration', '<u4'),
+    ('elapsed', '<f4'),
+    ('crc', '<u4'),
+])
+assert RECORD_DTYPE.itemsize == RECORD_SIZE
+
+# Days shown in the focus-per-day chart
+DEFAULT_DAYS = 7
+
+
+def load_columns(history, since=None):
+    """Structured array of the records from since (None for all) to the end of the log.
+
+    Records that fail their CRC32 are dropped, as SessionHistory.read does; the
+    history checks them once and hands back their numbers.
+    """
+    start = history.first_record_since(since)
+    data = history.read_raw(since)
+    count = len(data) // RECORD_SIZE
+    records = np.frombuffer(data, dtype=RECORD_DTYPE, count=count)
+    bad = np.asarray(history.bad_records(), dtype=np.int64) - start
+    bad = bad[(bad >= 0) & (bad < count)]
+    if bad.size:
+        keep = np.ones(count, dtype=bool)
+        keep[bad] = False
+        records = records[keep]
+    if since is not None:
+        records = records[records['timestamp'] >= since]
+    return records
+
+
+def local_days(timestamps, now):
+    """Local calendar day number for each timestamp (current UTC offset)"""
+    offset = time.localtime(now).tm_gmtoff
+    return np.floor((timestamps + offset) / 86400).astype(np.int64)
+
+
+def streaks(active_days, today):
+    """(current, longest) run of consecutive days in a sorted unique day array"""
+    if active_days.size == 0:
+        return 0, 0
+    # A run starts wherever the gap to the previous active day is not exactly one
+    starts = np.flatnonzero(np.diff(active_days, prepend=active_days[0] - 2) != 1)
+    lengths = np.diff(np.append(starts, active_days.size))
+    longest = int(lengths.max())
+    # The current streak may still be extended today, so it survives until tomorrow
+    current = int(lengths[-1]) if active_days[-1] >= today - 1 else 0
+    return current, longest
+
+
+def compute(records, now=None, days=DEFAULT_DAYS):
+    """Aggregate a record array into a dict of statistics"""
+    now = time.time() if now is None else now
+    today = local_days(np.array([now]), now)[0]
+    events = records['event']
+    interrupted = (records['flags'] & FLAG_INTERRUPTED) != 0
+    day = local_days(records['timestamp'], now)
+
+    # Focus minutes per day for the last `days` days (oldest first)
+    focus = events == FOCUS_END
+    recent = focus & (day > today - days) & (day <= today)
+    per_day = np.bincount(day[recent] - (today - days + 1),
+                          weights=records['elapsed'][recent] / 60.0,
+                          minlength=days)
+
+    # Break compliance: breaks that ran to the end out of all breaks that ended
+    ended = (events == BREAK_END) | (events == BREAK_EARLY_END)
+    completed = (events == BREAK_END) & ~interrupted
+    breaks_ended = int(np.count_nonzero(ended))
+    compliance = int(np.count_nonzero(completed)) / breaks_ended if breaks_ended else None
+
+    # Snooze rate: breaks snoozed at least once out of all breaks offered
+    offered = int(np.count_nonzero((events == BREAK_START) & (records['snooze_count'] == 0)))
+    snoozes = events == SNOOZED
+    snoozed_breaks = int(np.count_nonzero(snoozes & (records['snooze_count'] == 1)))
+    snooze_rate = snoozed_breaks / offered if offered else None
+
+    # Streaks of days with at least one completed focus session
+    current_streak, longest_streak = streaks(np.unique(day[focus & ~interrupted]), today)
+
+    return {
+        'days': days,
+        'focus_minutes_per_day': per_day.tolist(),
+        'focus_minutes_today': float(per_day[-1]),
+        'focus_minutes_total': float(records['elapsed'][focus].sum() / 60.0),
+        'focus_sessions': int(np.count_nonzero(focus)),
+        'breaks_offered': offered,
+        'break_compliance': compliance,
+        'snoozes': int(np.count_nonzero(snoozes)),
+        'snooze_rate': snooze_rate,
+        'current_streak': current_streak,
+        'longest_streak': longest_streak,
+    }
+
+
+class StatsSignals(QObject):
+    finished = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+
+
+class StatsTask(QRunnable):
+    """Load and aggregate the history on a worker thread"""
+
+    def __init__(self, history, days=DEFAULT_DAYS):
+        super().__init__()
+        self.history = history
+        self.days = days
+        self.signals = StatsSignals()
+
+    def run(self):
+        try:
+            self.signals.finished.emit(compute(load_columns(self.history), days=self.days))
+        except Exception as e:
+            print(f"Error computing statistics: {e}")
+            self.signals.failed.emit(str(e))
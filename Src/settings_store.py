@@ -0,0 +1,258 @@
+"""Versioned, atomic settings storage for Break Loop.
+
+Settings live in ~/.breakloop/settings.json as a typed, versioned document.
+The old positional timer_app_settings.txt is migrated on first load. Writes
+go to a temp file that is fsynced and renamed over the real file, and bursts
+of changes are coalesced into a single write.
+"""
+import json
+import os
+import tempfile
+
+SETTINGS_FILE = "settings.json"
+LEGACY_SETTINGS_FILE = "timer_app_settings.txt"
+
+# Bump when the schema changes and add a step to MIGRATIONS
+SCHEMA_VERSION = 1
+
+# key -> (type, default, (min, max) or None)
+SCHEMA = {
+    'username': (str, '', (0, 50)),  # Range is the allowed length
+    'sound_enabled': (bool, True, None),
+    'snooze_enabled': (bool, True, None),
+    'snooze_time': (int, 5, (1, 5)),
+    'max_snooze_count': (int, 3, (1, 3)),
+    'auto_start': (bool, False, None),
+    'sound_volume': (int, 50, (0, 100)),
+    'unload_after_minutes': (int, 0, (0, 1440)),  # Free the hidden window's memory; 0 = never
+    # Recurring reminders, in minutes; 0 = off
+    'eye_rest_minutes': (int, 0, (0, 240)),
+    'stretch_minutes': (int, 0, (0, 480)),
+    'hydration_minutes': (int, 0, (0, 480)),
+}
+
+# Line order of the legacy positional settings file
+LEGACY_ORDER = ['username', 'sound_enabled', 'snooze_enabled', 'snooze_time',
+                'max_snooze_count', 'auto_start', 'sound_volume']
+
+# How long changes are collected before they are written
+FLUSH_DELAY_MS = 500
+
+
+def get_app_dir():
+    """Get the ~/.breakloop directory, creating it if needed (None if impossible)"""
+    app_dir = os.path.join(os.path.expanduser("~"), ".breakloop")
+    if not os.path.exists(app_dir):
+        try:
+            os.makedirs(app_dir)
+        except Exception as e:
+            print(f"Warning: Could not create settings directory: {e}")
+            return None
+    return app_dir
+
+
+def get_settings_path(filename=SETTINGS_FILE):
+    """Get the path to a settings file in user's home directory"""
+    app_dir = get_app_dir()
+    # Fall back to current directory if can't create app directory
+    return os.path.join(app_dir, filename) if app_dir else filename
+
+
+def defaults():
+    """Fresh dict with every setting at its default value"""
+    return {key: default for key, (_, default, _) in SCHEMA.items()}
+
+
+def coerce(key, value):
+    """Convert a raw value to the schema type; raises ValueError if it is invalid"""
+    if key not in SCHEMA:
+        raise ValueError(f"Unknown setting: {key}")
+    kind, _, limits = SCHEMA[key]
+    if kind is bool:
+        if isinstance(value, str):
+            if value.strip().lower() not in ('true', 'false'):
+                raise ValueError(f"{key} must be true or false")
+            value = value.strip().lower() == 'true'
+        elif not isinstance(value, bool):
+            raise ValueError(f"{key} must be true or false")
+    elif kind is int:
+        if isinstance(value, bool):
+            raise ValueError(f"{key} must be a number")
+        value = int(str(value).strip()) if isinstance(value, str) else int(value)
+    else:
+        value = str(value).strip()
+    if limits is not None:
+        size = len(value) if kind is str else value
+        if not limits[0] <= size <= limits[1]:
+            raise ValueError(f"{key} out of range {limits}")
+    return value
+
+
+def parse_legacy(lines):
+    """Convert the old positional text format to a version 0 document"""
+    data = {}
+    for key, line in zip(LEGACY_ORDER, lines):
+        data[key] = line.strip()
+    return {'version': 0, 'settings': data}
+
+
+def _migrate_0_to_1(document):
+    # Version 0 is the legacy text file: every value is a string
+    return {'version': 1, 'settings': dict(document.get('settings', {}))}
+
+
+# from_version -> function returning the document at from_version + 1
+MIGRATIONS = {
+    0: _migrate_0_to_1,
+}
+
+
+def migrate(document):
+    """Bring a settings document up to SCHEMA_VERSION"""
+    version = document.get('version', 0)
+    while version < SCHEMA_VERSION:
+        document = MIGRATIONS[version](document)
+        version = document['version']
+    return document
+
+
+def write_atomic(path, text, prefix=".settings-"):
+    """Write text to path via temp file + fsync + rename"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=prefix, suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    # Make the rename itself durable where the platform allows it
+    if hasattr(os, "O_DIRECTORY"):
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
+
+
+def read_document(path=None, legacy_path=None):
+    """Read and migrate the settings document; returns (settings dict, migrated flag)"""
+    path = path or get_settings_path()
+    legacy_path = legacy_path or get_settings_path(LEGACY_SETTINGS_FILE)
+    migrated = False
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            document = json.load(f)
+    except FileNotFoundError:
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                document = parse_legacy(f.readlines())
+            migrated = True
+        except FileNotFoundError:
+            document = {'version': SCHEMA_VERSION, 'settings': {}}
+    except ValueError as e:
+        print(f"Warning: Settings file is corrupt, using defaults: {e}")
+        document = {'version': SCHEMA_VERSION, 'settings': {}}
+
+    if document.get('version', 0) < SCHEMA_VERSION:
+        document = migrate(document)
+        migrated = True
+
+    settings = defaults()
+    for key, value in document.get('settings', {}).items():
+        try:
+            settings[key] = coerce(key, value)
+        except ValueError:
+            # Ignore unknown or invalid values and keep the default
+            pass
+    return settings, migrated
+
+
+def read_setting(key, path=None):
+    """Read a single setting without constructing any UI"""
+    settings, _ = read_document(path)
+    return settings[key]
+
+
+class SettingsStore:
+    """In-memory settings with coalesced, atomic persistence.
+
+    schedule(delay_ms, callback) is used to defer writes (QTimer.singleShot in
+    the app); without it every change is written immediately. on_error(exc) is
+    called when a write fails.
+    """
+
+    def __init__(self, path=None, legacy_path=None, schedule=None, on_error=None,
+                 delay_ms=FLUSH_DELAY_MS):
+        self.path = path or get_settings_path()
+        self.legacy_path = legacy_path or get_settings_path(LEGACY_SETTINGS_FILE)
+        self.schedule = schedule
+        self.on_error = on_error
+        self.delay_ms = delay_ms
+        self.values = defaults()
+        self.dirty = False
+        self.writes = 0  # Number of files actually written
+        self._flush_pending = False
+
+    def load(self):
+        """Load (and migrate) settings from disk; returns a copy of the values"""
+        self.values, migrated = read_document(self.path, self.legacy_path)
+        if migrated:
+            # Persist the migrated document so the legacy file is no longer needed
+            self.dirty = True
+            self.flush()
+        return dict(self.values)
+
+    def get(self, key):
+        return self.values[key]
+
+    def all(self):
+        return dict(self.values)
+
+    def set(self, key, value):
+        self.update({key: value})
+
+    def update(self, changes):
+        """Validate and apply changes, then schedule a single write"""
+        coerced = {key: coerce(key, value) for key, value in changes.items()}
+        changed = {key: value for key, value in coerced.items() if self.values.get(key) != value}
+        if not changed:
+            return {}
+        self.values.update(changed)
+        self.dirty = True
+        self._schedule_flush()
+        return changed
+
+    def flush(self):
+        """Write pending changes now; returns False if the write failed"""
+        self._flush_pending = False
+        if not self.dirty:
+            return True
+        document = {'version': SCHEMA_VERSION, 'settings': self.values}
+        try:
+            write_atomic(self.path, json.dumps(document, indent=2, sort_keys=True))
+        except Exception as e:
+            print(f"Error saving settings to {self.path}: {e}")
+            if self.on_error:
+                self.on_error(e)
+            return False
+        self.dirty = False
+        self.writes += 1
+        return True
+
+    def _schedule_flush(self):
+        if self.schedule is None:
+            self.flush()
+        elif not self._flush_pending:
+            # Later changes in the same burst ride along with this write
+            self._flush_pending = True
+            self.schedule(self.delay_ms, self.flush)
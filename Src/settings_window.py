@@ -1,29 +1,20 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
                            QLineEdit, QCheckBox, QSpinBox, QGroupBox, QFormLayout, QMessageBox, QStackedLayout)
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtMultimedia import QSoundEffect
-from PyQt6.QtCore import QUrl
+from PyQt6.QtCore import Qt, pyqtSignal, QThreadPool
 from stylesheets import Styles
-import os
-import sys
-
-def resource_path(relative_path):
-    """ Get absolute path to resource, works for dev and for PyInstaller """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-
-    return os.path.join(base_path, relative_path)
+from audio_bank import get_audio_bank, FOCUS_END
+from reminders import REMINDER_TYPES
+from settings_store import SCHEMA
 
 class SettingsWindow(QWidget):
     # Define signals for communicating with main app
     settingsSaved = pyqtSignal(dict)
     
-    def __init__(self, parent=None, current_settings=None):
+    def __init__(self, parent=None, current_settings=None, history=None):
         super().__init__(parent)
         self.settings = current_settings or {}
+        self.history = history  # SessionHistory for the statistics page (None if unavailable)
+        self.stats_task = None
         
         # Main layout
         settings_layout = QHBoxLayout(self)
@@ -66,6 +57,16 @@ class SettingsWindow(QWidget):
         self.system_button.setCheckable(True)
         left_panel_layout.addWidget(self.system_button)
 
+        self.reminders_button = QPushButton("Reminders")
+        self.reminders_button.setStyleSheet(Styles.SETTINGS_NAV_BUTTON)
+        self.reminders_button.setCheckable(True)
+        left_panel_layout.addWidget(self.reminders_button)
+
+        self.statistics_button = QPushButton("Statistics")
+        self.statistics_button.setStyleSheet(Styles.SETTINGS_NAV_BUTTON)
+        self.statistics_button.setCheckable(True)
+        left_panel_layout.addWidget(self.statistics_button)
+
         left_panel_layout.addStretch(1)  # Push everything to the top
         settings_layout.addWidget(left_panel)
 
@@ -123,6 +124,20 @@ class SettingsWindow(QWidget):
         sound_toggle_layout.addStretch()
         notification_layout.addLayout(sound_toggle_layout)
 
+        # Notification volume
+        sound_volume_layout = QHBoxLayout()
+        sound_volume_label = QLabel("Notification volume (%):")
+        sound_volume_label.setStyleSheet("font-size: 14px; color: #FFFFFF;")
+        self.sound_volume_spinbox = QSpinBox()
+        self.sound_volume_spinbox.setRange(0, 100)
+        self.sound_volume_spinbox.setSingleStep(10)
+        self.sound_volume_spinbox.setValue(self.settings.get('sound_volume', 50))
+        self.sound_volume_spinbox.setStyleSheet(Styles.SETTINGS_SPINBOX)
+        sound_volume_layout.addWidget(sound_volume_label)
+        sound_volume_layout.addWidget(self.sound_volume_spinbox)
+        sound_volume_layout.addStretch()
+        notification_layout.addLayout(sound_volume_layout)
+
         notification_layout.addStretch(1)
 
         # 3. SNOOZE SETTINGS PAGE
@@ -205,15 +220,98 @@ class SettingsWindow(QWidget):
         auto_start_layout.addWidget(self.auto_start_checkbox)
         auto_start_layout.addStretch()
         system_content_layout.addLayout(auto_start_layout)
+
+        # Low-memory mode: free the window after it has been hidden this long
+        unload_layout = QHBoxLayout()
+        unload_label = QLabel("Free memory when hidden for (minutes, 0 = never):")
+        unload_label.setStyleSheet("font-size: 14px; color: #FFFFFF;")
+        self.unload_spinbox = QSpinBox()
+        self.unload_spinbox.setRange(0, 1440)
+        self.unload_spinbox.setValue(self.settings.get('unload_after_minutes', 0))
+        self.unload_spinbox.setStyleSheet(Styles.SETTINGS_SPINBOX)
+        unload_layout.addWidget(unload_label)
+        unload_layout.addWidget(self.unload_spinbox)
+        unload_layout.addStretch()
+        system_content_layout.addLayout(unload_layout)
         
         system_layout.addLayout(system_content_layout)
         system_layout.addStretch(1)
 
+        # 5. REMINDERS PAGE
+        reminders_widget = QWidget()
+        reminders_layout = QVBoxLayout(reminders_widget)
+        reminders_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Reminders title
+        reminders_title = QLabel("Reminders")
+        reminders_title.setStyleSheet(Styles.SETTINGS_TITLE)
+        reminders_layout.addWidget(reminders_title)
+
+        # One interval per reminder type; they run alongside the focus sessions
+        reminders_content_layout = QVBoxLayout()
+        reminders_content_layout.setSpacing(15)
+        self.reminder_spinboxes = {}
+        for name, caption in (('eye_rest', "Eye rest, 20-20-20 (every N minutes, 0 = off):"),
+                              ('stretch', "Stretch (every N minutes, 0 = off):"),
+                              ('hydration', "Drink water (every N minutes, 0 = off):")):
+            key = REMINDER_TYPES[name][0]
+            reminder_layout = QHBoxLayout()
+            reminder_label = QLabel(caption)
+            reminder_label.setStyleSheet("font-size: 14px; color: #FFFFFF;")
+            spinbox = QSpinBox()
+            spinbox.setRange(*SCHEMA[key][2])
+            spinbox.setValue(self.settings.get(key, 0))
+            spinbox.setStyleSheet(Styles.SETTINGS_SPINBOX)
+            reminder_layout.addWidget(reminder_label)
+            reminder_layout.addWidget(spinbox)
+            reminder_layout.addStretch()
+            reminders_content_layout.addLayout(reminder_layout)
+            self.reminder_spinboxes[key] = spinbox
+
+        reminders_layout.addLayout(reminders_content_layout)
+        reminders_layout.addStretch(1)
+
+        # 6. STATISTICS PAGE
+        statistics_widget = QWidget()
+        statistics_layout = QVBoxLayout(statistics_widget)
+        statistics_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Statistics title
+        statistics_title = QLabel("Statistics")
+        statistics_title.setStyleSheet(Styles.SETTINGS_TITLE)
+        statistics_layout.addWidget(statistics_title)
+
+        # Figures are filled in when the page is opened
+        statistics_form = QFormLayout()
+        statistics_form.setSpacing(12)
+        self.stats_labels = {}
+        for key, caption in (('today', "Focus today:"),
+                             ('week', "Focus, last 7 days:"),
+                             ('compliance', "Breaks taken in full:"),
+                             ('snooze_rate', "Breaks snoozed:"),
+                             ('current_streak', "Current streak:"),
+                             ('longest_streak', "Longest streak:")):
+            caption_label = QLabel(caption)
+            caption_label.setStyleSheet("font-size: 14px; color: #FFFFFF;")
+            value_label = QLabel("-")
+            value_label.setStyleSheet("font-size: 14px; color: #FFFFFF;")
+            statistics_form.addRow(caption_label, value_label)
+            self.stats_labels[key] = value_label
+        statistics_layout.addLayout(statistics_form)
+
+        # Focus minutes per day, oldest first
+        self.stats_days_label = QLabel("")
+        self.stats_days_label.setStyleSheet("font-size: 12px; color: #AAAAAA; font-family: monospace;")
+        statistics_layout.addWidget(self.stats_days_label)
+        statistics_layout.addStretch(1)
+
         # Add all pages to the stacked widget
         self.settings_stack.addWidget(general_settings_widget)
         self.settings_stack.addWidget(notification_settings_widget)
         self.settings_stack.addWidget(snooze_settings_widget)
         self.settings_stack.addWidget(system_settings_widget)
+        self.settings_stack.addWidget(reminders_widget)
+        self.settings_stack.addWidget(statistics_widget)
         right_panel_layout.addLayout(self.settings_stack)
 
         # Save button at the bottom of right panel
@@ -228,16 +326,11 @@ class SettingsWindow(QWidget):
         self.notification_button.clicked.connect(lambda: self.switch_settings_page(1))
         self.snooze_button.clicked.connect(lambda: self.switch_settings_page(2))
         self.system_button.clicked.connect(lambda: self.switch_settings_page(3))
+        self.reminders_button.clicked.connect(lambda: self.switch_settings_page(4))
+        self.statistics_button.clicked.connect(lambda: self.switch_settings_page(5))
         
-        # Setup notification sound with proper error handling
-        try:
-            self.notification_sound = QSoundEffect(self)
-            self.notification_sound.setSource(QUrl.fromLocalFile(resource_path(r"dist\\assets\\sounds\\notification_001.wav")))
-            self.notification_sound.setLoopCount(1)
-            self.notification_sound.setVolume(0.5)
-        except Exception:
-            # If sound setup fails, continue without sound
-            self.notification_sound = None
+        # Shared notification sound (None if it could not be loaded)
+        self.notification_sound = get_audio_bank().handle(FOCUS_END)
         
         # Set initial values
         self.load_settings(self.settings)
@@ -254,6 +347,10 @@ class SettingsWindow(QWidget):
         self.snooze_button.setStyleSheet(Styles.SETTINGS_NAV_BUTTON)
         self.system_button.setChecked(False)
         self.system_button.setStyleSheet(Styles.SETTINGS_NAV_BUTTON)
+        self.reminders_button.setChecked(False)
+        self.reminders_button.setStyleSheet(Styles.SETTINGS_NAV_BUTTON)
+        self.statistics_button.setChecked(False)
+        self.statistics_button.setStyleSheet(Styles.SETTINGS_NAV_BUTTON)
         
         # Set active button based on index
         if index == 0:
@@ -268,6 +365,50 @@ class SettingsWindow(QWidget):
         elif index == 3:
             self.system_button.setChecked(True)
             self.system_button.setStyleSheet(Styles.SETTINGS_ACTIVE_NAV_BUTTON)
+        elif index == 4:
+            self.reminders_button.setChecked(True)
+            self.reminders_button.setStyleSheet(Styles.SETTINGS_ACTIVE_NAV_BUTTON)
+        elif index == 5:
+            self.statistics_button.setChecked(True)
+            self.statistics_button.setStyleSheet(Styles.SETTINGS_ACTIVE_NAV_BUTTON)
+            self.refresh_statistics()
+
+    def refresh_statistics(self):
+        """Recompute the statistics on the thread pool; the page fills in when done"""
+        if self.history is None:
+            self.stats_days_label.setText("Session history is not available.")
+            return
+        if self.stats_task is not None:
+            return  # Already computing
+        # numpy is only needed once statistics are actually requested
+        from session_stats import StatsTask
+        self.stats_task = StatsTask(self.history)
+        self.stats_task.signals.finished.connect(self.show_statistics)
+        self.stats_task.signals.failed.connect(self.statistics_failed)
+        QThreadPool.globalInstance().start(self.stats_task)
+
+    def show_statistics(self, stats):
+        self.stats_task = None
+
+        def percent(value):
+            return "-" if value is None else f"{value * 100:.0f}%"
+
+        def days(count):
+            return f"{count} day" if count == 1 else f"{count} days"
+
+        week = sum(stats['focus_minutes_per_day'])
+        self.stats_labels['today'].setText(f"{stats['focus_minutes_today']:.0f} min")
+        self.stats_labels['week'].setText(f"{week / 60:.1f} h")
+        self.stats_labels['compliance'].setText(percent(stats['break_compliance']))
+        self.stats_labels['snooze_rate'].setText(percent(stats['snooze_rate']))
+        self.stats_labels['current_streak'].setText(days(stats['current_streak']))
+        self.stats_labels['longest_streak'].setText(days(stats['longest_streak']))
+        self.stats_days_label.setText("Minutes per day: " + "  ".join(
+            f"{minutes:.0f}" for minutes in stats['focus_minutes_per_day']))
+
+    def statistics_failed(self, message):
+        self.stats_task = None
+        self.stats_days_label.setText(f"Could not compute statistics: {message}")
 
     def load_settings(self, settings):
         # Load values into UI elements
@@ -277,6 +418,9 @@ class SettingsWindow(QWidget):
         if 'sound_enabled' in settings:
             self.sound_checkbox.setChecked(settings['sound_enabled'])
 
+        if 'sound_volume' in settings:
+            self.sound_volume_spinbox.setValue(settings['sound_volume'])
+
         if 'snooze_enabled' in settings:
             self.snooze_checkbox.setChecked(settings['snooze_enabled'])
 
@@ -289,16 +433,27 @@ class SettingsWindow(QWidget):
         if 'auto_start' in settings:
             self.auto_start_checkbox.setChecked(settings['auto_start'])
 
+        if 'unload_after_minutes' in settings:
+            self.unload_spinbox.setValue(settings['unload_after_minutes'])
+
+        for key, spinbox in self.reminder_spinboxes.items():
+            if key in settings:
+                spinbox.setValue(settings[key])
+
     def save_settings(self):
         # Collect all settings
         new_settings = {
             'username': self.username_input.text().strip(),
             'sound_enabled': self.sound_checkbox.isChecked(),
+            'sound_volume': self.sound_volume_spinbox.value(),
             'snooze_enabled': self.snooze_checkbox.isChecked(),
             'snooze_time': self.snooze_time_spinbox.value(),
             'max_snooze_count': self.snooze_count_spinbox.value(),
-            'auto_start': self.auto_start_checkbox.isChecked()
+            'auto_start': self.auto_start_checkbox.isChecked(),
+            'unload_after_minutes': self.unload_spinbox.value()
         }
+        for key, spinbox in self.reminder_spinboxes.items():
+            new_settings[key] = spinbox.value()
         
         # Emit signal with new settings
         self.settingsSaved.emit(new_settings)
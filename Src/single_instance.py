@@ -0,0 +1,216 @@
+"""One Break Loop process per user.
+
+The first instance listens on a local socket: $XDG_RUNTIME_DIR/breakloop.sock
+on Linux (a per-user file in the temp directory when that is unset), a named
+pipe on Windows. A later launch connects, sends its request as one JSON line,
+waits for the reply and exits. The client side only uses the standard
+library, so main.py can run it before PyQt is imported.
+
+    main.py                  # bring the running window to the front
+    main.py --start-focus    # start a focus session in the running instance
+    main.py --take-break     # start a break now
+
+Requests are {"command": name} objects, answered by {"ok": true, ...} or
+{"ok": false, "error": message}, one per line. Connections may stay open
+for more requests; after "subscribe" the server also pushes event lines.
+control_api registers the full command set.
+"""
+import json
+import os
+import socket
+import sys
+import tempfile
+
+SHOW = "show"
+START_FOCUS = "start-focus"
+TAKE_BREAK = "take-break"
+PING = "ping"
+SUBSCRIBE = "subscribe"
+UNSUBSCRIBE = "unsubscribe"
+
+# Command line flags that become a request to the running instance
+COMMAND_FLAGS = {"--show": SHOW, "--start-focus": START_FOCUS, "--take-break": TAKE_BREAK}
+
+CONNECT_TIMEOUT = 0.5  # Seconds; a live instance answers in well under this
+
+# A subscriber that stops reading is dropped once this much is queued for it
+MAX_PENDING_BYTES = 256 * 1024
+
+
+def runtime_path(filename):
+    """Per-user path for a runtime file: in $XDG_RUNTIME_DIR, else a user-tagged name in the temp directory"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, filename)
+    if hasattr(os, "getuid"):
+        user = os.getuid()
+    else:
+        import getpass
+        user = getpass.getuser()
+    return os.path.join(tempfile.gettempdir(), f"{user}-{filename}")
+
+
+def server_name():
+    """Local socket name: a path on Unix, a pipe name on Windows"""
+    if sys.platform == "win32":
+        import getpass
+        return f"breakloop-{getpass.getuser()}"
+    return runtime_path("breakloop.sock")
+
+
+def command_from_argv(argv):
+    """The request named on the command line, or None"""
+    for arg in argv[1:]:
+        if arg in COMMAND_FLAGS:
+            return COMMAND_FLAGS[arg]
+    return None
+
+
+def connect(name=None, timeout=CONNECT_TIMEOUT):
+    """Binary stream to the running instance (socket timeout in seconds, None to
+    block); raises OSError if none is listening"""
+    name = name or server_name()
+    if sys.platform == "win32":
+        return open(r"\\.\pipe" + "\\" + name, "r+b", buffering=0)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(name)
+        return sock.makefile("rwb")
+    finally:
+        sock.close()  # The stream keeps the connection open
+
+
+def send_request(request, name=None, timeout=CONNECT_TIMEOUT):
+    """Send one request to the running instance; returns its reply, or None if none is running"""
+    line = (json.dumps(request) + "\n").encode("utf-8")
+    try:
+        with connect(name, timeout) as stream:
+            stream.write(line)
+            stream.flush()
+            reply = stream.readline()
+    except OSError:
+        return None  # No listener (or a stale socket file)
+    try:
+        return json.loads(reply)
+    except ValueError:
+        return None
+
+
+def forward_to_running_instance(argv):
+    """Hand this launch's request to a running instance; True if this process should exit"""
+    command = command_from_argv(argv) or SHOW
+    reply = send_request({"command": command})
+    if reply is None:
+        return False
+    if not reply.get("ok"):
+        print(f"Break Loop is already running but refused '{command}': {reply.get('error')}")
+    return True
+
+
+class InstanceServer:
+    """The first instance's end of the socket; commands are dispatched to registered handlers"""
+
+    def __init__(self, name=None):
+        from PyQt6.QtNetwork import QLocalServer
+        self.name = name or server_name()
+        self.handlers = {PING: lambda request: {"pid": os.getpid()}}
+        self.server = QLocalServer()
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self.server.newConnection.connect(self._accept)
+        self.clients = []
+        self.subscribers = []
+
+    def handle(self, command, handler):
+        """Register handler(request) -> dict of extra reply fields (or None)"""
+        self.handlers[command] = handler
+
+    def listen(self):
+        """Take the socket; False if another live instance already owns it"""
+        from PyQt6.QtNetwork import QLocalServer
+        if self.server.listen(self.name):
+            return True
+        if send_request({"command": PING}, self.name) is not None:
+            return False
+        # Left behind by an instance that crashed
+        QLocalServer.removeServer(self.name)
+        if self.server.listen(self.name):
+            return True
+        print(f"Warning: Could not listen on {self.name}: {self.server.errorString()}")
+        return True  # Run anyway, just without forwarding
+
+    def close(self):
+        for client in self.clients[:]:
+            client.disconnectFromServer()
+        self.server.close()
+
+    def _accept(self):
+        while self.server.hasPendingConnections():
+            client = self.server.nextPendingConnection()
+            self.clients.append(client)
+            client.readyRead.connect(lambda client=client: self._read(client))
+            client.disconnected.connect(lambda client=client: self._dropped(client))
+
+    def _dropped(self, client):
+        if client in self.clients:
+            self.clients.remove(client)
+        if client in self.subscribers:
+            self.subscribers.remove(client)
+        client.deleteLater()
+
+    def _read(self, client):
+        while client.canReadLine():
+            line = bytes(client.readLine()).strip()
+            if line:
+                try:
+                    reply = json.dumps(self.dispatch(line, client))
+                except Exception as e:
+                    # An exception escaping this slot would abort the whole app
+                    print(f"Error answering a control request: {e}")
+                    reply = json.dumps({"ok": False, "error": "internal error"})
+                client.write((reply + "\n").encode("utf-8"))
+        client.flush()
+
+    def broadcast(self, message):
+        """Push one event line to every subscriber (writes are buffered, never waited on)"""
+        if not self.subscribers:
+            return
+        line = (json.dumps(message) + "\n").encode("utf-8")
+        for client in self.subscribers[:]:
+            if client.bytesToWrite() > MAX_PENDING_BYTES:
+                print("Warning: Dropping a control subscriber that stopped reading")
+                self.subscribers.remove(client)
+                client.abort()
+                continue
+            client.write(line)
+            client.flush()
+
+    def dispatch(self, line, client=None):
+        """Run one request line; returns the reply dict"""
+        try:
+            request = json.loads(line)
+        except ValueError:
+            request = None
+        return self.execute(request, client)
+
+    def execute(self, request, client=None):
+        """Run a parsed request; returns the reply dict. Never raises, since it runs in a Qt slot"""
+        if not isinstance(request, dict) or not isinstance(request.get("command"), str):
+            return {"ok": False, "error": "expected a JSON object with a command"}
+        command = request["command"]
+        if command in (SUBSCRIBE, UNSUBSCRIBE) and client is not None:
+            if command == SUBSCRIBE and client not in self.subscribers:
+                self.subscribers.append(client)
+            elif command == UNSUBSCRIBE and client in self.subscribers:
+                self.subscribers.remove(client)
+            return {"ok": True}
+        handler = self.handlers.get(command)
+        if handler is None:
+            return {"ok": False, "error": f"unknown command: {command}"}
+        try:
+            reply = {"ok": True}
+            reply.update(handler(request) or {})
+            return reply
+        except Exception as e:
+            print(f"Error handling '{command}' request: {e}")
+            return {"ok": False, "error": str(e)}
@@ -0,0 +1,69 @@
+"""Startup phase timing for `main.py --profile-startup`.
+
+Phases are opened with begin(name) and closed with end(name); they may nest.
+When profiling is off every call is a cheap no-op.
+"""
+import sys
+import time
+
+# Default time-to-first-tray-icon budget in milliseconds
+DEFAULT_BUDGET_MS = 1500
+
+
+class StartupProfiler:
+    def __init__(self, enabled=False, budget_ms=DEFAULT_BUDGET_MS):
+        self.enabled = enabled
+        self.budget_ms = budget_ms
+        self.started = time.perf_counter()
+        self.phases = []  # (depth, name, duration ms) in completion order
+        self._open = []  # Stack of (name, start time, index in phases)
+
+    def begin(self, name):
+        if not self.enabled:
+            return
+        # Reserve the slot now so the report lists phases in start order
+        self.phases.append(None)
+        self._open.append((name, time.perf_counter(), len(self.phases) - 1))
+
+    def end(self, name):
+        if not self.enabled:
+            return
+        while self._open:
+            open_name, start, index = self._open.pop()
+            self.phases[index] = (len(self._open), open_name, (time.perf_counter() - start) * 1000)
+            if open_name == name:
+                break
+
+    def total_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def report(self, stream=None):
+        """Print the phase table; returns True if startup fit in the budget"""
+        stream = stream or sys.stderr
+        total = self.total_ms()
+        within_budget = total <= self.budget_ms
+        print(f"Startup profile (budget {self.budget_ms:.0f} ms)", file=stream)
+        for phase in self.phases:
+            if phase is None:
+                continue
+            depth, name, duration = phase
+            label = "  " * (depth + 1) + name
+            print(f"{label:<34}{duration:>9.1f} ms", file=stream)
+        status = "OK" if within_budget else "OVER BUDGET"
+        print(f"{'  time to first tray icon':<34}{total:>9.1f} ms  {status}", file=stream)
+        return within_budget
+
+
+def _parse_budget(argv):
+    """Read --startup-budget MS from the command line"""
+    if "--startup-budget" in argv:
+        try:
+            return float(argv[argv.index("--startup-budget") + 1])
+        except (IndexError, ValueError):
+            print("Warning: --startup-budget expects a number of milliseconds")
+    return DEFAULT_BUDGET_MS
+
+
+# Process-wide profiler, enabled from the command line before anything heavy is imported
+profiler = StartupProfiler(enabled="--profile-startup" in sys.argv,
+                           budget_ms=_parse_budget(sys.argv))
@@ -0,0 +1,193 @@
+"""Break Loop's current state in a small memory-mapped file, for status bars.
+
+waybar, polybar, tmux and friends poll every second. Rather than open the
+control socket each time, they read $XDG_RUNTIME_DIR/breakloop.status, a
+fixed 64-byte record that the running instance updates in place through
+mmap. It is rewritten only when the session changes (transitions, and after
+a suspend has been reconciled), never per tick: the record holds the
+wall-clock deadline and readers work out the countdown themselves.
+
+Layout, little-endian:
+
+    0   8s  magic b"BLSTAT\\0\\0"
+    8   I   format version
+    12  I   sequence - odd while an update is in progress
+    16  B   state (0 idle, 1 focus, 2 break, 3 snooze)
+    17  B   paused
+    18  B   snooze count
+    19  B   reserved
+    20  I   session duration in seconds
+    24  d   deadline, Unix time (0 when idle or paused)
+    32  d   remaining seconds while paused
+    40  d   Unix time of this update
+
+Readers use the sequence as a seqlock: read it, read the record, read it
+again, and retry if it was odd or changed. read_status() does this.
+
+    python Src/status_file.py            # "focus 12:34", "break 03:10 (paused)", "idle"
+    python Src/status_file.py --json
+"""
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+
+from session_engine import IDLE, FOCUS, BREAK, SNOOZE
+from single_instance import runtime_path
+
+STATUS_FILE = "breakloop.status"
+MAGIC = b"BLSTAT\0\0"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<8sII")
+RECORD = struct.Struct("<BBBBIddd")
+SEQUENCE_OFFSET = 12
+FILE_SIZE = 64
+
+STATE_CODES = {IDLE: 0, FOCUS: 1, BREAK: 2, SNOOZE: 3}
+STATE_NAMES = {code: state for state, code in STATE_CODES.items()}
+
+READ_RETRIES = 100
+
+
+def status_path():
+    return runtime_path(STATUS_FILE)
+
+
+class StatusPublisher:
+    """Mirrors the engine's state into the status file; the running instance owns one"""
+
+    def __init__(self, engine, path=None, schedule=None):
+        self.engine = engine
+        self.path = path or status_path()
+        # Deferred publish after a suspend, once the engine has reconciled the session
+        self.schedule = schedule
+        self.sequence = 0
+        self.writes = 0
+        self._last = None
+        self._map = None
+        self._file = None
+        try:
+            self._create()
+        except Exception as e:
+            print(f"Warning: Could not create status file {self.path}: {e}")
+            return
+        self.publish()
+        engine.subscribe("transition", self.on_transition)
+        engine.subscribe("suspend", self.on_suspend)
+
+    def _create(self):
+        # Build the file beside its final name and rename it in, so a reader never
+        # sees a short file; the mapping then keeps it current in place
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0).ljust(FILE_SIZE, b"\0"))
+        os.replace(temp_path, self.path)
+        self._file = open(self.path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), FILE_SIZE)
+
+    def on_transition(self, engine, old_state, new_state, trigger):
+        self.publish()
+
+    def on_suspend(self, engine, gap, state, policy):
+        # The suspend event comes before the engine adjusts its deadline
+        if self.schedule is not None:
+            self.schedule(0, self.publish)
+
+    def publish(self):
+        """Write the engine's state if it differs from what the file already says"""
+        if self._map is None:
+            return
+        engine = self.engine
+        running = engine.state != IDLE and not engine.paused
+        deadline = time.time() + engine.remaining() if running else 0.0
+        paused_remaining = engine.remaining() if engine.paused else 0.0
+        values = (STATE_CODES.get(engine.state, 0), int(engine.paused), min(engine.snooze_count, 255), 0,
+                  int(engine.duration))
+        # Deadlines recomputed from the monotonic clock wobble by microseconds; ignore that
+        key = values + (round(deadline, 1), round(paused_remaining, 1))
+        if key == self._last:
+            return
+        self._last = key
+        record = RECORD.pack(*values, deadline, paused_remaining, time.time())
+        self.sequence += 1  # Odd: update in progress
+        self._map[SEQUENCE_OFFSET:SEQUENCE_OFFSET + 4] = struct.pack("<I", self.sequence)
+        self._map[HEADER.size:HEADER.size + RECORD.size] = record
+        self.sequence += 1
+        self._map[SEQUENCE_OFFSET:SEQUENCE_OFFSET + 4] = struct.pack("<I", self.sequence)
+        self.writes += 1
+
+    def close(self, remove=True):
+        """Unmap the file; removing it tells readers nothing is running"""
+        if self._map is None:
+            return
+        self.engine.unsubscribe("transition", self.on_transition)
+        self.engine.unsubscribe("suspend", self.on_suspend)
+        self._map.close()
+        self._file.close()
+        self._map = self._file = None
+        if remove:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+def read_status(path=None, now=None):
+    """Current status as a dict (with the remaining time worked out), or None if not running"""
+    path = path or status_path()
+    try:
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), FILE_SIZE, access=mmap.ACCESS_READ) as view:
+                for _ in range(READ_RETRIES):
+                    magic, version, before = HEADER.unpack_from(view, 0)
+                    if magic != MAGIC or version != FORMAT_VERSION:
+                        return None
+                    if before % 2 == 0:
+                        record = RECORD.unpack_from(view, HEADER.size)
+                        if HEADER.unpack_from(view, 0)[2] == before:
+                            break
+                    time.sleep(0)  # Writer is mid-update; let it finish
+                else:
+                    return None
+    except (OSError, ValueError):
+        return None
+
+    state, paused, snooze_count, _, duration, deadline, paused_remaining, updated = record
+    now = time.time() if now is None else now
+    if paused:
+        remaining = paused_remaining
+    elif deadline:
+        remaining = max(0.0, deadline - now)
+    else:
+        remaining = 0.0
+    return {"state": STATE_NAMES.get(state, IDLE), "paused": bool(paused), "snooze_count": snooze_count,
+            "duration": duration, "deadline": deadline or None, "remaining": remaining, "updated": updated}
+
+
+def format_status(status):
+    """One line for a status bar"""
+    if status is None:
+        return "not running"
+    if status["state"] == IDLE:
+        return IDLE
+    # Count down like the app does: 0.2 s left still shows 00:01
+    minutes, seconds = divmod(math.ceil(status["remaining"]), 60)
+    text = f"{status['state']} {minutes:02d}:{seconds:02d}"
+    return text + " (paused)" if status["paused"] else text
+
+
+def main(argv):
+    status = read_status()
+    if "--json" in argv:
+        print(json.dumps(status))
+    else:
+        print(format_status(status))
+    return 0 if status is not None else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
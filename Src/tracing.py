@@ -0,0 +1,157 @@
+"""Opt-in tracing of Break Loop's hot paths in Chrome trace-event format.
+
+Enable with `--trace [PATH]` on the command line or BREAKLOOP_TRACE=PATH
+(BREAKLOOP_TRACE=1 picks a default path under ~/.breakloop). The trace is
+written when the app exits and can be opened in chrome://tracing or
+https://ui.perfetto.dev.
+
+Tracing is decided once at startup. When it is off, @traced returns the
+function unchanged and span() hands back a shared no-op, so the wrapped code
+runs exactly as before.
+"""
+import atexit
+from collections import deque
+from functools import wraps
+import json
+import os
+import sys
+import threading
+import time
+
+ENV_VAR = "BREAKLOOP_TRACE"
+
+# Oldest events are dropped beyond this many
+MAX_EVENTS = 200000
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.complete(self.name, self.start, time.perf_counter(), self.args)
+        return False
+
+
+class Tracer:
+    def __init__(self, path=None):
+        self.enabled = path is not None
+        self.path = path
+        self.events = deque(maxlen=MAX_EVENTS)
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self._threads = {}  # Thread id -> name, for the metadata events
+
+    def _tid(self):
+        tid = threading.get_ident()
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+        return tid
+
+    def complete(self, name, start, end, args=None):
+        """Record a finished span (perf_counter start/end)"""
+        event = {"name": name, "cat": "breakloop", "ph": "X", "pid": self.pid, "tid": self._tid(),
+                 "ts": (start - self.origin) * 1e6, "dur": (end - start) * 1e6}
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def instant(self, name, args=None):
+        """Record a point-in-time event"""
+        if not self.enabled:
+            return
+        event = {"name": name, "cat": "breakloop", "ph": "i", "s": "p", "pid": self.pid,
+                 "tid": self._tid(), "ts": (time.perf_counter() - self.origin) * 1e6}
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def span(self, name, **args):
+        """Context manager timing a block (a shared no-op when disabled)"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def traced(self, name=None):
+        """Decorator timing every call; leaves the function untouched when disabled"""
+        def decorate(func):
+            if not self.enabled:
+                return func
+            span_name = name or func.__qualname__
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.complete(span_name, start, time.perf_counter())
+            return wrapper
+        return decorate
+
+    def write(self, path=None):
+        """Write the Chrome trace JSON; returns the path or None"""
+        path = path or self.path
+        if not self.enabled or not path:
+            return None
+        metadata = [{"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid,
+                     "args": {"name": thread_name}} for tid, thread_name in self._threads.items()]
+        document = {"traceEvents": metadata + list(self.events), "displayTimeUnit": "ms"}
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(document, f)
+            print(f"Trace written to {path}")
+            return path
+        except Exception as e:
+            print(f"Error writing trace to {path}: {e}")
+            return None
+
+
+def _default_path():
+    directory = os.path.join(os.path.expanduser("~"), ".breakloop")
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        directory = "."
+    return os.path.join(directory, time.strftime("trace-%Y%m%d-%H%M%S.json"))
+
+
+def _trace_path(argv, environ):
+    """Trace output path from --trace [PATH] or BREAKLOOP_TRACE, or None when tracing is off"""
+    if "--trace" in argv:
+        index = argv.index("--trace")
+        if index + 1 < len(argv) and not argv[index + 1].startswith("-"):
+            return argv[index + 1]
+        return _default_path()
+    value = environ.get(ENV_VAR, "")
+    if value in ("", "0"):
+        return None
+    return _default_path() if value == "1" else value
+
+
+# Process-wide tracer, configured before any traced module is imported
+tracer = Tracer(_trace_path(sys.argv, os.environ))
+traced = tracer.traced
+span = tracer.span
+
+if tracer.enabled:
+    atexit.register(tracer.write)
@@ -0,0 +1,156 @@
+"""Event-loop stall watchdog for Break Loop.
+
+A background thread posts a heartbeat to the GUI thread once a second. If
+the Qt event loop has not answered it within the stall threshold, the
+watchdog grabs the GUI thread's Python stack through sys._current_frames()
+and writes it to ~/.breakloop/watchdog.log, a size-rotated log. While the
+stall lasts, another stack is taken every threshold (up to MAX_SAMPLES), and
+a final line records how long the freeze was.
+
+The threshold comes from BREAKLOOP_WATCHDOG_MS (default 2000); 0 turns the
+watchdog off.
+"""
+import logging
+from logging.handlers import RotatingFileHandler
+import os
+import sys
+import threading
+import time
+import traceback
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from settings_store import get_app_dir
+from tracing import tracer
+
+ENV_VAR = "BREAKLOOP_WATCHDOG_MS"
+DEFAULT_THRESHOLD_MS = 2000
+HEARTBEAT_INTERVAL_MS = 1000
+
+LOG_FILE = "watchdog.log"
+LOG_MAX_BYTES = 512 * 1024
+LOG_BACKUPS = 3
+
+# Stacks written per stall; a long freeze usually repeats the same stack
+MAX_SAMPLES = 5
+
+
+class _Heartbeat(QObject):
+    """Lives on the GUI thread and answers pings from the watchdog thread"""
+    ping = pyqtSignal(int)
+
+    def __init__(self):
+        super().__init__()
+        self.answered = 0
+        # Emitted from the watchdog thread, so Qt queues the call onto the GUI thread
+        self.ping.connect(self.pong)
+
+    def pong(self, sequence):
+        self.answered = sequence
+
+
+class Watchdog:
+    def __init__(self, threshold_ms=DEFAULT_THRESHOLD_MS, interval_ms=HEARTBEAT_INTERVAL_MS, log_path=None):
+        """Create on the GUI thread, after the QApplication"""
+        self.threshold = threshold_ms / 1000
+        self.interval = interval_ms / 1000
+        self.gui_thread_id = threading.get_ident()
+        self.heartbeat = _Heartbeat()
+        self.stalls = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+        if log_path is None:
+            app_dir = get_app_dir()
+            log_path = os.path.join(app_dir, LOG_FILE) if app_dir else LOG_FILE
+        self.log_path = log_path
+        self.log = logging.getLogger(f"breakloop.watchdog.{id(self)}")
+        self.log.propagate = False
+        self.log.setLevel(logging.INFO)
+        try:
+            handler = RotatingFileHandler(log_path, maxBytes=LOG_MAX_BYTES,
+                                          backupCount=LOG_BACKUPS, encoding="utf-8", delay=True)
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            self.log.addHandler(handler)
+        except Exception as e:
+            print(f"Warning: Could not open watchdog log {log_path}: {e}")
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="breakloop-watchdog", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.interval + 1)
+        self._thread = None
+        for handler in self.log.handlers[:]:
+            handler.close()
+            self.log.removeHandler(handler)
+
+    def gui_stack(self):
+        """The GUI thread's current Python stack as text (empty if it is not running Python code)"""
+        frame = sys._current_frames().get(self.gui_thread_id)
+        if frame is None:
+            return ""
+        return "".join(traceback.format_stack(frame))
+
+    def _run(self):
+        sequence = 0
+        while not self._stop.is_set():
+            sequence += 1
+            sent = time.monotonic()
+            self.heartbeat.ping.emit(sequence)
+
+            samples = 0
+            next_sample = sent + self.threshold
+            while self.heartbeat.answered < sequence and not self._stop.is_set():
+                now = time.monotonic()
+                if now >= next_sample:
+                    if samples < MAX_SAMPLES:
+                        self._report_stall(now - sent, samples)
+                    samples += 1
+                    next_sample = now + self.threshold
+                self._stop.wait(min(0.05, self.threshold / 4))
+
+            if samples:
+                duration_ms = (time.monotonic() - sent) * 1000
+                self.log.warning(f"Event loop recovered after {duration_ms:.0f} ms")
+                print(f"Warning: GUI event loop was blocked for {duration_ms:.0f} ms (see {self.log_path})")
+            self._stop.wait(self.interval)
+
+    def _report_stall(self, blocked, sample):
+        if sample == 0:
+            self.stalls += 1
+            tracer.instant("event loop stall")
+        self.log.warning(f"Event loop blocked for {blocked * 1000:.0f} ms "
+                         f"(stall {self.stalls}, sample {sample + 1}), GUI thread stack:\n"
+                         f"{self.gui_stack() or '  <no Python frames - blocked in native code>'}")
+
+
+def threshold_from_env(environ=os.environ):
+    """Stall threshold in ms from BREAKLOOP_WATCHDOG_MS; 0 when the watchdog is off"""
+    value = environ.get(ENV_VAR, "")
+    if value == "":
+        return DEFAULT_THRESHOLD_MS
+    try:
+        return max(0, int(value))
+    except ValueError:
+        print(f"Warning: Ignoring invalid {ENV_VAR}={value!r}")
+        return DEFAULT_THRESHOLD_MS
+
+
+def start_watchdog(app):
+    """Start the watchdog for `app` unless disabled; returns it or None"""
+    threshold_ms = threshold_from_env()
+    if not threshold_ms:
+        return None
+    try:
+        watchdog = Watchdog(threshold_ms)
+        watchdog.start()
+        app.aboutToQuit.connect(watchdog.stop)
+        return watchdog
+    except Exception as e:
+        print(f"Warning: Could not start the event loop watchdog: {e}")
+        return None
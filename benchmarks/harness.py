@@ -0,0 +1,165 @@
+"""Shared setup, timing and reporting for the BreakLoop benchmark scripts.
+
+Benchmarks run against a throwaway home directory so they never touch the
+real ~/.breakloop settings or history, and under the offscreen Qt platform
+unless QT_QPA_PLATFORM is already set.
+"""
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(BENCH_DIR), "Src")
+
+# A metric regresses when its median exceeds baseline * threshold ...
+DEFAULT_THRESHOLD = 1.25
+# ... and the difference is larger than timer noise
+NOISE_FLOOR_MS = 0.05
+
+
+def setup_environment():
+    """Point Qt at the offscreen platform, isolate HOME and make Src importable"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    home = os.environ.get("BREAKLOOP_BENCH_HOME") or tempfile.mkdtemp(prefix="breakloop-bench-")
+    os.environ["BREAKLOOP_BENCH_HOME"] = home  # Child processes share it
+    os.environ["HOME"] = home
+    os.environ["USERPROFILE"] = home
+    if SRC_DIR not in sys.path:
+        sys.path.insert(0, SRC_DIR)
+    return home
+
+
+def resident_memory_mb():
+    """Resident set size of this process in MB (Linux only; None elsewhere)"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def percentile(ordered, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def summarize(samples, unit="ms"):
+    ordered = sorted(samples)
+    return {
+        "unit": unit,
+        "runs": len(ordered),
+        "median": statistics.median(ordered),
+        "p95": percentile(ordered, 95),
+        "p99": percentile(ordered, 99),
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+
+
+def measure(func, repeat=50, warmup=3, setup=None, teardown=None):
+    """Time func() in milliseconds; setup/teardown run outside the timed region"""
+    samples = []
+    for i in range(warmup + repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter() - start) * 1000
+        if teardown:
+            teardown()
+        if i >= warmup:
+            samples.append(elapsed)
+    return summarize(samples)
+
+
+def environment_info():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "qt_platform": os.environ.get("QT_QPA_PLATFORM"),
+    }
+
+
+def write_results(path, results, suite):
+    document = {
+        "suite": suite,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": environment_info(),
+        "results": results,
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+    return document
+
+
+def load_results(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("results", {})
+    except FileNotFoundError:
+        return None
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD, stream=None):
+    """Print results next to the baseline; returns the names that regressed.
+
+    Lower is better for every metric; the noise floor only applies to milliseconds.
+    """
+    stream = stream or sys.stdout
+    regressions = []
+    print(f"{'benchmark':<34}{'median':>11}{'p95':>11}{'baseline':>11}  change", file=stream)
+    for name, result in results.items():
+        median = result["median"]
+        unit = result.get("unit", "ms")
+        line = f"{name:<34}{median:>9.3f}{unit:>2}{result['p95']:>9.3f}{unit:>2}"
+        reference = (baseline or {}).get(name)
+        if reference is None:
+            print(line + f"{'-':>11}", file=stream)
+            continue
+        base = reference["median"]
+        change = (median / base - 1) * 100 if base else 0.0
+        regressed = median > base * threshold and (unit != "ms" or median - base > NOISE_FLOOR_MS)
+        if regressed:
+            regressions.append(name)
+        print(line + f"{base:>9.3f}{unit:>2}  {change:+6.1f}%{'  REGRESSION' if regressed else ''}", file=stream)
+    return regressions
+
+
+def add_common_arguments(parser, default_output, default_baseline):
+    parser.add_argument("--output", default=default_output,
+                        help="where to write the JSON results (default: %(default)s)")
+    parser.add_argument("--baseline", default=default_baseline,
+                        help="baseline results to compare against (default: %(default)s)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="also store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="fail when a median exceeds baseline x threshold (default: %(default)s)")
+
+
+def finish(args, results, suite):
+    """Write results, compare against the baseline and return the exit status"""
+    write_results(args.output, results, suite)
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+    regressions = compare(results, baseline, args.threshold)
+    print(f"Results written to {args.output}")
+    if args.save_baseline:
+        write_results(args.baseline, results, suite)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
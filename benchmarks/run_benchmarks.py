@@ -0,0 +1,327 @@
+"""Benchmarks for BreakLoop's hot paths under the offscreen Qt platform.
+
+    python benchmarks/run_benchmarks.py                  # run, compare to baseline
+    python benchmarks/run_benchmarks.py --save-baseline  # record a new baseline
+    python benchmarks/run_benchmarks.py --only update_timer,show_break_overlay
+
+Results go to benchmarks/results/latest.json. The exit status is 1 when any
+benchmark is slower than the stored baseline by more than --threshold.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from harness import (BENCH_DIR, setup_environment, measure, summarize, add_common_arguments, finish,
+                     resident_memory_mb)
+
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, "results", "latest.json")
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+
+
+def startup_child():
+    """Run in a fresh interpreter: import, construct and show TimerApp once"""
+    start = time.perf_counter()
+    setup_environment()
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication(sys.argv[:1])
+    import main
+    window = main.TimerApp()
+    window.show()
+    app.processEvents()
+    print(json.dumps({"startup_ms": (time.perf_counter() - start) * 1000}))
+    window.quit_app()
+
+
+def memory_child():
+    """Run in a fresh interpreter: resident memory with the full window loaded, then unloaded"""
+    setup_environment()
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication(sys.argv[:1])
+    import main
+    window = main.TimerApp()
+    window.show()
+    # Everything a day of use builds: the mini window and the settings page
+    window.minimize_to_mini()
+    app.processEvents()
+    window.show_from_mini()
+    window.open_settings()
+    app.processEvents()
+    window.show_main_view()
+    app.processEvents()
+    loaded = resident_memory_mb()
+    window.hide()
+    window.unload_window()
+    app.processEvents()
+    unloaded = resident_memory_mb()
+    print(json.dumps({"loaded": loaded, "unloaded": unloaded}))
+    window.quit_app()
+
+
+def main_module():
+    import main
+    return main
+
+
+class Benchmarks:
+    def __init__(self, repeat):
+        from PyQt6.QtWidgets import QApplication
+        self.app = QApplication.instance() or QApplication(sys.argv[:1])
+        self.repeat = repeat
+        self.window = None
+        self.memory = None
+
+    def process(self):
+        self.app.processEvents()
+
+    def new_window(self, clock=None):
+        import main
+        window = main.TimerApp(clock=clock)
+        window.show()
+        self.process()
+        return window
+
+    def close_window(self, window):
+        window.stop_focus_session()
+        window.close_break_overlay(fade=False)
+        if window.history is not None:
+            window.history.close()
+        if window.mini_window is not None:
+            window.mini_window.close()
+        window.tray_icon.hide()
+        window.hide()
+        window.deleteLater()
+        self.process()
+
+    def main_window(self):
+        """Shared TimerApp driven by a virtual clock"""
+        if self.window is None:
+            from clock import VirtualClock
+            self.clock = VirtualClock()
+            self.window = self.new_window(self.clock)
+        return self.window
+
+    def to_idle(self):
+        window = self.main_window()
+        window.stop_focus_session()
+        window.close_break_overlay(fade=False)
+        self.process()
+
+    def to_break(self):
+        self.to_idle()
+        self.window.take_break_now()
+        self.process()
+
+    # ---------- Benchmarks ----------
+
+    def cold_startup(self):
+        samples = []
+        for _ in range(max(3, self.repeat // 10)):
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), "--startup-child"],
+                                    capture_output=True, text=True, check=True).stdout
+            # The last line is the measurement; anything before it is app output
+            samples.append(json.loads(output.strip().splitlines()[-1])["startup_ms"])
+        return summarize(samples)
+
+    def memory_sample(self):
+        """RSS of a fresh app before and after the low-memory unload (one child run for both)"""
+        if self.memory is None:
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), "--memory-child"],
+                                    capture_output=True, text=True, check=True).stdout
+            self.memory = json.loads(output.strip().splitlines()[-1])
+        return self.memory
+
+    def resident_memory_loaded(self):
+        return summarize([self.memory_sample()["loaded"] or 0.0], unit="MB")
+
+    def resident_memory_unloaded(self):
+        return summarize([self.memory_sample()["unloaded"] or 0.0], unit="MB")
+
+    def window_reopen(self):
+        """Showing the window again after the low-memory unload freed it"""
+        window = self.main_window()
+        self.to_idle()
+
+        def unload():
+            window.hide()
+            window.unload_window()
+            self.process()
+
+        def reopen():
+            window.show()
+            self.process()
+
+        return measure(reopen, repeat=self.repeat, setup=unload)
+
+    def warm_startup(self):
+        # The warmup run pays for the imports - the timed runs measure construction only
+        windows = []
+        return measure(lambda: windows.append(self.new_window()),
+                       repeat=max(5, self.repeat // 5), warmup=1,
+                       teardown=lambda: self.close_window(windows.pop()))
+
+    def update_timer(self):
+        window = self.main_window()
+        self.to_idle()
+        window.focus_hours.setValue(8)
+        window.start_focus_session()
+
+        def tick():
+            self.clock.current += 1.0
+            window.update_timer()
+
+        result = measure(tick, repeat=self.repeat * 10, warmup=5, teardown=self.process)
+        window.focus_hours.setValue(0)
+        return result
+
+    def show_break_overlay(self):
+        window = self.main_window()
+        self.to_break()
+
+        def show():
+            window.show_break_overlay()
+            self.process()
+
+        return measure(show, repeat=self.repeat, setup=lambda: (window.close_break_overlay(fade=False),
+                                                                 self.process()))
+
+    def end_break_overlay(self):
+        window = self.main_window()
+
+        def end():
+            window.end_break_overlay()
+            self.process()
+
+        return measure(end, repeat=self.repeat, setup=self.to_break)
+
+    def handle_snooze_request(self):
+        window = self.main_window()
+
+        def snooze():
+            window.handle_snooze_request(1)
+            self.process()
+
+        return measure(snooze, repeat=self.repeat, setup=self.to_break)
+
+    def settings_open(self):
+        window = self.main_window()
+        self.to_idle()
+
+        def open_settings():
+            window.open_settings()
+            self.process()
+
+        def close_settings():
+            window.show_main_view()
+            self.process()
+
+        return measure(open_settings, repeat=self.repeat, teardown=close_settings)
+
+    def settings_close(self):
+        window = self.main_window()
+        self.to_idle()
+
+        def open_settings():
+            window.open_settings()
+            self.process()
+
+        def close_settings():
+            window.show_main_view()
+            self.process()
+
+        return measure(close_settings, repeat=self.repeat, setup=open_settings)
+
+    def mini_window_toggle(self):
+        window = self.main_window()
+
+        def toggle():
+            window.minimize_to_mini()
+            self.process()
+            window.show_from_mini()
+            self.process()
+
+        return measure(toggle, repeat=self.repeat)
+
+    def count_wakeups(self, hidden):
+        """Timer wakeups during a one-hour focus session, following the app's own timer"""
+        window = self.main_window()
+        self.to_idle()
+        minutes = window.focus_minutes.value()
+        window.focus_hours.setValue(1)
+        window.focus_minutes.setValue(0)
+        window.start_focus_session()
+        if hidden:
+            window.hide()
+        else:
+            window.show()
+        self.process()
+        start = window.wakeups
+        while window.engine.state == main_module().FOCUS:
+            # Jump straight to the moment the next timer was armed for
+            self.clock.step()
+        count = window.wakeups - start
+        window.focus_hours.setValue(0)
+        window.focus_minutes.setValue(minutes)
+        window.show()
+        self.process()
+        return summarize([count], unit="wakeups")
+
+    def wakeups_per_hour_visible(self):
+        return self.count_wakeups(hidden=False)
+
+    def wakeups_per_hour_hidden(self):
+        return self.count_wakeups(hidden=True)
+
+
+BENCHMARKS = [
+    "cold_startup",
+    "warm_startup",
+    "update_timer",
+    "show_break_overlay",
+    "end_break_overlay",
+    "handle_snooze_request",
+    "settings_open",
+    "settings_close",
+    "mini_window_toggle",
+    "window_reopen",
+    "wakeups_per_hour_visible",
+    "wakeups_per_hour_hidden",
+    "resident_memory_loaded",
+    "resident_memory_unloaded",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_common_arguments(parser, DEFAULT_OUTPUT, DEFAULT_BASELINE)
+    parser.add_argument("--repeat", type=int, default=50, help="timed runs per benchmark")
+    parser.add_argument("--only", help="comma-separated benchmark names")
+    parser.add_argument("--startup-child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--memory-child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.startup_child:
+        startup_child()
+        return 0
+    if args.memory_child:
+        memory_child()
+        return 0
+
+    setup_environment()
+    names = args.only.split(",") if args.only else BENCHMARKS
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    bench = Benchmarks(args.repeat)
+    results = {}
+    for name in names:
+        print(f"Running {name}...", file=sys.stderr)
+        results[name] = getattr(bench, name)()
+    return finish(args, results, "app")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
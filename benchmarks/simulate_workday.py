@@ -0,0 +1,148 @@
+"""Simulated workday: the full focus -> break -> snooze -> focus loop on virtual time.
+
+    python benchmarks/simulate_workday.py                # 9 h of 15/3 min cycles
+    python benchmarks/simulate_workday.py --hours 40 --visible
+
+TimerApp runs under the offscreen Qt platform with a VirtualClock. Breaks are
+snoozed or ended early at random (seeded), the 3 s auto-start delay and the
+settings writes run on the same virtual clock, and the whole day should take
+well under a second of real time. Exits non-zero if the lifecycle goes wrong,
+the run is over --budget-ms, or it regresses against the stored baseline.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+from harness import BENCH_DIR, setup_environment, summarize, add_common_arguments, finish
+
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, "results", "workday.json")
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline_workday.json")
+
+
+class Workday:
+    def __init__(self, args):
+        from PyQt6.QtWidgets import QApplication
+        from clock import VirtualClock
+        import session_engine
+        import main
+
+        self.app = QApplication.instance() or QApplication(sys.argv[:1])
+        self.states = session_engine
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.clock = VirtualClock()
+        self.window = main.TimerApp(clock=self.clock, min_session_seconds=0)
+        self.window.settings['snooze_enabled'] = True
+        self.window.focus_hours.setValue(0)
+        self.window.focus_minutes.setValue(args.focus_minutes)
+        self.window.focus_seconds.setValue(0)
+        self.window.break_hours.setValue(0)
+        self.window.break_minutes.setValue(args.break_minutes)
+        self.window.break_seconds.setValue(0)
+        if args.visible:
+            self.window.show()
+        else:
+            self.window.hide()
+
+        self.counts = {"focus_completed": 0, "breaks": 0, "breaks_completed": 0,
+                       "breaks_ended_early": 0, "snoozes": 0, "suspends": 0}
+        self.errors = []
+        self.transitions = 0
+        self.window.engine.subscribe("transition", self.on_transition)
+        self.window.engine.subscribe("suspend", lambda *args: self.count("suspends"))
+
+    def count(self, name):
+        self.counts[name] += 1
+
+    def on_transition(self, engine, old_state, new_state, trigger):
+        s = self.states
+        self.transitions += 1
+        if trigger == s.EXPIRE and old_state == s.FOCUS:
+            self.count("focus_completed")
+            if new_state != s.BREAK:
+                self.errors.append(f"focus expired into {new_state}")
+        if trigger == s.EXPIRE and old_state == s.BREAK:
+            self.count("breaks_completed")
+        if trigger == s.END_BREAK:
+            self.count("breaks_ended_early")
+        if trigger == s.SNOOZE_BREAK:
+            self.count("snoozes")
+
+        if new_state == s.BREAK:
+            if old_state != s.SNOOZE:
+                self.count("breaks")
+            if not self.window.break_overlays.isVisible():
+                self.errors.append("break started without the overlay")
+            self.react_to_break(engine)
+
+    def react_to_break(self, engine):
+        """Snooze or cut the break short the way a user might"""
+        max_snoozes = self.window.settings.get('max_snooze_count', 3)
+        roll = self.random.random()
+        if roll < self.args.snooze_rate and engine.snooze_count < max_snoozes:
+            self.clock.call_later(self.random.randint(1000, 20000),
+                                  lambda: self.window.handle_snooze_request(1))
+        elif roll < self.args.snooze_rate + self.args.early_end_rate:
+            self.clock.call_later(self.random.randint(30000, 120000), self.window.end_break_overlay)
+
+    def run(self):
+        end = self.args.hours * 3600
+        self.window.start_focus_session()
+        start = time.perf_counter()
+        processed = 0
+        while self.clock.current < end:
+            if self.args.suspend_rate and self.random.random() < self.args.suspend_rate:
+                self.clock.suspend(self.random.randint(60, 1800))
+            if not self.clock.step():
+                self.errors.append(f"nothing scheduled at {self.clock.current:.0f} s ({self.window.engine.state})")
+                break
+            # Let posted Qt events (overlay show/hide, deferred deletes) run after each
+            # transition; repainting the countdown on every virtual second is not needed
+            if self.transitions != processed:
+                processed = self.transitions
+                self.app.processEvents()
+        return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_common_arguments(parser, DEFAULT_OUTPUT, DEFAULT_BASELINE)
+    parser.add_argument("--hours", type=float, default=9, help="simulated working hours")
+    parser.add_argument("--focus-minutes", type=int, default=15)
+    parser.add_argument("--break-minutes", type=int, default=3)
+    parser.add_argument("--snooze-rate", type=float, default=0.3, help="chance a break is snoozed")
+    parser.add_argument("--early-end-rate", type=float, default=0.2, help="chance a break is ended early")
+    parser.add_argument("--suspend-rate", type=float, default=0.0,
+                        help="chance of a simulated suspend before each scheduled event")
+    parser.add_argument("--visible", action="store_true", help="keep the main window shown (per-second ticks)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--budget-ms", type=float, default=1000, help="real-time budget for the whole day")
+    args = parser.parse_args()
+
+    setup_environment()
+    day = Workday(args)
+    wakeups_before = day.window.wakeups
+    elapsed_ms = day.run()
+
+    counts = day.counts
+    print(f"Simulated {args.hours:g} h in {elapsed_ms:.1f} ms: "
+          + ", ".join(f"{name.replace('_', ' ')} {value}" for name, value in counts.items()))
+    if counts["focus_completed"] == 0:
+        day.errors.append("no focus session completed")
+
+    results = {
+        "workday_real_time": summarize([elapsed_ms]),
+        "workday_wakeups": summarize([day.window.wakeups - wakeups_before], unit="wakeups"),
+    }
+    status = finish(args, results, "workday")
+    if elapsed_ms > args.budget_ms:
+        day.errors.append(f"took {elapsed_ms:.0f} ms, budget is {args.budget_ms:.0f} ms")
+    for error in day.errors:
+        print(f"FAIL: {error}")
+    return 1 if day.errors else status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""Soak test: thousands of break cycles, watching for objects that pile up.
+
+    python benchmarks/soak.py                    # 2000 cycles
+    python benchmarks/soak.py --cycles 20000 --sample-every 500
+
+TimerApp runs hidden under the offscreen Qt platform on a VirtualClock. Each
+cycle is focus -> break (sometimes snoozed, sometimes ended early) -> break
+notification -> 3 s auto-start. Every few cycles the settings page is opened
+and closed and the mini window is toggled. At each sample the harness records
+live QObjects and widgets, the receivers of the app's long-lived signals,
+engine subscribers, Python objects and process RSS.
+
+After a warm-up, object and connection counts must stay flat, within
+--object-slack, and RSS may grow by at most --max-rss-growth-mb. Otherwise
+the run fails.
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+from harness import BENCH_DIR, setup_environment, summarize, write_results
+
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, "results", "soak.json")
+
+
+def rss_mb():
+    """Current resident set size in MB (peak RSS where /proc is unavailable)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS and kilobytes elsewhere
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class Soak:
+    def __init__(self, args):
+        from PyQt6.QtWidgets import QApplication
+        from PyQt6.QtCore import QObject
+        from clock import VirtualClock
+        import session_engine
+        import main
+
+        self.app = QApplication.instance() or QApplication(sys.argv[:1])
+        self.QObject = QObject
+        self.states = session_engine
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.clock = VirtualClock()
+        self.window = main.TimerApp(clock=self.clock, min_session_seconds=0)
+        self.window.focus_hours.setValue(0)
+        self.window.focus_minutes.setValue(25)
+        self.window.break_hours.setValue(0)
+        self.window.break_minutes.setValue(5)
+        self.window.hide()
+
+        self.cycles = 0
+        self.transitions = 0
+        self.samples = []
+        self.window.engine.subscribe("transition", self.on_transition)
+
+    # ---------- Driving the app ----------
+
+    def on_transition(self, engine, old_state, new_state, trigger):
+        s = self.states
+        self.transitions += 1
+        if new_state == s.BREAK:
+            roll = self.random.random()
+            if roll < 0.3 and engine.snooze_count < self.window.settings.get('max_snooze_count', 3):
+                self.clock.call_later(5000, lambda: self.window.handle_snooze_request(1))
+            elif roll < 0.5:
+                self.clock.call_later(60000, self.window.end_break_overlay)
+        elif new_state == s.FOCUS:
+            self.cycles += 1
+            if self.cycles % self.args.ui_every == 0:
+                # Exercise the UI paths that create widgets, shortly after the focus starts
+                self.clock.call_later(1000, self.exercise_ui)
+
+    def exercise_ui(self):
+        window = self.window
+        window.open_settings()
+        self.process()
+        if self.cycles % (self.args.ui_every * 2) == 0:
+            # Opening twice without closing must not stack a second page
+            window.open_settings()
+            self.process()
+        window.show_main_view()
+        window.minimize_to_mini()
+        self.process()
+        window.show_from_mini()
+        window.hide()
+        self.process()
+
+    def process(self):
+        from PyQt6.QtCore import QCoreApplication, QEvent
+        self.app.processEvents()
+        # Outside a running event loop deleteLater() needs an explicit flush
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+    # ---------- Sampling ----------
+
+    def connection_counts(self):
+        w = self.window
+        tray = w.tray_icon
+        overlays = w.break_overlays
+        watched = {
+            "tray.messageClicked": (tray, tray.messageClicked),
+            "tray.activated": (tray, tray.activated),
+            "overlays.endRequested": (overlays, overlays.endRequested),
+            "overlays.snoozeRequested": (overlays, overlays.snoozeRequested),
+            "overlays.latencyMeasured": (overlays, overlays.latencyMeasured),
+        }
+        counts = {name: obj.receivers(signal) for name, (obj, signal) in watched.items()}
+        for event, listeners in w.engine._listeners.items():
+            counts[f"engine.{event}"] = len(listeners)
+        counts["render.views"] = len(w.render._views)
+        return counts
+
+    def sample(self):
+        gc.collect()
+        qobjects = len(self.window.findChildren(self.QObject)) + len(self.app.topLevelWidgets())
+        self.samples.append({
+            "cycle": self.cycles,
+            "qobjects": qobjects,
+            "widgets": len(self.app.allWidgets()),
+            "python_objects": len(gc.get_objects()),
+            "connections": self.connection_counts(),
+            "rss_mb": rss_mb(),
+        })
+
+    def run(self):
+        self.window.start_focus_session()
+        processed = 0
+        next_sample = 0
+        start = time.perf_counter()
+        while self.cycles < self.args.cycles:
+            if not self.clock.step():
+                raise RuntimeError(f"Nothing scheduled after {self.cycles} cycles ({self.window.engine.state})")
+            if self.transitions != processed:
+                processed = self.transitions
+                self.process()
+            if self.cycles >= next_sample:
+                self.sample()
+                next_sample = self.cycles + self.args.sample_every
+        self.sample()
+        return (time.perf_counter() - start) * 1000
+
+    # ---------- Verdict ----------
+
+    def check(self):
+        """List of growth problems found after the warm-up samples"""
+        warm = self.samples[max(1, len(self.samples) // 10)]
+        last = self.samples[-1]
+        problems = []
+        for key in ("qobjects", "widgets"):
+            growth = last[key] - warm[key]
+            if growth > self.args.object_slack:
+                problems.append(f"{key} grew by {growth} ({warm[key]} -> {last[key]})")
+        python_growth = last["python_objects"] - warm["python_objects"]
+        if python_growth > self.args.object_slack * 100:
+            problems.append(f"python objects grew by {python_growth}")
+        for name, count in last["connections"].items():
+            if count > warm["connections"].get(name, 0):
+                problems.append(f"{name} receivers grew {warm['connections'].get(name, 0)} -> {count}")
+        rss_growth = last["rss_mb"] - warm["rss_mb"]
+        if rss_growth > self.args.max_rss_growth_mb:
+            problems.append(f"RSS grew by {rss_growth:.1f} MB")
+        return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=2000, help="focus/break cycles to run")
+    parser.add_argument("--sample-every", type=int, default=100, help="cycles between samples")
+    parser.add_argument("--ui-every", type=int, default=10, help="cycles between settings/mini window round trips")
+    parser.add_argument("--object-slack", type=int, default=5, help="allowed QObject/widget growth after warm-up")
+    parser.add_argument("--max-rss-growth-mb", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="where to write the samples (default: %(default)s)")
+    args = parser.parse_args()
+
+    setup_environment()
+    soak = Soak(args)
+    elapsed_ms = soak.run()
+    problems = soak.check()
+
+    first, last = soak.samples[0], soak.samples[-1]
+    print(f"{soak.cycles} cycles in {elapsed_ms / 1000:.1f} s "
+          f"({soak.clock.current / 86400:.1f} simulated days)")
+    print(f"{'cycle':>8}{'qobjects':>10}{'widgets':>9}{'py objects':>12}{'rss MB':>9}")
+    for sample in soak.samples:
+        print(f"{sample['cycle']:>8}{sample['qobjects']:>10}{sample['widgets']:>9}"
+              f"{sample['python_objects']:>12}{sample['rss_mb']:>9.1f}")
+
+    write_results(args.output, {
+        "soak_real_time": summarize([elapsed_ms]),
+        "soak_qobject_growth": summarize([last["qobjects"] - first["qobjects"]], unit="objects"),
+        "soak_rss_growth": summarize([last["rss_mb"] - first["rss_mb"]], unit="MB"),
+        "samples": soak.samples,
+    }, "soak")
+    print(f"Samples written to {args.output}")
+
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if not problems:
+        print("PASS: no unbounded growth")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
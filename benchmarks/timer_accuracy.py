@@ -0,0 +1,203 @@
+"""Timer accuracy and jitter of the real countdown under CPU and I/O load.
+
+    python benchmarks/timer_accuracy.py                   # load on every core + 1 I/O writer
+    python benchmarks/timer_accuracy.py --no-load         # reference numbers on an idle box
+    python benchmarks/timer_accuracy.py --cycles 5 --focus-seconds 60
+
+TimerApp runs on the real clock with its window shown, so it ticks every
+second. Load runs in separate processes. For every focus session the
+harness records:
+
+    tick_lateness        how long after the ideal second boundary each tick arrived
+    tick_interval_error  tick-to-tick interval error (|interval - 1000 ms|)
+    session_overrun      actual focus length minus the configured length
+    overlay_latency      deadline to the first painted break overlay frame
+
+Percentiles go to benchmarks/results/timer_accuracy.json. The run fails when
+a p99 exceeds its --max-* threshold or regresses against the baseline.
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+
+from harness import BENCH_DIR, setup_environment, summarize, add_common_arguments, finish
+
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, "results", "timer_accuracy.json")
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline_timer_accuracy.json")
+
+# How long the break overlay stays up before the harness ends the break
+BREAK_VIEW_MS = 500
+
+
+def cpu_load(stop):
+    """Busy loop until told to stop"""
+    while not stop.is_set():
+        sum(i * i for i in range(20000))
+
+
+def io_load(stop, directory):
+    """Write and fsync 1 MB chunks until told to stop"""
+    chunk = os.urandom(1024 * 1024)
+    path = os.path.join(directory, f"load-{os.getpid()}.bin")
+    with open(path, "wb") as f:
+        while not stop.is_set():
+            for _ in range(16):
+                f.write(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+            f.seek(0)
+            f.truncate()
+    os.remove(path)
+
+
+class LoadGenerator:
+    def __init__(self, cpu_workers, io_workers):
+        # spawn keeps the workers independent of the parent's Qt state
+        context = multiprocessing.get_context("spawn")
+        self.stop = context.Event()
+        self.directory = tempfile.mkdtemp(prefix="breakloop-load-")
+        self.processes = [context.Process(target=cpu_load, args=(self.stop,), daemon=True)
+                          for _ in range(cpu_workers)]
+        self.processes += [context.Process(target=io_load, args=(self.stop, self.directory), daemon=True)
+                           for _ in range(io_workers)]
+
+    def __enter__(self):
+        for process in self.processes:
+            process.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop.set()
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        try:
+            os.rmdir(self.directory)
+        except OSError:
+            pass
+
+
+class AccuracyRun:
+    def __init__(self, args):
+        from PyQt6.QtWidgets import QApplication
+        from PyQt6.QtCore import QTimer
+        import session_engine
+        import main
+
+        self.app = QApplication.instance() or QApplication(sys.argv[:1])
+        self.QTimer = QTimer
+        self.states = session_engine
+        self.args = args
+        self.window = main.TimerApp(min_session_seconds=0)
+        self.window.focus_hours.setValue(0)
+        self.window.focus_minutes.setValue(args.focus_seconds // 60)
+        self.window.focus_seconds.setValue(args.focus_seconds % 60)
+        self.window.break_hours.setValue(0)
+        self.window.break_minutes.setValue(10)  # Ended by the harness long before it expires
+        self.window.break_seconds.setValue(0)
+        self.window.show()
+
+        self.lateness = []
+        self.intervals = []
+        self.overruns = []
+        self.overlay_latencies = []
+        self.cycles_done = 0
+        self.session_start = None
+        self.last_tick_at = None
+
+        engine = self.window.engine
+        engine.subscribe("tick", self.on_tick)
+        engine.subscribe("transition", self.on_transition)
+        self.window.break_overlays.latencyMeasured.connect(self.on_overlay_shown)
+
+    def on_transition(self, engine, old_state, new_state, trigger):
+        s = self.states
+        if new_state == s.FOCUS:
+            self.session_start = engine.started_at
+            self.last_tick_at = None
+        elif old_state == s.FOCUS and trigger == s.EXPIRE:
+            overrun = engine.clock() - (self.session_start + self.args.focus_seconds)
+            self.overruns.append(overrun * 1000)
+
+    def on_tick(self, engine, seconds):
+        if engine.state != self.states.FOCUS or seconds >= self.args.focus_seconds:
+            return  # Only count ticks inside a focus session, not the initial one
+        now = engine.clock()
+        # The display should switch to `seconds` exactly this long after the start
+        ideal = self.session_start + (self.args.focus_seconds - seconds)
+        self.lateness.append((now - ideal) * 1000)
+        if self.last_tick_at is not None:
+            self.intervals.append(abs((now - self.last_tick_at) * 1000 - 1000))
+        self.last_tick_at = now
+
+    def on_overlay_shown(self, latency_ms):
+        self.overlay_latencies.append(latency_ms)
+        self.cycles_done += 1
+        if self.cycles_done >= self.args.cycles:
+            self.QTimer.singleShot(BREAK_VIEW_MS, self.app.quit)
+        else:
+            # Ending the break starts the next focus session
+            self.QTimer.singleShot(BREAK_VIEW_MS, self.window.end_break_overlay)
+
+    def run(self):
+        timeout_ms = int(self.args.cycles * (self.args.focus_seconds * 1000 + BREAK_VIEW_MS) * 2 + 10000)
+        self.QTimer.singleShot(timeout_ms, self.app.quit)
+        self.window.start_focus_session()
+        self.app.exec()
+        self.window.quit_app()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_common_arguments(parser, DEFAULT_OUTPUT, DEFAULT_BASELINE)
+    parser.add_argument("--cycles", type=int, default=3, help="focus sessions to run")
+    parser.add_argument("--focus-seconds", type=int, default=30, help="length of each focus session")
+    parser.add_argument("--cpu-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--io-workers", type=int, default=1)
+    parser.add_argument("--no-load", action="store_true", help="run without background load")
+    parser.add_argument("--max-tick-late-ms", type=float, default=50,
+                        help="p99 limit for tick lateness (default: %(default)s)")
+    parser.add_argument("--max-overrun-ms", type=float, default=100,
+                        help="p99 limit for focus session overrun (default: %(default)s)")
+    parser.add_argument("--max-overlay-ms", type=float, default=250,
+                        help="p99 limit for deadline-to-overlay latency (default: %(default)s)")
+    args = parser.parse_args()
+
+    setup_environment()
+    cpu_workers, io_workers = (0, 0) if args.no_load else (args.cpu_workers, args.io_workers)
+    print(f"Running {args.cycles} x {args.focus_seconds} s focus sessions with "
+          f"{cpu_workers} CPU and {io_workers} I/O load process(es)...")
+    with LoadGenerator(cpu_workers, io_workers):
+        run = AccuracyRun(args)
+        run.run()
+
+    if run.cycles_done < args.cycles or not run.lateness:
+        print(f"FAIL: only {run.cycles_done} of {args.cycles} cycles completed")
+        return 1
+
+    results = {
+        "tick_lateness": summarize(run.lateness),
+        "tick_interval_error": summarize(run.intervals or [0.0]),
+        "session_overrun": summarize(run.overruns),
+        "overlay_latency": summarize(run.overlay_latencies),
+    }
+    status = finish(args, results, "timer_accuracy")
+
+    failures = []
+    for name, limit in (("tick_lateness", args.max_tick_late_ms),
+                        ("session_overrun", args.max_overrun_ms),
+                        ("overlay_latency", args.max_overlay_ms)):
+        if results[name]["p99"] > limit:
+            failures.append(f"{name} p99 {results[name]['p99']:.1f} ms exceeds {limit:.0f} ms")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print("PASS: all p99 values within thresholds")
+    return 1 if failures else status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""Session lengths sent over the control API obey the same minimum as the input fields"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Src"))
+
+from clock import VirtualClock
+from control_api import ControlApi
+from session_engine import SessionEngine, IDLE, FOCUS, BREAK, MIN_SESSION_SECONDS
+
+
+class FakeServer:
+    def __init__(self):
+        self.handlers = {}
+
+    def handle(self, command, handler):
+        self.handlers[command] = handler
+
+    def broadcast(self, message):
+        pass
+
+
+class FakeHost:
+    def __init__(self):
+        self.clock = VirtualClock()
+        self.engine = SessionEngine(clock=self.clock.now, boot_clock=False)
+        self.settings = {}
+        self.min_session_seconds = MIN_SESSION_SECONDS
+
+    def sync_session_durations(self):
+        pass
+
+    def bring_to_front(self):
+        pass
+
+
+class DurationTest(unittest.TestCase):
+    def setUp(self):
+        self.host = FakeHost()
+        self.server = FakeServer()
+        self.api = ControlApi(self.server, self.host)
+
+    def test_lengths_below_the_minimum_are_refused(self):
+        for command, key in (("start-focus", "focus_seconds"), ("take-break", "break_seconds")):
+            with self.assertRaises(ValueError):
+                self.server.handlers[command]({key: MIN_SESSION_SECONDS - 1})
+        self.assertEqual(self.host.engine.state, IDLE)
+        # A refused request leaves the lengths alone
+        self.assertEqual((self.host.engine.focus_duration, self.host.engine.break_duration), (1500, 300))
+
+    def test_lengths_at_the_minimum_are_used(self):
+        self.server.handlers["start-focus"]({"focus_seconds": MIN_SESSION_SECONDS, "break_seconds": 60})
+        self.assertEqual((self.host.engine.state, self.host.engine.duration), (FOCUS, MIN_SESSION_SECONDS))
+        self.server.handlers["take-break"]({})
+        self.assertEqual((self.host.engine.state, self.host.engine.duration), (BREAK, 60))
+
+
+if __name__ == "__main__":
+    unittest.main()
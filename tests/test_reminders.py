@@ -0,0 +1,134 @@
+"""ReminderScheduler on virtual time: heap order, coalescing and settings"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Src"))
+
+from clock import VirtualClock
+from reminders import (Reminder, ReminderScheduler, COALESCE_SECONDS, REMINDER_TYPES,
+                       apply_settings, format_reminders)
+
+
+class SchedulerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.scheduler = ReminderScheduler(clock=self.clock.now)
+        self.deliveries = []  # (time, [names]) per "due" event
+        self.scheduler.subscribe("due", lambda scheduler, reminders: self.deliveries.append(
+            (self.clock.current, [reminder.name for reminder in reminders])))
+        # One timer for the next deadline, the way TimerApp and the daemon drive it
+        self.timer = self.clock.timer(self.fire)
+        self.wakeups = 0
+
+    def fire(self):
+        self.wakeups += 1
+        self.scheduler.poll()
+        self.arm()
+
+    def arm(self):
+        ms = self.scheduler.ms_until_due()
+        if ms is None:
+            self.timer.stop()
+        else:
+            self.timer.start(ms)
+
+    def run_for(self, seconds):
+        self.arm()
+        self.clock.advance(seconds)
+
+
+class OrderTest(SchedulerTestCase):
+    def test_reminders_come_due_in_deadline_order(self):
+        for name, interval in (("c", 3000), ("a", 1000), ("b", 2000)):
+            self.scheduler.add(Reminder(name, interval, name))
+        self.assertEqual(self.scheduler.next_due(), 1000)
+        self.run_for(3001)
+        # Equal deadlines go out in the order they were queued
+        self.assertEqual(self.deliveries, [(1000.001, ["a"]), (2000.001, ["b", "a"]),
+                                           (3000.001, ["c", "a"])])
+
+    def test_one_wakeup_per_delivery(self):
+        self.scheduler.add(Reminder("eye_rest", 1200, ""))
+        self.scheduler.add(Reminder("stretch", 3600, ""))
+        self.run_for(3 * 3600)
+        # Every stretch lands on an eye-rest and goes out with it
+        self.assertEqual((len(self.deliveries), self.wakeups), (9, 9))
+        self.assertEqual(sum(len(names) for _, names in self.deliveries), 12)
+
+    def test_removed_reminder_never_fires(self):
+        self.scheduler.add(Reminder("a", 100, ""))
+        self.scheduler.add(Reminder("b", 200, ""))
+        self.scheduler.remove("a")
+        self.assertEqual(self.scheduler.next_due(), 200)
+        self.run_for(450)
+        self.assertEqual([names for _, names in self.deliveries], [["b"], ["b"]])
+
+    def test_replacing_a_reminder_moves_its_deadline(self):
+        self.scheduler.add(Reminder("a", 100, ""))
+        self.scheduler.add(Reminder("a", 500, ""))
+        self.run_for(499)
+        self.assertEqual(self.deliveries, [])
+        self.assertEqual(self.scheduler.next_due(), 500)
+
+    def test_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            self.scheduler.add(Reminder("a", 0, ""))
+
+
+class CoalesceTest(SchedulerTestCase):
+    def test_reminders_within_the_window_fire_once_together(self):
+        self.scheduler.add(Reminder("a", 1000, "A"))
+        self.scheduler.add(Reminder("b", 1000 + COALESCE_SECONDS, "B"))
+        self.scheduler.add(Reminder("c", 1000 + COALESCE_SECONDS + 1, "C"))
+        self.run_for(1100)
+        self.assertEqual([names for _, names in self.deliveries], [["a", "b"], ["c"]])
+
+    def test_coalesced_reminder_keeps_its_phase(self):
+        self.scheduler.add(Reminder("a", 1000, ""))
+        self.scheduler.add(Reminder("b", 1060, ""))
+        self.run_for(1001)
+        self.assertEqual(self.deliveries[0][1], ["a", "b"])
+        # b was pulled forward for this delivery only; its next one is 1060 after its own deadline
+        self.assertEqual(sorted(entry[0] for entry in self.scheduler._heap), [2000, 2120])
+
+    def test_missed_periods_are_not_made_up(self):
+        self.scheduler.add(Reminder("a", 100, ""))
+        self.clock.advance(1050)  # Nothing polled: the app was busy or asleep
+        self.assertEqual(self.scheduler.ms_until_due(), 0)
+        self.assertEqual(len(self.scheduler.poll()), 1)
+        self.assertEqual(self.scheduler.next_due(), 1150)
+
+    def test_poll_before_the_deadline_delivers_nothing(self):
+        self.scheduler.add(Reminder("a", 100, ""))
+        self.clock.advance(99)
+        self.assertEqual(self.scheduler.poll(), [])
+        self.assertEqual(self.deliveries, [])
+
+
+class SettingsTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.scheduler = ReminderScheduler(clock=self.clock.now)
+
+    def test_apply_settings(self):
+        apply_settings(self.scheduler, {'eye_rest_minutes': 20, 'stretch_minutes': 60, 'hydration_minutes': 0})
+        self.assertEqual(sorted(self.scheduler.reminders), ["eye_rest", "stretch"])
+        self.assertEqual(self.scheduler.next_due(), 1200)
+        # An unchanged interval keeps its deadline; a changed one restarts
+        self.clock.advance(600)
+        apply_settings(self.scheduler, {'eye_rest_minutes': 20, 'stretch_minutes': 30, 'hydration_minutes': 0})
+        self.assertEqual(self.scheduler.next_due(), 1200)
+        self.assertEqual(self.scheduler.reminders["stretch"].interval, 1800)
+        apply_settings(self.scheduler, {})
+        self.assertEqual(self.scheduler.reminders, {})
+        self.assertIsNone(self.scheduler.next_due())
+
+    def test_format_reminders(self):
+        reminders = [Reminder(name, 60, message) for name, (_, message) in REMINDER_TYPES.items()]
+        self.assertEqual(format_reminders(reminders).splitlines(),
+                         [message for _, message in REMINDER_TYPES.values()])
+
+
+if __name__ == "__main__":
+    unittest.main()
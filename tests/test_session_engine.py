@@ -0,0 +1,257 @@
+"""SessionEngine lifecycle, driven on virtual time without any widgets"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Src"))
+
+from clock import VirtualClock
+from session_engine import (SessionEngine, TransitionError, IDLE, FOCUS, BREAK, SNOOZE,
+                            START_FOCUS, TAKE_BREAK, SNOOZE_BREAK, END_BREAK, EXPIRE, STOP,
+                            PAUSE, RESUME, COUNT_AS_BREAK, EXPIRE_SESSION, PAUSE_SESSION,
+                            SUSPEND_THRESHOLD, default_boot_clock)
+
+
+class EngineTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.engine = SessionEngine(clock=self.clock.now, focus_duration=1500, break_duration=300,
+                                    boot_clock=False)
+        self.transitions = []
+        self.ticks = []
+        self.engine.subscribe("transition", lambda engine, old, new, trigger:
+                              self.transitions.append((old, new, trigger)))
+        self.engine.subscribe("tick", lambda engine, seconds: self.ticks.append(seconds))
+
+    def advance(self, seconds):
+        """Move virtual time on and let the engine look at its deadline once"""
+        self.clock.advance(seconds)
+        self.engine.poll()
+
+
+class TransitionTest(EngineTestCase):
+    def test_focus_break_snooze_focus(self):
+        engine = self.engine
+        engine.start_focus()
+        self.advance(1500)
+        self.assertEqual(engine.state, BREAK)
+        self.assertEqual(engine.duration, 300)
+        self.assertEqual(engine.expired_at, 1500)
+
+        engine.snooze(120)
+        self.assertEqual((engine.state, engine.snooze_count), (SNOOZE, 1))
+        self.advance(120)
+        # The break comes back with its snooze count
+        self.assertEqual((engine.state, engine.snooze_count), (BREAK, 1))
+
+        engine.end_break()
+        self.assertEqual((engine.state, engine.snooze_count, engine.duration), (FOCUS, 0, 1500))
+        self.assertEqual(self.transitions, [
+            (IDLE, FOCUS, START_FOCUS),
+            (FOCUS, BREAK, EXPIRE),
+            (BREAK, SNOOZE, SNOOZE_BREAK),
+            (SNOOZE, BREAK, EXPIRE),
+            (BREAK, FOCUS, END_BREAK),
+        ])
+
+    def test_break_expires_to_idle(self):
+        self.engine.take_break()
+        self.advance(300)
+        self.assertEqual(self.engine.state, IDLE)
+        self.assertEqual(self.transitions[-1], (BREAK, IDLE, EXPIRE))
+        self.assertEqual(self.engine.remaining(), 0.0)
+
+    def test_pause_and_resume(self):
+        engine = self.engine
+        engine.start_focus()
+        self.advance(100)
+        engine.pause()
+        self.assertTrue(engine.paused)
+        self.assertFalse(engine.is_running())
+        # A paused countdown stands still, however long the pause
+        self.advance(10000)
+        self.assertEqual(engine.state, FOCUS)
+        self.assertEqual(engine.remaining(), 1400)
+        engine.resume()
+        self.advance(1399)
+        self.assertEqual(engine.state, FOCUS)
+        self.advance(1)
+        self.assertEqual(engine.state, BREAK)
+        self.assertEqual(self.transitions[1:3], [(FOCUS, FOCUS, PAUSE), (FOCUS, FOCUS, RESUME)])
+
+    def test_pause_and_resume_are_checked(self):
+        with self.assertRaises(TransitionError):
+            self.engine.pause()
+        self.engine.start_focus()
+        with self.assertRaises(TransitionError):
+            self.engine.resume()
+
+    def test_stop(self):
+        for start in (self.engine.start_focus, self.engine.take_break):
+            start()
+            self.engine.stop()
+            self.assertEqual(self.engine.state, IDLE)
+            self.assertIsNone(self.engine.deadline)
+            self.assertEqual(self.transitions[-1][1:], (IDLE, STOP))
+
+    def test_disallowed_triggers(self):
+        with self.assertRaises(TransitionError):
+            self.engine.snooze(60)
+        with self.assertRaises(TransitionError):
+            self.engine.end_break()
+        self.engine.start_focus()
+        with self.assertRaises(TransitionError):
+            self.engine.snooze(60)
+        self.assertEqual(self.engine.state, FOCUS)
+
+    def test_zero_length_session_is_refused(self):
+        with self.assertRaises(ValueError):
+            self.engine.start_focus(0)
+        self.assertEqual(self.engine.state, IDLE)
+
+    def test_focus_without_break_ends_the_loop(self):
+        self.engine.break_duration = 0
+        self.engine.start_focus()
+        self.advance(1500)
+        self.assertEqual(self.engine.state, IDLE)
+        self.assertEqual(self.transitions[-1], (FOCUS, IDLE, EXPIRE))
+
+    def test_restart_from_any_state(self):
+        self.engine.take_break()
+        self.engine.start_focus()
+        self.engine.take_break()
+        self.assertEqual([t[2] for t in self.transitions], [TAKE_BREAK, START_FOCUS, TAKE_BREAK])
+
+
+class DeadlineTest(EngineTestCase):
+    def test_late_ticks_do_not_drift(self):
+        self.engine.start_focus()
+        # Every wakeup arrives 0.7 s late; the countdown must still track the deadline
+        for _ in range(100):
+            self.advance(1.7)
+        self.assertAlmostEqual(self.engine.remaining(), 1500 - 170)
+        self.assertEqual(self.engine.remaining_seconds(), 1330)
+        self.assertEqual(self.engine.deadline, 1500)
+
+    def test_missed_ticks_still_expire_on_time(self):
+        self.engine.start_focus()
+        self.clock.advance(1499.5)
+        self.engine.poll()
+        self.assertEqual(self.engine.state, FOCUS)
+        self.assertEqual(self.engine.remaining_seconds(), 1)
+        # One very late wakeup expires the session at its original deadline
+        self.advance(600)
+        self.assertEqual(self.engine.state, BREAK)
+        self.assertEqual(self.engine.expired_at, 1500)
+
+    def test_ticks_only_when_the_second_changes(self):
+        self.engine.start_focus(10)
+        self.ticks.clear()
+        for _ in range(40):
+            self.advance(0.25)
+        self.assertEqual(self.ticks, list(range(9, 0, -1)) + [300])
+
+    def test_next_tick_lands_after_the_boundary(self):
+        self.engine.start_focus(10)
+        self.clock.advance(0.25)
+        self.assertEqual(self.engine.ms_until_next_tick(), 751)
+
+
+class SuspendTest(unittest.TestCase):
+    """Each session type under each policy, with a suspend gap either side of the threshold"""
+
+    def make_engine(self, state, policy):
+        """An engine 100 s into a session of the given type; 1400/200/140 s remain"""
+        self.clock = VirtualClock()
+        engine = SessionEngine(clock=self.clock.now, focus_duration=1500, break_duration=300,
+                               boot_clock=self.clock.boot_now)
+        engine.suspend_policies[state] = policy
+        self.suspends = []
+        engine.subscribe("suspend", lambda engine, gap, state, policy:
+                         self.suspends.append((gap, state, policy)))
+        if state == FOCUS:
+            engine.start_focus()
+        else:
+            engine.take_break()
+            if state == SNOOZE:
+                engine.snooze(240)
+        self.clock.advance(100)
+        engine.poll()
+        return engine
+
+    def sleep(self, engine, gap):
+        self.clock.suspend(gap)
+        engine.poll()
+
+    def test_short_gap_is_ignored(self):
+        for state, remaining in ((FOCUS, 1400), (BREAK, 200), (SNOOZE, 140)):
+            for policy in (COUNT_AS_BREAK, EXPIRE_SESSION, PAUSE_SESSION):
+                with self.subTest(state=state, policy=policy):
+                    engine = self.make_engine(state, policy)
+                    self.sleep(engine, SUSPEND_THRESHOLD)
+                    self.assertEqual(self.suspends, [])
+                    self.assertEqual((engine.state, engine.paused), (state, False))
+                    self.assertEqual(engine.remaining(), remaining)
+
+    def test_pause_session(self):
+        for state, remaining in ((FOCUS, 1400), (BREAK, 200), (SNOOZE, 140)):
+            with self.subTest(state=state):
+                engine = self.make_engine(state, PAUSE_SESSION)
+                self.sleep(engine, 60)
+                self.assertEqual(self.suspends, [(60, state, PAUSE_SESSION)])
+                self.assertEqual((engine.state, engine.paused), (state, True))
+                self.assertEqual(engine.remaining(), remaining)
+
+    def test_expire_session(self):
+        for state, remaining in ((FOCUS, 1400), (BREAK, 200), (SNOOZE, 140)):
+            with self.subTest(state=state):
+                engine = self.make_engine(state, EXPIRE_SESSION)
+                self.sleep(engine, 60)
+                self.assertEqual(self.suspends, [(60, state, EXPIRE_SESSION)])
+                self.assertEqual(engine.state, state)
+                self.assertEqual(engine.remaining(), remaining - 60)
+
+    def test_expire_session_past_the_deadline(self):
+        for state, after in ((FOCUS, BREAK), (BREAK, IDLE), (SNOOZE, BREAK)):
+            with self.subTest(state=state):
+                engine = self.make_engine(state, EXPIRE_SESSION)
+                self.sleep(engine, 3600)
+                self.assertEqual(engine.state, after)
+
+    def test_count_as_break_short_sleep(self):
+        # Shorter than a break: focus stands still, break and snooze time runs
+        for state, remaining in ((FOCUS, 1400), (BREAK, 140), (SNOOZE, 80)):
+            with self.subTest(state=state):
+                engine = self.make_engine(state, COUNT_AS_BREAK)
+                self.sleep(engine, 60)
+                self.assertEqual(self.suspends, [(60, state, COUNT_AS_BREAK)])
+                self.assertEqual(engine.state, state)
+                self.assertEqual(engine.remaining(), remaining)
+
+    def test_count_as_break_long_sleep(self):
+        # A whole break asleep: focus starts afresh, or the break is over
+        for state, after in ((FOCUS, FOCUS), (BREAK, IDLE), (SNOOZE, FOCUS)):
+            with self.subTest(state=state):
+                engine = self.make_engine(state, COUNT_AS_BREAK)
+                self.sleep(engine, 300)
+                self.assertEqual(engine.state, after)
+                if after == FOCUS:
+                    self.assertEqual(engine.remaining(), 1500)
+
+    def test_no_detection_while_idle_or_paused(self):
+        engine = self.make_engine(FOCUS, PAUSE_SESSION)
+        engine.pause()
+        self.sleep(engine, 600)
+        engine.resume()
+        engine.poll()
+        self.assertEqual(self.suspends, [])
+        self.assertEqual(engine.remaining(), 1400)
+
+    def test_boot_clock_default(self):
+        engine = SessionEngine()
+        self.assertEqual(engine.boot_clock is None, default_boot_clock() is None)
+        self.assertIsNone(SessionEngine(boot_clock=False).boot_clock)
+
+
+if __name__ == "__main__":
+    unittest.main()
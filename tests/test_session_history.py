@@ -0,0 +1,157 @@
+"""Recovery, checksums and the sparse index of the session history log"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Src"))
+
+from session_engine import FOCUS
+from session_history import (SessionHistory, HEADER, RECORD_SIZE, INDEX_ENTRY, INDEX_INTERVAL,
+                             FOCUS_START, FOCUS_END)
+
+
+class HistoryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "history.log")
+        self.index_path = os.path.join(self.directory.name, "history.idx")
+        self.history = None
+
+    def tearDown(self):
+        if self.history is not None:
+            self.history.close()
+        self.directory.cleanup()
+
+    def open(self):
+        """(Re)open the log, returning whatever recovery printed"""
+        if self.history is not None:
+            self.history.close()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.history = SessionHistory(self.path, self.index_path)
+        return output.getvalue()
+
+    def write(self, count):
+        self.open()
+        for number in range(count):
+            self.history.append(FOCUS_START if number % 2 == 0 else FOCUS_END, FOCUS,
+                                duration=1500, elapsed=float(number), timestamp=1000.0 + number)
+        self.history.close()
+        self.history = None
+
+    def corrupt_record(self, number):
+        with open(self.path, "r+b") as f:
+            f.seek(HEADER.size + number * RECORD_SIZE + 2)
+            byte = f.read(1)
+            f.seek(-1, os.SEEK_CUR)
+            f.write(bytes([byte[0] ^ 0xFF]))
+
+
+class RecoveryTest(HistoryTestCase):
+    def test_reopen_keeps_every_record(self):
+        self.write(10)
+        self.assertEqual(self.open(), "")
+        self.assertEqual(len(self.history), 10)
+        records = self.history.read()
+        self.assertEqual([record.timestamp for record in records], [1000.0 + n for n in range(10)])
+        self.assertEqual((records[1].event, records[1].elapsed, records[1].duration), (FOCUS_END, 1.0, 1500))
+
+    def test_partial_record_is_truncated(self):
+        self.write(10)
+        with open(self.path, "ab") as f:
+            f.write(b"\x01" * (RECORD_SIZE // 2))  # A crash mid-write
+        self.assertIn("Truncating", self.open())
+        self.assertEqual(len(self.history), 10)
+        self.assertEqual(os.path.getsize(self.path), HEADER.size + 10 * RECORD_SIZE)
+
+    def test_corrupt_tail_is_truncated(self):
+        self.write(10)
+        self.corrupt_record(9)
+        self.corrupt_record(8)
+        self.assertIn("Truncating", self.open())
+        self.assertEqual(len(self.history), 8)
+        self.assertEqual(len(self.history.read_raw()), 8 * RECORD_SIZE)
+        # Appending carries on after the last good record
+        self.history.append(FOCUS_START, FOCUS, timestamp=2000.0)
+        self.assertEqual(self.history.read()[-1].timestamp, 2000.0)
+
+    def test_bad_record_inside_the_log_is_skipped(self):
+        self.write(10)
+        self.corrupt_record(4)
+        self.assertEqual(self.open(), "")
+        self.assertEqual(len(self.history), 10)
+        # read_raw hands back every record; read and bad_records agree on the damage
+        self.assertEqual(len(self.history.read_raw()), 10 * RECORD_SIZE)
+        self.assertEqual([record.timestamp for record in self.history.read()],
+                         [1000.0 + n for n in range(10) if n != 4])
+        self.assertEqual(self.history.bad_records(), [4])
+
+    def test_records_written_after_open_are_not_rechecked(self):
+        self.write(3)
+        self.open()
+        self.history.append(FOCUS_START, FOCUS, timestamp=2000.0)
+        self.assertEqual(self.history.bad_records(), [])
+        self.assertEqual(len(self.history.read()), 4)
+
+    def test_foreign_file_is_refused(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a history log at all")
+        with self.assertRaises(ValueError):
+            SessionHistory(self.path, self.index_path)
+
+    def test_timestamps_never_go_backwards(self):
+        self.open()
+        self.history.append(FOCUS_START, FOCUS, timestamp=2000.0)
+        self.history.append(FOCUS_END, FOCUS, timestamp=1500.0)
+        self.assertEqual([record.timestamp for record in self.history.read()], [2000.0, 2000.0])
+
+
+class IndexTest(HistoryTestCase):
+    COUNT = 3 * INDEX_INTERVAL + 100
+
+    def setUp(self):
+        super().setUp()
+        self.write(self.COUNT)
+
+    def expected_index(self):
+        return [(1000.0 + number, number) for number in range(0, self.COUNT, INDEX_INTERVAL)]
+
+    def test_every_interval_th_record_is_indexed(self):
+        self.open()
+        self.assertEqual(self.history.index, self.expected_index())
+        with open(self.index_path, "rb") as f:
+            self.assertEqual(len(f.read()), len(self.expected_index()) * INDEX_ENTRY.size)
+
+    def test_range_query_seeks_through_the_index(self):
+        self.open()
+        since = 1000.0 + 2 * INDEX_INTERVAL + 10
+        self.assertEqual(self.history.first_record_since(since), 2 * INDEX_INTERVAL)
+        self.assertEqual(len(self.history.read_raw(since)), (self.COUNT - 2 * INDEX_INTERVAL) * RECORD_SIZE)
+        records = self.history.read(since, since + 50)
+        self.assertEqual([record.timestamp for record in records], [since + n for n in range(50)])
+        self.assertEqual(self.history.first_record_since(0.0), 0)
+
+    def test_missing_index_is_rebuilt(self):
+        os.remove(self.index_path)
+        self.open()
+        self.assertEqual(self.history.index, self.expected_index())
+
+    def test_short_index_is_rebuilt(self):
+        with open(self.index_path, "r+b") as f:
+            f.truncate(INDEX_ENTRY.size + 3)
+        self.open()
+        self.assertEqual(self.history.index, self.expected_index())
+
+    def test_index_follows_a_truncated_log(self):
+        with open(self.path, "r+b") as f:
+            f.truncate(HEADER.size + INDEX_INTERVAL * RECORD_SIZE - 1)
+        self.open()
+        self.assertEqual(len(self.history), INDEX_INTERVAL - 1)
+        self.assertEqual(self.history.index, [(1000.0, 0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
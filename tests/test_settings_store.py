@@ -0,0 +1,76 @@
+"""Migration of the legacy positional settings file to the versioned JSON document"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Src"))
+
+from settings_store import SettingsStore, SCHEMA, SCHEMA_VERSION, LEGACY_ORDER, defaults
+
+
+class MigrationTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "settings.json")
+        self.legacy_path = os.path.join(self.directory.name, "timer_app_settings.txt")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def load_legacy(self, lines):
+        with open(self.legacy_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        store = SettingsStore(self.path, self.legacy_path)
+        return store, store.load()
+
+    def saved_document(self):
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_legacy_file_is_migrated(self):
+        store, settings = self.load_legacy(["  Ada ", "False", "true", "4", "2", "True", "75"])
+        expected = dict(defaults(), username="Ada", sound_enabled=False, snooze_enabled=True,
+                        snooze_time=4, max_snooze_count=2, auto_start=True, sound_volume=75)
+        self.assertEqual(settings, expected)
+        for key, value in settings.items():
+            self.assertIs(type(value), SCHEMA[key][0], key)
+        # Written once as the current JSON version; the legacy file is no longer read
+        self.assertEqual(store.writes, 1)
+        self.assertEqual(self.saved_document(), {'version': SCHEMA_VERSION, 'settings': expected})
+        os.remove(self.legacy_path)
+        self.assertEqual(SettingsStore(self.path, self.legacy_path).load(), expected)
+
+    def test_invalid_legacy_values_fall_back_to_defaults(self):
+        # Out of range, wrong type, too long: each is replaced by its SCHEMA default
+        lines = ["x" * 51, "yes", "True", "9", "0", "maybe", "101"]
+        store, settings = self.load_legacy(lines)
+        self.assertEqual(settings, dict(defaults(), snooze_enabled=True))
+        self.assertEqual(self.saved_document()['settings'], settings)
+
+    def test_short_legacy_file(self):
+        # Files from before the later settings existed stop after a few lines
+        store, settings = self.load_legacy(["Grace", "False"])
+        self.assertEqual(settings, dict(defaults(), username="Grace", sound_enabled=False))
+
+    def test_values_at_the_limits_are_kept(self):
+        lines = ["x" * 50, "True", "False"]
+        for key in LEGACY_ORDER[3:]:
+            kind, _, limits = SCHEMA[key]
+            lines.append("True" if kind is bool else str(limits[1]))
+        store, settings = self.load_legacy(lines)
+        self.assertEqual((settings['username'], settings['snooze_time'], settings['max_snooze_count'],
+                          settings['sound_volume']), ("x" * 50, 5, 3, 100))
+
+    def test_json_document_is_not_migrated_again(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({'version': SCHEMA_VERSION, 'settings': {'username': "Lin"}}, f)
+        self.load_legacy(["Ada"])
+        store = SettingsStore(self.path, self.legacy_path)
+        self.assertEqual(store.load()['username'], "Lin")
+        self.assertEqual(store.writes, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
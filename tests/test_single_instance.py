@@ -0,0 +1,57 @@
+"""Malformed requests on the instance socket must be answered, never raised"""
+import json
+import os
+import sys
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Src"))
+
+from PyQt6.QtWidgets import QApplication
+
+from single_instance import InstanceServer
+
+
+class DispatchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        # Never listens; dispatch() is exercised directly
+        self.server = InstanceServer(name="breakloop-test-unused")
+
+    def assertRefused(self, line):
+        reply = self.server.dispatch(line)
+        self.assertFalse(reply["ok"])
+        self.assertIn("error", reply)
+        json.dumps(reply)  # The reply must still be sendable
+
+    def test_malformed_json(self):
+        for line in (b"{", b"not json", b"\xff\xfe", b""):
+            self.assertRefused(line)
+
+    def test_non_dict_request(self):
+        for line in (b"[]", b"42", b'"status"', b"null", b'["command", "ping"]'):
+            self.assertRefused(line)
+
+    def test_non_string_command(self):
+        for command in ([], {}, 1, None, True, ["ping"]):
+            self.assertRefused(json.dumps({"command": command}).encode())
+        self.assertRefused(b"{}")
+
+    def test_unknown_command(self):
+        self.assertRefused(b'{"command": "bogus"}')
+
+    def test_failing_handler(self):
+        self.server.handle("boom", lambda request: 1 / 0)
+        self.assertRefused(b'{"command": "boom"}')
+
+    def test_valid_request(self):
+        reply = self.server.dispatch(b'{"command": "ping"}')
+        self.assertTrue(reply["ok"])
+        self.assertEqual(reply["pid"], os.getpid())
+
+
+if __name__ == "__main__":
+    unittest.main()
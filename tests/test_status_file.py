@@ -0,0 +1,134 @@
+"""The status file round trip, and the seqlock reader against a writer mid-update"""
+import os
+import struct
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Src"))
+
+import status_file
+from clock import VirtualClock
+from session_engine import SessionEngine
+from status_file import StatusPublisher, read_status, format_status, SEQUENCE_OFFSET, READ_RETRIES
+
+
+class StatusFileTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "breakloop.status")
+        self.clock = VirtualClock()
+        self.engine = SessionEngine(clock=self.clock.now, focus_duration=1500, break_duration=300,
+                                    boot_clock=False)
+        self.publisher = StatusPublisher(self.engine, path=self.path)
+
+    def tearDown(self):
+        self.publisher.close()
+        self.directory.cleanup()
+
+    def set_sequence(self, sequence):
+        """Write the header's sequence the way the publisher does"""
+        self.publisher._map[SEQUENCE_OFFSET:SEQUENCE_OFFSET + 4] = struct.pack("<I", sequence)
+
+
+class RoundTripTest(StatusFileTestCase):
+    def test_idle(self):
+        status = read_status(self.path)
+        self.assertEqual((status["state"], status["paused"], status["deadline"], status["remaining"]),
+                         ("idle", False, None, 0.0))
+        self.assertEqual(format_status(status), "idle")
+
+    def test_running_session(self):
+        self.engine.start_focus()
+        now = time.time()
+        status = read_status(self.path, now=now)
+        self.assertEqual((status["state"], status["duration"]), ("focus", 1500))
+        self.assertAlmostEqual(status["remaining"], 1500, delta=1)
+        # Readers count down from the deadline on their own
+        later = read_status(self.path, now=now + 100)
+        self.assertAlmostEqual(later["remaining"], status["remaining"] - 100, places=3)
+
+    def test_paused_snooze(self):
+        self.engine.take_break()
+        self.engine.snooze(240)
+        self.clock.advance(40)
+        self.engine.pause()
+        status = read_status(self.path, now=time.time() + 3600)
+        self.assertEqual((status["state"], status["paused"], status["snooze_count"]), ("snooze", True, 1))
+        self.assertEqual(status["remaining"], 200)
+        self.assertIsNone(status["deadline"])
+        self.assertEqual(format_status(status), "snooze 03:20 (paused)")
+
+    def test_unchanged_state_is_not_rewritten(self):
+        self.engine.start_focus()
+        writes = self.publisher.writes
+        sequence = self.publisher.sequence
+        self.publisher.publish()
+        self.assertEqual((self.publisher.writes, self.publisher.sequence), (writes, sequence))
+        self.assertEqual(sequence % 2, 0)
+
+    def test_removed_file_means_not_running(self):
+        self.publisher.close()
+        self.assertIsNone(read_status(self.path))
+        self.assertEqual(format_status(None), "not running")
+
+    def test_foreign_file_is_ignored(self):
+        with open(self.path, "r+b") as f:
+            f.write(b"NOTOURS!")
+        self.assertIsNone(read_status(self.path))
+
+
+class SeqlockTest(StatusFileTestCase):
+    def test_waits_for_an_update_in_progress(self):
+        self.engine.start_focus()
+        sequence = self.publisher.sequence
+        self.set_sequence(sequence + 1)  # Writer is half way through
+        sleeps = []
+
+        def writer_finishes(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 3:
+                self.set_sequence(sequence + 2)
+
+        with mock.patch.object(status_file.time, "sleep", writer_finishes):
+            status = read_status(self.path)
+        self.assertEqual(len(sleeps), 3)
+        self.assertEqual(status["state"], "focus")
+
+    def test_gives_up_on_a_stuck_writer(self):
+        self.set_sequence(self.publisher.sequence + 1)
+        with mock.patch.object(status_file.time, "sleep") as sleep:
+            self.assertIsNone(read_status(self.path))
+        self.assertEqual(sleep.call_count, READ_RETRIES)
+
+    def test_torn_read_is_retried(self):
+        # The writer publishes a whole update between the reader's two looks at
+        # the sequence; the record read in between must be thrown away
+        self.engine.start_focus()
+        record = status_file.RECORD
+        engine = self.engine
+
+        class WriterInterleaves:
+            size = record.size
+            pack = record.pack  # The publisher writes through the real struct
+            calls = 0
+
+            def unpack_from(self, buffer, offset):
+                WriterInterleaves.calls += 1
+                values = record.unpack_from(buffer, offset)
+                if WriterInterleaves.calls == 1:
+                    engine.stop()  # Publishes "idle" after the reader copied "focus"
+                return values
+
+        with mock.patch.object(status_file, "RECORD", WriterInterleaves()), \
+                mock.patch.object(status_file.time, "sleep") as sleep:
+            status = read_status(self.path)
+        self.assertEqual(WriterInterleaves.calls, 2)
+        self.assertEqual(sleep.call_count, 1)
+        self.assertEqual(status["state"], "idle")
+
+
+if __name__ == "__main__":
+    unittest.main()
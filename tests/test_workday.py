@@ -0,0 +1,94 @@
+"""A simulated workday of TimerApp on virtual time, checking the session sequence"""
+import os
+import sys
+import tempfile
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Src"))
+
+from PyQt6.QtWidgets import QApplication
+
+from clock import VirtualClock
+from session_engine import (IDLE, FOCUS, BREAK, SNOOZE, START_FOCUS, SNOOZE_BREAK, END_BREAK,
+                            EXPIRE)
+
+
+class WorkdayTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+        # Settings are written under ~/.breakloop; keep them out of the real home
+        cls.home = tempfile.TemporaryDirectory()
+        cls.saved_home = os.environ.get("HOME")
+        os.environ["HOME"] = cls.home.name
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.saved_home is None:
+            os.environ.pop("HOME", None)
+        else:
+            os.environ["HOME"] = cls.saved_home
+        cls.home.cleanup()
+
+    def setUp(self):
+        import main
+
+        self.clock = VirtualClock()
+        self.window = main.TimerApp(clock=self.clock, min_session_seconds=0)
+        self.window.settings['snooze_enabled'] = True
+        for name, value in (("focus_hours", 0), ("focus_minutes", 15), ("focus_seconds", 0),
+                            ("break_hours", 0), ("break_minutes", 3), ("break_seconds", 0)):
+            getattr(self.window, name).setValue(value)
+        self.window.hide()
+        self.transitions = []
+        self.overlay_missing = []
+        self.breaks = 0
+        self.window.engine.subscribe("transition", self.on_transition)
+
+    def tearDown(self):
+        if self.window.engine.state != IDLE:
+            self.window.engine.stop()
+        self.window.break_overlays.hide()
+        self.window.deleteLater()
+        self.app.processEvents()
+
+    def on_transition(self, engine, old_state, new_state, trigger):
+        self.transitions.append((round(self.clock.current), old_state, new_state, trigger))
+        if new_state == BREAK and not self.window.break_overlays.isVisible():
+            self.overlay_missing.append(round(self.clock.current))
+        if old_state == FOCUS and new_state == BREAK:
+            # Snooze the first break, cut the second short, sit out the third
+            self.breaks += 1
+            if self.breaks == 1:
+                self.clock.call_later(10000, lambda: self.window.handle_snooze_request(1))
+            elif self.breaks == 2:
+                self.clock.call_later(60000, self.window.end_break_overlay)
+
+    def run_until(self, seconds):
+        while self.clock.current < seconds:
+            self.assertTrue(self.clock.step(), f"nothing scheduled at {self.clock.current:.0f} s")
+            self.app.processEvents()
+
+    def test_session_sequence(self):
+        self.window.start_focus_session()
+        self.run_until(3600)
+        self.assertEqual(self.transitions, [
+            (0, IDLE, FOCUS, START_FOCUS),
+            (900, FOCUS, BREAK, EXPIRE),
+            (910, BREAK, SNOOZE, SNOOZE_BREAK),
+            (970, SNOOZE, BREAK, EXPIRE),
+            (1150, BREAK, IDLE, EXPIRE),
+            (1153, IDLE, FOCUS, START_FOCUS),  # The next focus session auto-starts after 3 s
+            (2053, FOCUS, BREAK, EXPIRE),
+            (2113, BREAK, FOCUS, END_BREAK),
+            (3013, FOCUS, BREAK, EXPIRE),
+            (3193, BREAK, IDLE, EXPIRE),
+            (3196, IDLE, FOCUS, START_FOCUS),
+        ])
+        self.assertEqual(self.overlay_missing, [])
+        self.assertFalse(self.window.break_overlays.isVisible())
+
+
+if __name__ == "__main__":
+    unittest.main()